@@ -2,15 +2,15 @@ from __future__ import annotations
 
 from typing import Annotated
 
-import hb_data
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import ValidationError
 
 from hoyo_buddy.constants import locale_to_hoyo_lang
-from hoyo_buddy.db.models import GachaHistory, HoyoAccount, JSONFile
+from hoyo_buddy.db.models import GachaHistory, HoyoAccount
 from hoyo_buddy.enums import Game, Locale
 from hoyo_buddy.l10n import BANNER_TYPE_NAMES, translator
 from hoyo_buddy.utils.gacha import calculate_gacha_stats, get_gacha_icon
+from hoyo_buddy.utils.gacha_data import GachaItemIndex
 
 from ..schemas import (
     BannerTypeInfo,
@@ -20,38 +20,13 @@ from ..schemas import (
     GachaParams,
     GachaStatsResponse,
 )
+from ..utils import decode_gacha_cursor, encode_gacha_cursor
 
 router = APIRouter()
 
-GachaData = dict[str, dict[str, str]]
 
-
-def _get_gacha_data_filename(game: Game, lang: str) -> str:
-    if game is Game.GENSHIN:
-        return f"gi_gacha_data_{lang}.json"
-    if game is Game.STARRAIL:
-        return f"hsr_gacha_data_{lang}.json"
-    if game is Game.ZZZ:
-        return f"zzz_gacha_data_{lang}.json"
-    msg = f"Unsupported game: {game}"
-    raise ValueError(msg)
-
-
-async def _load_gacha_data(game: Game, locale: Locale) -> GachaData:
-    lang = locale_to_hoyo_lang(locale)
-    filename = _get_gacha_data_filename(game, lang)
-    data: GachaData = await JSONFile.read(filename, default={})
-
-    if game is Game.GENSHIN:
-        async with hb_data.GIClient() as client:
-            mw_costumes = client.get_mw_costumes()
-            mw_items = client.get_mw_items()
-            for costume in mw_costumes:
-                data[str(costume.id)] = {"name": costume.name, "icon": ""}
-            for item in mw_items:
-                data[str(item.id)] = {"name": item.name, "icon": ""}
-
-    return data
+async def _load_gacha_data(game: Game, locale: Locale) -> GachaItemIndex:
+    return await GachaItemIndex.get(game, locale_to_hoyo_lang(locale))
 
 
 @router.get("/logs", response_model=GachaLogResponse)
@@ -92,33 +67,53 @@ async def get_gacha_logs(
     except ValueError:
         locale_enum = Locale.american_english
 
-    gacha_data = await _load_gacha_data(game, locale_enum)
+    gacha_index = await _load_gacha_data(game, locale_enum)
+    gacha_data = gacha_index.data
 
     base_qs = GachaHistory.filter(
         account_id=params.account_id, banner_type=params.banner_type, rarity__in=params.rarities
     )
 
     if params.name_contains:
-        matching_ids = {
-            int(item_id)
-            for item_id, item in gacha_data.items()
-            if params.name_contains.lower() in item.get("name", "").lower()
-        }
+        matching_ids = gacha_index.search(params.name_contains)
         if not matching_ids:
             return GachaLogResponse(items=[], total=0, next_cursor=None, game=game.value)
         base_qs = base_qs.filter(item_id__in=matching_ids)
 
-    total = await base_qs.count()
+    # Totals are cached until the next import or deletion of the account's gacha histories,
+    # name searches also depend on the language and version of the gacha data
+    filter_key = ":".join(
+        (
+            str(params.banner_type),
+            ",".join(str(rarity) for rarity in sorted(params.rarities)),
+            (
+                f"{locale_to_hoyo_lang(locale_enum)}:{gacha_index.version}:"
+                f"{GachaItemIndex.normalize(params.name_contains)}"
+                if params.name_contains
+                else ""
+            ),
+        )
+    )
+    generation = await GachaHistory.get_stats_generation(params.account_id)
+    total = await GachaHistory.get_cached_total(params.account_id, generation, filter_key)
+    if total is None:
+        total = await base_qs.count()
+        await GachaHistory.set_cached_total(params.account_id, generation, filter_key, total)
 
+    # Keyset pagination on the (account_id, banner_type, rarity, wish_id) index
     qs = base_qs.order_by("-wish_id")
     if params.cursor is not None:
-        qs = qs.filter(wish_id__lt=params.cursor)
+        try:
+            last_wish_id = decode_gacha_cursor(params.cursor)
+        except ValueError as exc:
+            raise HTTPException(status_code=422, detail=str(exc)) from exc
+        qs = qs.filter(wish_id__lt=last_wish_id)
 
     gacha_logs = await qs.limit(params.size + 1)
 
     next_cursor: str | None = None
     if len(gacha_logs) > params.size:
-        next_cursor = str(gacha_logs[params.size - 1].wish_id)
+        next_cursor = encode_gacha_cursor(gacha_logs[params.size - 1].wish_id)
         gacha_logs = gacha_logs[: params.size]
 
     items = [
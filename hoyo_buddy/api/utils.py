@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import base64
+import binascii
 from typing import Any
 
 from cryptography.fernet import Fernet
@@ -20,3 +22,17 @@ def encrypt_string(string: str) -> str:
 
 async def fetch_json_file(filename: str) -> Any:
     return await JSONFile.read(filename)
+
+
+def encode_gacha_cursor(wish_id: int) -> str:
+    """Encode the wish ID of the last gacha log of a page into an opaque cursor."""
+    return base64.urlsafe_b64encode(str(wish_id).encode()).decode().rstrip("=")
+
+
+def decode_gacha_cursor(cursor: str) -> int:
+    """Decode a cursor returned by encode_gacha_cursor, raise ValueError if it's invalid."""
+    try:
+        return int(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, ValueError) as e:
+        msg = f"Invalid cursor {cursor!r}"
+        raise ValueError(msg) from e
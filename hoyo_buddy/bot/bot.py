@@ -24,6 +24,9 @@ from hoyo_buddy.cache import OrjsonSerializer, image_cache
 from hoyo_buddy.commands.configs import COMMANDS
 from hoyo_buddy.commands.leaderboard import LeaderboardCommand
 from hoyo_buddy.constants import (
+    DM_CHANNEL_CACHE_SIZE,
+    DM_CHANNEL_CACHE_TTL,
+    DM_CLOSED_CACHE_TTL,
     GUILD_ID,
     POOL_MAX_WORKERS,
     ZENLESS_DATA_LANGS,
@@ -40,6 +43,7 @@ from hoyo_buddy.draw.card_data import CARD_DATA
 from hoyo_buddy.enums import Game, LeaderboardType
 from hoyo_buddy.exceptions import NoAccountFoundError
 from hoyo_buddy.hoyo.clients.novel_ai import NAIClient
+from hoyo_buddy.hoyo.proxy_pool import proxy_pool
 from hoyo_buddy.l10n import BOT_DATA_PATH, AppCommandTranslator, EnumStr, LocaleStr, translator
 from hoyo_buddy.utils import (
     capture_exception,
@@ -48,8 +52,10 @@ from hoyo_buddy.utils import (
     get_project_version,
     should_ignore_error,
 )
+from hoyo_buddy.utils.gacha import update_banner_data
 from hoyo_buddy.utils.gacha_data import update_gacha_data
 
+from .cache import LRUCache
 from .command_tree import CommandTree
 
 if TYPE_CHECKING:
@@ -129,6 +135,8 @@ class HoyoBuddy(commands.AutoShardedBot):
         )
         self.cache.namespace = "hoyo_buddy"
         self.cache.serializer = OrjsonSerializer()
+        self.dm_channel_cache = LRUCache(maxsize=DM_CHANNEL_CACHE_SIZE)
+        """User ID to DM channel ID, 0 if the user has DMs closed."""
 
         self.user_ids: set[int] = set()
         self.process = psutil.Process()
@@ -223,6 +231,8 @@ class HoyoBuddy(commands.AutoShardedBot):
 
         await self._load_cogs()
         await self.load_extension("jishaku")
+        await self.warm_dm_channel_cache()
+        proxy_pool.start_health_checks()
 
         if self.config.novelai:
             if self.config.nai_token is None or self.config.nai_host_url is None:
@@ -259,19 +269,65 @@ class HoyoBuddy(commands.AutoShardedBot):
     def capture_exception(self, e: Exception) -> None:
         capture_exception(e)
 
+    async def warm_dm_channel_cache(self) -> None:
+        channels = await models.DMChannel.all().limit(DM_CHANNEL_CACHE_SIZE)
+        for channel in channels:
+            await self.dm_channel_cache.set(channel.user_id, channel.id, DM_CHANNEL_CACHE_TTL)
+        logger.info(f"Warmed DM channel cache with {len(channels)} channels")
+
+    async def _set_dm_channel_id(self, user_id: int, channel_id: int, *, ttl: int) -> None:
+        await self.dm_channel_cache.set(user_id, channel_id, ttl)
+        await self.cache.set(f"dm_channel:{user_id}", channel_id, ttl=ttl)
+
+    async def _get_dm_channel_id(self, user_id: int) -> int | None:
+        """Get the DM channel ID of the user from the caches or the database.
+
+        Returns 0 if the user has DMs closed and None if the channel is unknown.
+        """
+        channel_id: int | None = await self.dm_channel_cache.get(user_id)
+        if channel_id is not None:
+            return channel_id
+
+        key = f"dm_channel:{user_id}"
+        channel_id = await self.cache.get(key)
+        if channel_id is not None:
+            ttl = DM_CLOSED_CACHE_TTL if channel_id == 0 else DM_CHANNEL_CACHE_TTL
+            if isinstance(self.cache, aiocache.RedisCache):
+                # Expire together with the Redis entry instead of restarting its TTL
+                remaining: int = await self.cache.raw("ttl", self.cache._build_key(key))
+                if remaining > 0:
+                    ttl = min(ttl, remaining)
+
+            await self.dm_channel_cache.set(user_id, channel_id, ttl)
+            return channel_id
+
+        channel = await models.DMChannel.get_or_none(user_id=user_id)
+        if channel is None:
+            return None
+
+        await self._set_dm_channel_id(user_id, channel.id, ttl=DM_CHANNEL_CACHE_TTL)
+        return channel.id
+
     async def dm_user(
         self, user_id: int, *, content: str | None = None, **kwargs
     ) -> tuple[discord.Message | None, bool]:
         logger.debug(f"DMing user {user_id}")
 
         try:
-            channel = await models.DMChannel.get_or_none(user_id=user_id)
-            if channel is None:
+            channel_id = await self._get_dm_channel_id(user_id)
+            if channel_id == 0:
+                # DMs were closed recently
+                return None, False
+
+            if channel_id is None:
                 user = self.get_user(user_id) or await self.fetch_user(user_id)
                 dm_channel = user.dm_channel or await user.create_dm()
                 channel = await models.DMChannel.create(user_id=user_id, id=dm_channel.id)
-            message = await self.get_partial_messageable(channel.id).send(content, **kwargs)
+                channel_id = channel.id
+                await self._set_dm_channel_id(user_id, channel_id, ttl=DM_CHANNEL_CACHE_TTL)
+            message = await self.get_partial_messageable(channel_id).send(content, **kwargs)
         except discord.Forbidden:
+            await self._set_dm_channel_id(user_id, 0, ttl=DM_CLOSED_CACHE_TTL)
             return None, False
         except Exception as e:
             self.capture_exception(e)
@@ -491,6 +547,7 @@ class HoyoBuddy(commands.AutoShardedBot):
                 self.update_zzz_assets(),
                 # Fetch gacha data from official APIs
                 update_gacha_data(self.session),
+                update_banner_data(self.session),
                 # Fetch mi18n files
                 translator.fetch_mi18n_files(),
                 # hb-data
@@ -48,3 +48,37 @@ class LFUCache(aiocache.SimpleMemoryCache):
     async def delete(self, key: Any) -> None:
         await super().delete(key)
         del self._frequency[key]
+
+
+class LRUCache(aiocache.SimpleMemoryCache):
+    def __init__(self, maxsize: int = 1024, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._maxsize = maxsize
+        self._order: OrderedDict[Any, None] = OrderedDict()
+
+    async def _evict(self) -> None:
+        while len(self._order) >= self._maxsize:
+            key_to_evict, _ = self._order.popitem(last=False)
+            await super().delete(key_to_evict)
+
+    async def get(self, key: Any, default: Any = None) -> Any:
+        value = await super().get(key, default)
+        if key in self._order:
+            if value is default:
+                # Expired
+                del self._order[key]
+            else:
+                self._order.move_to_end(key)
+        return value
+
+    async def set(self, key: Any, value: Any, ttl: int = 0) -> None:
+        if key in self._order:
+            self._order.move_to_end(key)
+        else:
+            await self._evict()
+            self._order[key] = None
+        await super().set(key, value, ttl)
+
+    async def delete(self, key: Any) -> None:
+        await super().delete(key)
+        self._order.pop(key, None)
@@ -258,7 +258,15 @@ class Admin(commands.Cog):
             (genshin.Game.ZZZ, zzz_rarity_map),
         ):
             for item_id, rarity in rarity_map.items():
-                await GachaHistory.filter(game=game, item_id=item_id).update(rarity=rarity)
+                wrong_rarity = GachaHistory.filter(game=game, item_id=item_id).exclude(
+                    rarity=rarity
+                )
+                account_ids = await wrong_rarity.distinct().values_list("account_id", flat=True)
+                if not account_ids:
+                    continue
+
+                await wrong_rarity.update(rarity=rarity)
+                await GachaHistory.invalidate_stats(account_ids)
 
         await message.edit(content="Gacha rarities updated successfully.")
 
@@ -1,15 +1,16 @@
 from __future__ import annotations
 
+import csv
 import io
+import itertools
 from typing import TYPE_CHECKING, Any
 
 import hb_data
 import orjson
-import pandas as pd
 
 from hoyo_buddy.bot.error_handler import get_error_embed
-from hoyo_buddy.constants import UIGF_GAME_KEYS
-from hoyo_buddy.db import GachaHistory, get_dyk, get_locale, update_gacha_nums
+from hoyo_buddy.constants import GACHA_IMPORT_CHUNK_SIZE, UIGF_GAME_KEYS
+from hoyo_buddy.db import GachaHistory, GachaHistoryRow, get_dyk, get_locale, update_gacha_nums
 from hoyo_buddy.embeds import DefaultEmbed
 from hoyo_buddy.emojis import LOADING
 from hoyo_buddy.enums import GachaImportSource, Game
@@ -37,12 +38,79 @@ from hoyo_buddy.ui.hoyo.gacha.view import ViewGachaLogView
 from hoyo_buddy.utils import ephemeral
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterable, Sequence
+
     import discord
 
     from hoyo_buddy.db import HoyoAccount
     from hoyo_buddy.types import Interaction
 
 
+def _validate_record(
+    source: GachaImportSource, item: Any, tz_hour: int | None, rarity_map: dict[int, int] | None
+) -> GachaHistoryRow:
+    record: (
+        StarRailStationRecord
+        | ZZZRngMoeRecord
+        | StarDBRecord
+        | UIGFRecord
+        | SRGFRecord
+        | StarwardZZZRecord
+    )
+    if source is GachaImportSource.STAR_DB:
+        if rarity_map is None:
+            msg = "StarDB records need a rarity map"
+            raise ValueError(msg)
+
+        # StarDB records don't have a rarity, they come with the banner type of their list
+        banner_type, item = item
+        record = StarDBRecord(banner_type=banner_type, **item)
+        rarity = rarity_map[record.item_id]
+    else:
+        if source is GachaImportSource.STAR_RAIL_STATION:
+            record = StarRailStationRecord(**item)
+        elif source is GachaImportSource.ZZZ_RNG_MOE:
+            record = ZZZRngMoeRecord(tz_hour=tz_hour, **item)
+        elif source is GachaImportSource.UIGF:
+            record = UIGFRecord(timezone=tz_hour, **item)
+        elif source is GachaImportSource.SRGF:
+            record = SRGFRecord(timezone=tz_hour, **item)
+        elif source is GachaImportSource.STARWARD_ZZZ:
+            record = StarwardZZZRecord(tz_hour=tz_hour, **item)
+        else:
+            msg = f"Unknown gacha import source: {source}"
+            raise ValueError(msg)
+        rarity = record.rarity
+
+    return GachaHistoryRow(
+        wish_id=record.id,
+        rarity=rarity,
+        time=record.time,
+        item_id=record.item_id,
+        banner_type=record.banner_type,
+    )
+
+
+def _validate_chunk(
+    source: GachaImportSource,
+    items: Sequence[Any],
+    tz_hour: int | None,
+    rarity_map: dict[int, int] | None,
+) -> list[GachaHistoryRow]:
+    """Validate a chunk of raw records of an import file.
+
+    Runs in the executor, which is a process pool in production, so it's module-level and only
+    takes picklable arguments.
+
+    Args:
+        source: The source of the import file.
+        items: The raw records, (banner type, record) tuples for StarDB.
+        tz_hour: The timezone of the record times, for the sources that need it.
+        rarity_map: Item ID to rarity map, for StarDB.
+    """
+    return [_validate_record(source, item, tz_hour, rarity_map) for item in items]
+
+
 class GachaCommand:
     @staticmethod
     def _validate_file_ext(file: discord.Attachment, accept_ext: str) -> None:
@@ -79,6 +147,35 @@ class GachaCommand:
 
         return records
 
+    @staticmethod
+    async def _copy_in_chunks(
+        i: Interaction,
+        account: HoyoAccount,
+        items: Iterable[Any],
+        source: GachaImportSource,
+        *,
+        tz_hour: int | None = None,
+        rarity_map: dict[int, int] | None = None,
+    ) -> int:
+        """Copy the records of an import file into the database while they are validated.
+
+        Records are validated in fixed-size chunks in the executor, only one chunk of validated
+        rows is held in memory at a time.
+
+        Returns:
+            The number of gacha histories that were inserted.
+        """
+
+        async def rows() -> AsyncIterator[GachaHistoryRow]:
+            for batch in itertools.batched(items, GACHA_IMPORT_CHUNK_SIZE):
+                chunk = await i.client.loop.run_in_executor(
+                    i.client.executor, _validate_chunk, source, batch, tz_hour, rarity_map
+                )
+                for row in chunk:
+                    yield row
+
+        return await GachaHistory.copy_rows(i.client.pool, account, rows())
+
     @classmethod
     async def _srs_import(
         cls, i: Interaction, *, account: HoyoAccount, file: discord.Attachment
@@ -90,34 +187,10 @@ class GachaCommand:
             raise AccountGameMismatchError(Game.STARRAIL)
 
         bytes_ = await file.read()
-        records_df = await i.client.loop.run_in_executor(
-            i.client.executor, pd.read_csv, io.BytesIO(bytes_)
-        )
-        data = records_df.to_dict(orient="records")
-        records = [
-            StarRailStationRecord(**{str(k): v for k, v in record.items()}) for record in data
-        ]
-        records.sort(key=lambda x: x.id)
-
-        before = await GachaHistory.get_wish_count(account)
-        await GachaHistory.bulk_create(
-            [
-                GachaHistory(
-                    wish_id=record.id,
-                    rarity=record.rarity,
-                    item_id=record.item_id,
-                    banner_type=record.banner_type,
-                    account=account,
-                    time=record.time,
-                    banner_id=None,
-                    game=Game.STARRAIL,
-                )
-                for record in records
-            ]
-        )
-        after = await GachaHistory.get_wish_count(account)
+        # Rows are decoded and parsed lazily as the chunks are validated
+        reader = csv.DictReader(io.TextIOWrapper(io.BytesIO(bytes_), encoding="utf-8-sig"))
 
-        return after - before
+        return await cls._copy_in_chunks(i, account, reader, GachaImportSource.STAR_RAIL_STATION)
 
     @classmethod
     async def _zzz_rng_moe_import(
@@ -147,34 +220,13 @@ class GachaCommand:
             tz_hour = 8
 
         gacha_types = ("1001", "2001", "3001", "5001")
-        records: list[ZZZRngMoeRecord] = []
-        for gacha_type in gacha_types:
-            records.extend(
-                [
-                    ZZZRngMoeRecord(tz_hour=tz_hour, **record)
-                    for record in first_profile["stores"]["0"]["items"][gacha_type]
-                ]
-            )
-        records.sort(key=lambda x: x.id)
-
-        before = await GachaHistory.get_wish_count(account)
-        await GachaHistory.bulk_create(
-            [
-                GachaHistory(
-                    wish_id=record.id,
-                    rarity=record.rarity,
-                    item_id=record.item_id,
-                    banner_type=record.banner_type,
-                    account=account,
-                    time=record.time,
-                    banner_id=None,
-                    game=Game.ZZZ,
-                )
-                for record in records
-            ]
+        items = itertools.chain.from_iterable(
+            first_profile["stores"]["0"]["items"][gacha_type] for gacha_type in gacha_types
+        )
+
+        return await cls._copy_in_chunks(
+            i, account, items, GachaImportSource.ZZZ_RNG_MOE, tz_hour=tz_hour
         )
-        after = await GachaHistory.get_wish_count(account)
-        return after - before
 
     @classmethod
     async def _stardb_import(
@@ -187,16 +239,38 @@ class GachaCommand:
         data = await i.client.loop.run_in_executor(i.client.executor, orjson.loads, bytes_)
 
         if account.game is Game.STARRAIL:
-            return await cls._stardb_hsr_import(account, data)
+            return await cls._stardb_hsr_import(i, account, data)
         if account.game is Game.GENSHIN:
-            return await cls._stardb_gi_import(account, data)
+            return await cls._stardb_gi_import(i, account, data)
         if account.game is Game.ZZZ:
-            return await cls._stardb_zzz_import(account, data)
+            return await cls._stardb_zzz_import(i, account, data)
 
         raise FeatureNotImplementedError(game=account.game)
 
-    @staticmethod
-    async def _stardb_hsr_import(account: HoyoAccount, data: dict[str, Any]) -> int:
+    @classmethod
+    async def _stardb_copy(
+        cls,
+        i: Interaction,
+        account: HoyoAccount,
+        game_data: dict[str, list[dict[str, Any]]],
+        *,
+        banner_types: dict[str, int],
+        rarity_map: dict[int, int],
+    ) -> int:
+        items = (
+            (banner_type, item)
+            for banner_name, banner_type in banner_types.items()
+            for item in game_data[banner_name]
+        )
+
+        return await cls._copy_in_chunks(
+            i, account, items, GachaImportSource.STAR_DB, rarity_map=rarity_map
+        )
+
+    @classmethod
+    async def _stardb_hsr_import(
+        cls, i: Interaction, account: HoyoAccount, data: dict[str, Any]
+    ) -> int:
         if account.game is not Game.STARRAIL:
             raise AccountGameMismatchError(Game.STARRAIL)
 
@@ -210,44 +284,22 @@ class GachaCommand:
                 "character": 11,
                 "light_cone": 12,
             }
-            records: list[StarDBRecord] = []
-            for banner_name, banner_type in banner_types.items():
-                records.extend(
-                    [
-                        StarDBRecord(banner_type=banner_type, **record)
-                        for record in hsr_data[banner_name]
-                    ]
-                )
-            records.sort(key=lambda x: x.id)
 
-            if records:
+            if any(hsr_data[banner_name] for banner_name in banner_types):
                 # Fetch rarity map with Yatta API
                 async with YattaAPIClient() as client:
                     rarity_map = await client.fetch_rarity_map()
 
-                before = await GachaHistory.get_wish_count(account)
-                await GachaHistory.bulk_create(
-                    [
-                        GachaHistory(
-                            wish_id=record.id,
-                            rarity=rarity_map[record.item_id],
-                            item_id=record.item_id,
-                            banner_type=record.banner_type,
-                            account=account,
-                            time=record.time,
-                            banner_id=None,
-                            game=Game.STARRAIL,
-                        )
-                        for record in records
-                    ]
+                return await cls._stardb_copy(
+                    i, account, hsr_data, banner_types=banner_types, rarity_map=rarity_map
                 )
-                after = await GachaHistory.get_wish_count(account)
-                return after - before
 
         return 0
 
-    @staticmethod
-    async def _stardb_gi_import(account: HoyoAccount, data: dict[str, Any]) -> int:
+    @classmethod
+    async def _stardb_gi_import(
+        cls, i: Interaction, account: HoyoAccount, data: dict[str, Any]
+    ) -> int:
         if account.game is not Game.GENSHIN:
             raise AccountGameMismatchError(Game.GENSHIN)
 
@@ -263,44 +315,21 @@ class GachaCommand:
                 "chronicled": 500,
             }
 
-            records: list[StarDBRecord] = []
-            for banner_name, banner_type in banner_types.items():
-                records.extend(
-                    [
-                        StarDBRecord(banner_type=banner_type, **record)
-                        for record in gi_data[banner_name]
-                    ]
-                )
-            records.sort(key=lambda x: x.id)
-
-            if records:
+            if any(gi_data[banner_name] for banner_name in banner_types):
                 # Fetch rarity map with Ambr API
                 async with AmbrAPIClient() as client:
                     rarity_map = await client.fetch_rarity_map()
 
-                before = await GachaHistory.get_wish_count(account)
-                await GachaHistory.bulk_create(
-                    [
-                        GachaHistory(
-                            wish_id=record.id,
-                            rarity=rarity_map[record.item_id],
-                            item_id=record.item_id,
-                            banner_type=record.banner_type,
-                            account=account,
-                            time=record.time,
-                            banner_id=None,
-                            game=Game.GENSHIN,
-                        )
-                        for record in records
-                    ]
+                return await cls._stardb_copy(
+                    i, account, gi_data, banner_types=banner_types, rarity_map=rarity_map
                 )
-                after = await GachaHistory.get_wish_count(account)
-                return after - before
 
         return 0
 
-    @staticmethod
-    async def _stardb_zzz_import(account: HoyoAccount, data: dict[str, Any]) -> int:
+    @classmethod
+    async def _stardb_zzz_import(
+        cls, i: Interaction, account: HoyoAccount, data: dict[str, Any]
+    ) -> int:
         if account.game is not Game.ZZZ:
             raise AccountGameMismatchError(Game.ZZZ)
 
@@ -314,38 +343,14 @@ class GachaCommand:
                 "w_engine": 3,
                 "bangboo": 5,
             }
-            records: list[StarDBRecord] = []
-            for banner_name, banner_type in banner_types.items():
-                records.extend(
-                    [
-                        StarDBRecord(banner_type=banner_type, **record)
-                        for record in zzz_data[banner_name]
-                    ]
-                )
-            records.sort(key=lambda x: x.id)
 
-            if records:
+            if any(zzz_data[banner_name] for banner_name in banner_types):
                 async with hb_data.ZZZClient() as client:
                     rarity_map = client.get_rarity_map()
 
-                before = await GachaHistory.get_wish_count(account)
-                await GachaHistory.bulk_create(
-                    [
-                        GachaHistory(
-                            wish_id=record.id,
-                            rarity=rarity_map[record.item_id],
-                            item_id=record.item_id,
-                            banner_type=record.banner_type,
-                            account=account,
-                            time=record.time,
-                            banner_id=None,
-                            game=Game.ZZZ,
-                        )
-                        for record in records
-                    ]
+                return await cls._stardb_copy(
+                    i, account, zzz_data, banner_types=banner_types, rarity_map=rarity_map
                 )
-                after = await GachaHistory.get_wish_count(account)
-                return after - before
 
         return 0
 
@@ -377,7 +382,6 @@ class GachaCommand:
 
             tz_hour = game_data["timezone"]
             records = await cls._uigf_fill_item_rarities(game_data["list"], account.game)
-            records = [UIGFRecord(timezone=tz_hour, **record) for record in records]
         else:
             uid = str(data["info"]["uid"])
             if uid != str(account.uid):
@@ -406,28 +410,13 @@ class GachaCommand:
                     record["item_id"] = item_id
 
             records = await cls._uigf_fill_item_rarities(data["list"], account.game)
-            records = [UIGFRecord(timezone=tz_hour, **record) for record in records]
-
-        records.sort(key=lambda x: x.id)
-
-        before = await GachaHistory.get_wish_count(account)
-        await GachaHistory.bulk_create(
-            [
-                GachaHistory(
-                    wish_id=record.id,
-                    rarity=record.rarity,
-                    item_id=record.item_id,
-                    banner_type=record.banner_type,
-                    account=account,
-                    time=record.time,
-                    banner_id=None,
-                    game=account.game,
-                )
-                for record in records
-            ]
+
+        # Don't keep the histories of the other accounts of the export around during the import
+        del data
+
+        return await cls._copy_in_chunks(
+            i, account, records, GachaImportSource.UIGF, tz_hour=tz_hour
         )
-        after = await GachaHistory.get_wish_count(account)
-        return after - before
 
     @classmethod
     async def _srgf_import(
@@ -447,27 +436,10 @@ class GachaCommand:
             raise UIDMismatchError(uid)
 
         tz_hour = data["info"]["region_time_zone"]
-        records = [SRGFRecord(timezone=tz_hour, **record) for record in data["list"]]
-        records.sort(key=lambda x: x.id)
-
-        before = await GachaHistory.get_wish_count(account)
-        await GachaHistory.bulk_create(
-            [
-                GachaHistory(
-                    wish_id=record.id,
-                    rarity=record.rarity,
-                    item_id=record.item_id,
-                    banner_type=record.banner_type,
-                    account=account,
-                    time=record.time,
-                    banner_id=None,
-                    game=Game.STARRAIL,
-                )
-                for record in records
-            ]
+
+        return await cls._copy_in_chunks(
+            i, account, data["list"], GachaImportSource.SRGF, tz_hour=tz_hour
         )
-        after = await GachaHistory.get_wish_count(account)
-        return after - before
 
     @classmethod
     async def _starward_zzz_import(
@@ -487,28 +459,10 @@ class GachaCommand:
             raise UIDMismatchError(uid)
 
         tz_hour = data["info"]["region_time_zone"]
-        records = [StarwardZZZRecord(tz_hour=tz_hour, **record) for record in data["list"]]
-        records.sort(key=lambda x: x.id)
-
-        before = await GachaHistory.get_wish_count(account)
-        await GachaHistory.bulk_create(
-            [
-                GachaHistory(
-                    wish_id=record.id,
-                    rarity=record.rarity,
-                    item_id=record.item_id,
-                    banner_type=record.banner_type,
-                    account=account,
-                    time=record.time,
-                    banner_id=None,
-                    game=Game.ZZZ,
-                )
-                for record in records
-            ]
-        )
-        after = await GachaHistory.get_wish_count(account)
 
-        return after - before
+        return await cls._copy_in_chunks(
+            i, account, data["list"], GachaImportSource.STARWARD_ZZZ, tz_hour=tz_hour
+        )
 
     @staticmethod
     async def run_import(i: Interaction, account: HoyoAccount) -> None:
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Literal
 
-from hoyo_buddy.db import Leaderboard, get_locale, update_lb_ranks
+from hoyo_buddy.db import Leaderboard, get_locale
 from hoyo_buddy.embeds import DefaultEmbed
 from hoyo_buddy.enums import Game, LeaderboardType
 from hoyo_buddy.exceptions import FeatureNotImplementedError, LeaderboardNotFoundError
@@ -16,7 +16,6 @@ if TYPE_CHECKING:
     from collections.abc import Sequence
 
     import genshin
-    from asyncpg import Pool
 
     from hoyo_buddy.db import HoyoAccount
     from hoyo_buddy.types import Interaction
@@ -161,7 +160,7 @@ class LeaderboardCommand:
         account = account or await i.client.get_account(
             i.user.id, self.get_games_by_lb_type(lb_type)
         )
-        await self.update_lb_data(pool=i.client.pool, lb_type=lb_type, account=account)
+        await self.update_lb_data(lb_type=lb_type, account=account)
 
         lb_size = await self.get_lb_size(lb_type, account.game)
         embed = (
@@ -170,7 +169,9 @@ class LeaderboardCommand:
             .set_footer(text=LocaleStr(key="akasha_total_entries", total=lb_size))
         )
 
-        you = await Leaderboard.get_or_none(type=lb_type, game=account.game, uid=account.uid)
+        you = await Leaderboard.get_with_rank(
+            type_=lb_type, game=account.game, uid=account.uid, order=LB_ORDERS[lb_type]
+        )
 
         if lb_type in {LeaderboardType.ABYSS_DMG, LeaderboardType.THEATER_DMG}:
             async with AmbrAPIClient(locale) as api:
@@ -194,7 +195,7 @@ class LeaderboardCommand:
         await view.start(i)
 
     async def update_lb_data(
-        self, *, pool: Pool, lb_type: LeaderboardType, account: HoyoAccount
+        self, *, lb_type: LeaderboardType, account: HoyoAccount
     ) -> dict[str, str] | None:
         if lb_type in {LeaderboardType.ABYSS_DMG, LeaderboardType.THEATER_DMG}:
             character = await self.fetch_character_by_lb_type(account, lb_type)
@@ -219,4 +220,3 @@ class LeaderboardCommand:
                 username=account.username,
                 extra_info=extra_info,
             )
-            await update_lb_ranks(pool, game=account.game, type_=lb_type, order=LB_ORDERS[lb_type])
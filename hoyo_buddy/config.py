@@ -31,6 +31,7 @@ class Config(BaseSettings):
     db_url: str
     fernet_key: str
     proxy: str | None = None
+    proxies: dict[str, int] = {}  # Proxy URLs mapped to their weights, replaces proxy when set
     residential_proxy: str | None = None
     redis_url: str | None = None
     user_agent: str | None = "HoyoBuddy/1.0"
@@ -42,6 +43,7 @@ class Config(BaseSettings):
     # Ports
     api_port: int | None = None
     prometheus_port: int | None = None
+    scheduler_prometheus_port: int | None = None
 
     # Command-line arguments
     search: bool = False
@@ -1249,7 +1249,38 @@ SLEEP_TIMES: dict[SleepTime, float] = {
 }
 
 CONCURRENT_TASK_NUM = 250
+NOTES_CHECK_CONCURRENCY = 8  # Accounts whose notes are checked at the same time
+DM_CHANNEL_CACHE_SIZE = 100_000
+DM_CHANNEL_CACHE_TTL = 60 * 60 * 24  # 1 day
+DM_CLOSED_CACHE_TTL = (
+    60 * 60 * 6
+)  # 6 hours, users that have DMs closed aren't DMed again until then
+EMBED_SENDER_BATCH_SIZE = 500
+# Users DMed at the same time, with the "dm" sleep this stays below Discord's global rate limit
+# (50 requests/s), discord.py handles per-route and global 429s on top of that
+EMBED_SENDER_CONCURRENCY = 4
+WEB_EVENTS_NOTIFY_CONCURRENCY = 4
+COOKIE_REFRESH_CACHE_SIZE = 10_000
+# How long tokens fetched with an stoken are reused by other games and auto tasks of the same
+# HoYoLAB account, in seconds
+COOKIE_REFRESH_TTLS: dict[str, int] = {
+    "cookie_token": 60 * 60 * 3,
+    "cookie_token_v2": 60 * 60 * 6,
+    "ltoken_v2": 60 * 60 * 6,
+}
+BANNER_INDEX_TTL = 60 * 60  # Seconds before banner catalogues are reloaded from the database
+GACHA_STATS_CACHE_TTL = 60 * 60 * 24  # Cached per-banner stats of an account, dropped on writes
+GACHA_STATS_DISTRIBUTION_TTL = 60 * 10  # Seconds before global gacha rankings are reloaded
+GACHA_IMPORT_CHUNK_SIZE = 1000  # Records validated at a time while an import file is copied
+GACHA_DATA_VERSION_CHECK_INTERVAL = 60  # Seconds between checks for updated gacha item data
+PROXY_FAILURE_THRESHOLD = 5  # Consecutive failures before a proxy is ejected
+PROXY_CIRCUIT_COOLDOWN = 30  # Seconds, doubled each time the proxy fails again after coming back
+PROXY_CIRCUIT_MAX_COOLDOWN = 60 * 10
+PROXY_HEALTH_CHECK_INTERVAL = 30
+PROXY_HEALTH_CHECK_URL = "https://bbs-api-os.hoyolab.com/"
 MAX_PROXY_ERROR_NUM = 8
+AUTO_TASK_BATCH_SIZE = 500
+AUTO_TASK_LEASE_TTL = 300  # 5 minutes, renewed every third of it while a batch is processed
 
 AUTO_TASK_FEATURE_KEYS: dict[AutoTaskType, str] = {
     "redeem": "auto_redeem_toggle.label",
@@ -1,15 +1,19 @@
+from .auto_task_batch import AutoTaskBatch
+from .auto_task_outcome import AutoTaskOutcome
+from .auto_task_run import AutoTaskRun
 from .card_settings import CardSettings
 from .challenge_history import ChallengeHistory
 from .custom_image import CustomImage
 from .discord_embed import DiscordEmbed
 from .dm_channel import DMChannel
 from .farm_notify import FarmNotify
-from .gacha_history import GachaHistory
+from .gacha_history import GachaHistory, GachaHistoryRow
 from .gacha_stats import GachaStats
 from .hoyo_account import HoyoAccount
 from .json_file import JSONFile
 from .leaderboard import Leaderboard
 from .notes_notify import NotesNotify
 from .notif_settings import AccountNotifSettings
+from .redeem_code import RedeemCode
 from .settings import Settings
 from .user import User
@@ -0,0 +1,114 @@
+# pyright: reportAssignmentType=false
+from __future__ import annotations
+
+import datetime
+from typing import TYPE_CHECKING, Self
+
+import orjson
+from tortoise import Tortoise, fields
+from tortoise.expressions import F
+
+from hoyo_buddy.utils import get_now
+
+from .base import BaseModel
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from tortoise.backends.base.client import BaseDBAsyncClient
+
+    from hoyo_buddy.types import AutoTaskType
+
+    from .auto_task_run import AutoTaskRun
+
+CLAIM_BATCH_SQL = """
+UPDATE autotaskbatch
+SET lease_owner = $2, lease_expires_at = NOW() + make_interval(secs => $3)
+WHERE id = (
+  SELECT id
+  FROM autotaskbatch
+  WHERE task_type = $1
+    AND (lease_expires_at IS NULL OR lease_expires_at < NOW())
+  ORDER BY id
+  LIMIT 1
+  FOR UPDATE SKIP LOCKED
+)
+RETURNING id, run_id, account_ids;
+"""
+
+
+class AutoTaskBatch(BaseModel):
+    """A batch of accounts waiting to be processed by an auto task.
+
+    Batches are shared by all scheduler processes, a process leases a batch before processing it
+    and deletes it once every account in it is done. Leases that are not renewed expire so other
+    processes can pick the batch up.
+    """
+
+    id = fields.IntField(pk=True, generated=True)
+    task_type: AutoTaskType = fields.CharField(max_length=20, index=True)
+    run: fields.ForeignKeyRelation[AutoTaskRun] = fields.ForeignKeyField(
+        "models.AutoTaskRun", related_name="batches", on_delete=fields.CASCADE
+    )
+    run_id: int
+    account_ids: fields.Field[list[int]] = fields.JSONField()
+    lease_owner: fields.Field[str | None] = fields.CharField(max_length=64, null=True)
+    lease_expires_at: fields.Field[datetime.datetime | None] = fields.DatetimeField(null=True)
+
+    class Meta:
+        ordering = ("id",)
+
+    @classmethod
+    async def enqueue(
+        cls,
+        run: AutoTaskRun,
+        account_ids: Sequence[int],
+        *,
+        batch_size: int,
+        using_db: BaseDBAsyncClient | None = None,
+    ) -> int:
+        """Split the account IDs into batches and insert them, return the number of batches."""
+        batches = [
+            cls(task_type=run.task_type, run=run, account_ids=list(account_ids[i : i + batch_size]))
+            for i in range(0, len(account_ids), batch_size)
+        ]
+        if batches:
+            await cls.bulk_create(batches, using_db=using_db)
+        return len(batches)
+
+    @classmethod
+    async def claim(cls, task_type: AutoTaskType, *, owner: str, ttl: int) -> Self | None:
+        """Lease the oldest batch that is not leased by any live process."""
+        conn = Tortoise.get_connection("default")
+        _, rows = await conn.execute_query(CLAIM_BATCH_SQL, [task_type, owner, ttl])
+        if not rows:
+            return None
+
+        row = rows[0]
+        account_ids = row["account_ids"]
+        if isinstance(account_ids, str):
+            account_ids = orjson.loads(account_ids)
+
+        return cls(
+            id=row["id"],
+            task_type=task_type,
+            run_id=row["run_id"],
+            account_ids=account_ids,
+            lease_owner=owner,
+        )
+
+    async def renew_lease(self, *, ttl: int) -> bool:
+        """Extend the lease, return False if the lease has been taken over by another process."""
+        updated = await AutoTaskBatch.filter(id=self.id, lease_owner=self.lease_owner).update(
+            lease_expires_at=get_now() + datetime.timedelta(seconds=ttl)
+        )
+        return updated > 0
+
+    async def complete(self) -> None:
+        from .auto_task_run import AutoTaskRun  # noqa: PLC0415
+
+        deleted = await AutoTaskBatch.filter(id=self.id, lease_owner=self.lease_owner).delete()
+        if deleted:
+            await AutoTaskRun.filter(id=self.run_id).update(
+                completed_batches=F("completed_batches") + 1
+            )
@@ -0,0 +1,54 @@
+# pyright: reportAssignmentType=false
+from __future__ import annotations
+
+import datetime
+from typing import TYPE_CHECKING
+
+from tortoise import fields
+from tortoise.exceptions import IntegrityError
+
+from hoyo_buddy.utils import get_now
+
+from .base import BaseModel
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from .auto_task_run import AutoTaskRun
+
+OUTCOME_RETENTION = datetime.timedelta(days=7)
+
+
+class AutoTaskOutcome(BaseModel):
+    """The final result of an account in an auto task run."""
+
+    run: fields.ForeignKeyRelation[AutoTaskRun] = fields.ForeignKeyField(
+        "models.AutoTaskRun", related_name="outcomes", on_delete=fields.CASCADE
+    )
+    run_id: int
+    account_id = fields.IntField()
+    success = fields.BooleanField()
+    created_at = fields.DatetimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ("run", "account_id")
+
+    @classmethod
+    async def record(cls, *, run_id: int, account_id: int, success: bool) -> None:
+        try:
+            await cls.create(run_id=run_id, account_id=account_id, success=success)
+        except IntegrityError:
+            # Already recorded by a previous lease of the same batch
+            return
+
+    @classmethod
+    async def get_done_account_ids(cls, run_id: int, account_ids: Sequence[int]) -> set[int]:
+        done = await cls.filter(run_id=run_id, account_id__in=account_ids).values_list(
+            "account_id", flat=True
+        )
+        return set(done)
+
+    @classmethod
+    async def prune(cls) -> None:
+        """Delete outcomes older than the retention period, run records are kept as history."""
+        await cls.filter(created_at__lt=get_now() - OUTCOME_RETENTION).delete()
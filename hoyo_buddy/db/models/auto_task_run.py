@@ -0,0 +1,69 @@
+# pyright: reportAssignmentType=false
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from tortoise import fields
+
+from hoyo_buddy.utils import get_now
+
+from .base import BaseModel
+
+if TYPE_CHECKING:
+    import datetime
+
+    from hoyo_buddy.types import AutoTaskType
+
+    from .auto_task_batch import AutoTaskBatch
+    from .auto_task_outcome import AutoTaskOutcome
+
+
+class AutoTaskRun(BaseModel):
+    """A single run of an auto task, shared by all scheduler processes that take part in it."""
+
+    id = fields.IntField(pk=True, generated=True)
+    task_type: AutoTaskType = fields.CharField(max_length=20, index=True)
+    games: fields.Field[list[str] | None] = fields.JSONField(null=True)
+    """Games the accounts of the run were filtered by, None for all games."""
+    region: fields.Field[str | None] = fields.CharField(max_length=16, null=True)
+    """Region the accounts of the run were filtered by."""
+    started_at = fields.DatetimeField(auto_now_add=True)
+    finished_at: fields.Field[datetime.datetime | None] = fields.DatetimeField(null=True)
+
+    total = fields.IntField(default=0)
+    """Number of accounts enqueued for this run."""
+    batch_count = fields.IntField(default=0)
+    completed_batches = fields.IntField(default=0)
+    """Progress cursor, batches are claimed in ID order."""
+    success_count = fields.IntField(default=0)
+    error_count = fields.IntField(default=0)
+
+    batches: fields.ReverseRelation[AutoTaskBatch]
+    outcomes: fields.ReverseRelation[AutoTaskOutcome]
+
+    class Meta:
+        ordering = ("-id",)
+
+    @property
+    def duration(self) -> datetime.timedelta | None:
+        if self.finished_at is None:
+            return None
+        return self.finished_at - self.started_at
+
+    async def finish(self) -> bool:
+        """Mark the run as finished if no batches are left, return whether it was marked."""
+        from .auto_task_batch import AutoTaskBatch  # noqa: PLC0415
+        from .auto_task_outcome import AutoTaskOutcome  # noqa: PLC0415
+
+        if await AutoTaskBatch.filter(run_id=self.id).exists():
+            return False
+
+        self.finished_at = get_now()
+        self.success_count = await AutoTaskOutcome.filter(run_id=self.id, success=True).count()
+        self.error_count = await AutoTaskOutcome.filter(run_id=self.id, success=False).count()
+        updated = await AutoTaskRun.filter(id=self.id, finished_at__isnull=True).update(
+            finished_at=self.finished_at,
+            success_count=self.success_count,
+            error_count=self.error_count,
+        )
+        return updated > 0
@@ -7,4 +7,4 @@ from .base import BaseModel
 
 class DMChannel(BaseModel):
     id = fields.BigIntField(pk=True, generated=False)
-    user_id = fields.BigIntField()
+    user_id = fields.BigIntField(index=True)
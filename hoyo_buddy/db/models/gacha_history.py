@@ -1,17 +1,75 @@
 # pyright: reportAssignmentType=false
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Self
+from collections.abc import AsyncIterable
+from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple, Self
 
+import aiocache
 from tortoise import fields
 
+from hoyo_buddy.cache import OrjsonSerializer
+from hoyo_buddy.config import CONFIG
+from hoyo_buddy.constants import GACHA_STATS_CACHE_TTL
 from hoyo_buddy.enums import Game
 
 from .base import BaseModel
 
 if TYPE_CHECKING:
+    import datetime
+    from collections.abc import AsyncIterator, Iterable
+
+    import asyncpg
+
     from .hoyo_account import HoyoAccount
 
+STAGING_TABLE = "gachahistory_staging"
+STAGING_COLUMNS = (
+    "wish_id",
+    "rarity",
+    "time",
+    "item_id",
+    "banner_type",
+    "banner_id",
+    "game",
+    "account_id",
+)
+
+CREATE_STAGING_SQL = """
+CREATE TEMP TABLE gachahistory_staging (
+  wish_id BIGINT,
+  rarity INT,
+  time TIMESTAMPTZ,
+  item_id INT,
+  banner_type INT,
+  banner_id INT,
+  game VARCHAR(32),
+  account_id INT
+) ON COMMIT DROP;
+"""
+
+# New rows keep the default num and num_since_last until update_gacha_nums numbers them
+MERGE_STAGING_SQL = """
+WITH inserted AS (
+  INSERT INTO gachahistory (wish_id, rarity, time, item_id, banner_type, banner_id, game, account_id)
+  SELECT wish_id, rarity, time, item_id, banner_type, banner_id, game, account_id
+  FROM gachahistory_staging
+  ON CONFLICT DO NOTHING
+  RETURNING 1
+)
+SELECT COUNT(*) FROM inserted;
+"""
+
+
+class GachaHistoryRow(NamedTuple):
+    """A gacha history to be copied into the database by GachaHistory.copy_rows."""
+
+    wish_id: int
+    rarity: int
+    time: datetime.datetime
+    item_id: int
+    banner_type: int
+    banner_id: int | None = None
+
 
 class GachaHistory(BaseModel):
     id = fields.IntField(pk=True, generated=True)
@@ -32,18 +90,145 @@ class GachaHistory(BaseModel):
     )
     account_id: fields.Field[int]
 
+    _stats_cache: ClassVar[aiocache.BaseCache | None] = (
+        aiocache.Cache.from_url(CONFIG.redis_url) if CONFIG.redis_url else None
+    )
+    """Stats of each banner type and totals of the API's gacha log filters per account and
+    generation, shared by the bot and the API.
+
+    Stats aren't cached without Redis, a per-process cache wouldn't see the invalidations of the
+    other processes.
+    """
+    if _stats_cache is not None:
+        _stats_cache.namespace = "gacha_stats"
+        _stats_cache.serializer = OrjsonSerializer()
+
     class Meta:
         unique_together = ("wish_id", "game", "account", "banner_type")
+        indexes = (("account", "banner_type", "rarity", "wish_id"),)
         ordering = ("-wish_id",)
 
-    @classmethod
-    async def get_wish_count(cls, account: HoyoAccount) -> int:
-        return await cls.filter(account=account).count()
-
     @classmethod
     async def bulk_create(cls, records: list[Self], **kwargs) -> None:
         for record in records:
             if record.game is Game.ZZZ:
                 record.rarity += 1
 
-        return await super().bulk_create(records, batch_size=5000, ignore_conflicts=True, **kwargs)
+        await super().bulk_create(records, batch_size=5000, ignore_conflicts=True, **kwargs)
+        await cls.invalidate_stats({record.account_id for record in records})
+
+    @classmethod
+    async def copy_rows(
+        cls,
+        pool: asyncpg.Pool,
+        account: HoyoAccount,
+        rows: Iterable[GachaHistoryRow] | AsyncIterable[GachaHistoryRow],
+    ) -> int:
+        """Insert the gacha histories of an account with COPY, skipping the existing ones.
+
+        Rows are streamed into a temporary staging table and merged into the gacha histories,
+        which avoids building ORM objects for large imports. An async iterable is consumed while
+        the COPY is in progress, so rows can be produced in chunks.
+
+        Returns:
+            The number of gacha histories that were inserted.
+        """
+        rarity_offset = 1 if account.game is Game.ZZZ else 0
+        game = account.game.value
+
+        def to_record(row: GachaHistoryRow) -> tuple[Any, ...]:
+            return (
+                row.wish_id,
+                row.rarity + rarity_offset,
+                row.time,
+                row.item_id,
+                row.banner_type,
+                row.banner_id,
+                game,
+                account.id,
+            )
+
+        async def to_records(
+            rows: AsyncIterable[GachaHistoryRow],
+        ) -> AsyncIterator[tuple[Any, ...]]:
+            async for row in rows:
+                yield to_record(row)
+
+        if isinstance(rows, AsyncIterable):
+            records = to_records(rows)
+        else:
+            records = [to_record(row) for row in rows]
+            if not records:
+                return 0
+
+        async with pool.acquire() as conn, conn.transaction():
+            await conn.execute(CREATE_STAGING_SQL)
+            await conn.copy_records_to_table(
+                STAGING_TABLE, records=records, columns=STAGING_COLUMNS
+            )
+            inserted: int = await conn.fetchval(MERGE_STAGING_SQL)
+
+        if inserted:
+            await cls.invalidate_stats((account.id,))
+        return inserted
+
+    @classmethod
+    async def get_stats_generation(cls, account_id: int) -> int:
+        """Get the generation of the account's cached stats, read before computing stats to cache.
+
+        Cached stats and totals are keyed by the generation, so values computed from gacha
+        histories that changed in the meantime are never read.
+        """
+        if cls._stats_cache is None:
+            return 0
+        return await cls._stats_cache.get(f"{account_id}:gen", 0)
+
+    @classmethod
+    async def get_cached_stats(
+        cls, account_id: int, generation: int, banner_type: int
+    ) -> dict[str, Any] | None:
+        if cls._stats_cache is None:
+            return None
+        return await cls._stats_cache.get(f"{account_id}:{generation}:stats:{banner_type}")
+
+    @classmethod
+    async def set_cached_stats(
+        cls, account_id: int, generation: int, banner_type: int, stats: dict[str, Any]
+    ) -> None:
+        if cls._stats_cache is None:
+            return
+
+        await cls._stats_cache.set(
+            f"{account_id}:{generation}:stats:{banner_type}", stats, ttl=GACHA_STATS_CACHE_TTL
+        )
+
+    @classmethod
+    async def get_cached_total(
+        cls, account_id: int, generation: int, filter_key: str
+    ) -> int | None:
+        if cls._stats_cache is None:
+            return None
+        return await cls._stats_cache.get(f"{account_id}:{generation}:total:{filter_key}")
+
+    @classmethod
+    async def set_cached_total(
+        cls, account_id: int, generation: int, filter_key: str, total: int
+    ) -> None:
+        if cls._stats_cache is None:
+            return
+
+        await cls._stats_cache.set(
+            f"{account_id}:{generation}:total:{filter_key}", total, ttl=GACHA_STATS_CACHE_TTL
+        )
+
+    @classmethod
+    async def invalidate_stats(cls, account_ids: Iterable[int]) -> None:
+        """Invalidate cached stats and totals of the accounts when their gacha histories change.
+
+        The stale values are left to expire.
+        """
+        if cls._stats_cache is None:
+            return
+
+        for account_id in account_ids:
+            await cls._stats_cache.increment(f"{account_id}:gen")
@@ -1,11 +1,14 @@
 # pyright: reportAssignmentType=false
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import bisect
+import time
+from typing import TYPE_CHECKING, ClassVar, Literal, NamedTuple
 
 from tortoise import fields
 from tortoise.exceptions import IntegrityError
 
+from hoyo_buddy.constants import GACHA_STATS_DISTRIBUTION_TTL
 from hoyo_buddy.enums import Game
 
 from .base import BaseModel
@@ -13,6 +16,22 @@ from .base import BaseModel
 if TYPE_CHECKING:
     from .hoyo_account import HoyoAccount
 
+RANKED_STATS = (
+    "lifetime_pulls",
+    "avg_5star_pulls",
+    "avg_4star_pulls",
+    "avg_3star_pulls",
+    "win_rate",
+)
+
+
+class GachaStatsDistribution(NamedTuple):
+    expires_at: float
+    account_values: dict[int, dict[str, float]]
+    """Account ID to the account's value of each ranked stat."""
+    values: dict[str, list[float]]
+    """Sorted values of every account for each ranked stat."""
+
 
 class GachaStats(BaseModel):
     account_id = fields.IntField()
@@ -25,9 +44,63 @@ class GachaStats(BaseModel):
     game = fields.CharEnumField(Game, max_length=32)
     banner_type = fields.IntField()
 
+    _distributions: ClassVar[dict[tuple[Game, int], GachaStatsDistribution]] = {}
+
     class Meta:
         unique_together = ("account_id", "banner_type", "game")
 
+    @classmethod
+    async def _get_distribution(cls, game: Game, banner_type: int) -> GachaStatsDistribution:
+        distribution = cls._distributions.get((game, banner_type))
+        if distribution is not None and time.monotonic() < distribution.expires_at:
+            return distribution
+
+        rows = await cls.filter(game=game, banner_type=banner_type).values_list(
+            "account_id", *RANKED_STATS
+        )
+        distribution = GachaStatsDistribution(
+            expires_at=time.monotonic() + GACHA_STATS_DISTRIBUTION_TTL,
+            account_values={row[0]: dict(zip(RANKED_STATS, row[1:], strict=True)) for row in rows},
+            values={stat: sorted(row[i] for row in rows) for i, stat in enumerate(RANKED_STATS, 1)},
+        )
+        cls._distributions[game, banner_type] = distribution
+        return distribution
+
+    @classmethod
+    async def get_rank(
+        cls,
+        *,
+        account_id: int,
+        game: Game,
+        banner_type: int,
+        stat: str,
+        value: float,
+        order: Literal["ASC", "DESC"],
+    ) -> tuple[int, int]:
+        """Get the rank of a stat value among all accounts and the number of accounts.
+
+        Ranks come from a periodically reloaded snapshot of every account's stats, accounts with
+        the same value share the same rank.
+        """
+        distribution = await cls._get_distribution(game, banner_type)
+        values = distribution.values[stat]
+
+        # Replace the account's value in the snapshot with its current one
+        account_values = distribution.account_values.setdefault(account_id, {})
+        old_value = account_values.get(stat)
+        if old_value != value:
+            if old_value is not None:
+                values.pop(bisect.bisect_left(values, old_value))
+            bisect.insort(values, value)
+            account_values[stat] = value
+
+        total = len(values)
+        if order == "ASC":
+            ahead = bisect.bisect_left(values, value)
+        else:
+            ahead = len(values) - bisect.bisect_right(values, value)
+        return ahead + 1, total
+
     @classmethod
     async def create_or_update(
         cls,
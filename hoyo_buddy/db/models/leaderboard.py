@@ -1,9 +1,10 @@
 # pyright: reportAssignmentType=false
 
-from typing import Any
+from typing import Any, Literal, Self
 
 from tortoise import fields
 from tortoise.exceptions import IntegrityError
+from tortoise.expressions import Q
 
 from hoyo_buddy.enums import Game, LeaderboardType
 
@@ -15,12 +16,56 @@ class Leaderboard(BaseModel):
     game = fields.CharEnumField(Game, max_length=32)
     value = fields.FloatField()
     uid = fields.BigIntField()
-    rank = fields.IntField()
     username = fields.CharField(max_length=32)
     extra_info: fields.Field[dict[str, Any]] = fields.JSONField(default={}, null=True)
 
+    rank: int
+    """Position in the leaderboard, computed from the value index when the entry is fetched."""
+
     class Meta:
         unique_together = ("type", "game", "uid")
+        indexes = (("type", "game", "value"),)
+
+    @staticmethod
+    def _get_orderings(order: Literal["ASC", "DESC"]) -> tuple[str, str]:
+        # Entries with the same value are ranked by UID
+        return ("-value" if order == "DESC" else "value", "uid")
+
+    @classmethod
+    async def get_page(
+        cls,
+        *,
+        type_: LeaderboardType,
+        game: Game,
+        order: Literal["ASC", "DESC"],
+        page: int,
+        per_page: int = 10,
+    ) -> list[Self]:
+        offset = page * per_page
+        lbs = (
+            await cls.filter(type=type_, game=game)
+            .order_by(*cls._get_orderings(order))
+            .offset(offset)
+            .limit(per_page)
+        )
+        for i, lb in enumerate(lbs, start=offset + 1):
+            lb.rank = i
+        return lbs
+
+    @classmethod
+    async def get_with_rank(
+        cls, *, type_: LeaderboardType, game: Game, uid: int, order: Literal["ASC", "DESC"]
+    ) -> Self | None:
+        lb = await cls.get_or_none(type=type_, game=game, uid=uid)
+        if lb is None:
+            return None
+
+        ahead = Q(value__gt=lb.value) if order == "DESC" else Q(value__lt=lb.value)
+        lb.rank = (
+            await cls.filter(ahead | Q(value=lb.value, uid__lt=uid), type=type_, game=game).count()
+            + 1
+        )
+        return lb
 
     @classmethod
     async def update_or_create(
@@ -42,7 +87,6 @@ class Leaderboard(BaseModel):
                 uid=uid,
                 value=value,
                 username=username,
-                rank=0,
                 extra_info=extra_info,
             )
         except IntegrityError:
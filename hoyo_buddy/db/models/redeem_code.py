@@ -0,0 +1,107 @@
+# pyright: reportAssignmentType=false
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, ClassVar
+
+import orjson
+from tortoise import Tortoise, fields
+
+from hoyo_buddy.enums import Game, RedeemCodeStatus
+
+from .base import BaseModel
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+ADD_LOCKED_SERVER_SQL = """
+INSERT INTO redeemcode (game, code, status, locked_servers, updated_at)
+VALUES ($1, $2, $3, $4::jsonb, NOW())
+ON CONFLICT (game, code) DO UPDATE
+SET locked_servers = redeemcode.locked_servers || $4::jsonb, updated_at = NOW()
+WHERE NOT redeemcode.locked_servers @> $4::jsonb;
+"""
+
+# Codes that no longer need to be remembered per account once they can't be redeemed by anyone,
+# $2 is uppercase while redeemed codes are stored as they were entered
+PRUNE_REDEEMED_CODE_SQL = """
+UPDATE hoyoaccount SET redeemed_codes = (
+    SELECT COALESCE(jsonb_agg(code ORDER BY i), '[]'::jsonb)
+    FROM jsonb_array_elements_text(redeemed_codes) WITH ORDINALITY AS t(code, i)
+    WHERE UPPER(code) <> $2
+)
+WHERE game = $1 AND EXISTS (
+    SELECT 1 FROM jsonb_array_elements_text(redeemed_codes) AS code WHERE UPPER(code) = $2
+);
+"""
+
+
+class RedeemCode(BaseModel):
+    """Status of a redemption code learned from redeem attempts, shared by all accounts."""
+
+    game = fields.CharEnumField(Game, max_length=32)
+    code = fields.CharField(max_length=32)
+    status = fields.CharEnumField(RedeemCodeStatus, max_length=16, default=RedeemCodeStatus.VALID)
+    locked_servers: fields.Field[list[str]] = fields.JSONField(default=[])
+    """Servers where the code is region-limited."""
+    updated_at = fields.DatetimeField(auto_now=True)
+
+    _cache: ClassVar[dict[tuple[Game, str], RedeemCode]] = {}
+
+    class Meta:
+        unique_together = ("game", "code")
+
+    @property
+    def is_redeemable(self) -> bool:
+        return self.status is RedeemCodeStatus.VALID
+
+    @classmethod
+    async def preload(cls, game_codes: Mapping[Game, Sequence[str]]) -> None:
+        """Refresh the in-process cache with the statuses learned by any process."""
+        for game, codes in game_codes.items():
+            records = await cls.filter(game=game, code__in=[code.upper() for code in codes])
+            for record in records:
+                cls._cache[game, record.code] = record
+
+    @classmethod
+    async def get_cached(cls, game: Game, code: str) -> RedeemCode | None:
+        key = (game, code.upper())
+        if key in cls._cache:
+            return cls._cache[key]
+
+        record = await cls.get_or_none(game=game, code=key[1])
+        if record is not None:
+            cls._cache[key] = record
+        return record
+
+    @classmethod
+    async def set_status(cls, game: Game, code: str, status: RedeemCodeStatus) -> None:
+        code = code.upper()
+        cached = cls._cache.get((game, code))
+        if cached is not None and cached.status is status:
+            return
+
+        record, created = await cls.get_or_create(game=game, code=code, defaults={"status": status})
+        changed = created or record.status is not status
+        if not created and changed:
+            record.status = status
+            await record.save(update_fields=("status", "updated_at"))
+        cls._cache[game, code] = record
+
+        if changed and status is not RedeemCodeStatus.VALID:
+            await Tortoise.get_connection("default").execute_query(
+                PRUNE_REDEEMED_CODE_SQL, [game.value, code]
+            )
+
+    @classmethod
+    async def add_locked_server(cls, game: Game, code: str, server: str) -> None:
+        code = code.upper()
+        cached = cls._cache.get((game, code))
+        if cached is not None:
+            if server in cached.locked_servers:
+                return
+            cached.locked_servers.append(server)
+
+        await Tortoise.get_connection("default").execute_query(
+            ADD_LOCKED_SERVER_SQL,
+            [game.value, code, RedeemCodeStatus.VALID.value, orjson.dumps([server]).decode()],
+        )
@@ -1,7 +1,7 @@
 # pyright: reportAssignmentType=false
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING
 
 from loguru import logger
 from tortoise.exceptions import IntegrityError
@@ -27,7 +27,6 @@ if TYPE_CHECKING:
     import asyncpg
     import genshin
 
-    from hoyo_buddy.enums import LeaderboardType
     from hoyo_buddy.types import Interaction
 
 __all__ = (
@@ -39,7 +38,6 @@ __all__ = (
     "get_locale",
     "get_num_since_last",
     "update_gacha_nums",
-    "update_lb_ranks",
 )
 
 
@@ -109,7 +107,8 @@ UPDATE gachahistory w
 SET num = r.new_num
 FROM ranked_wishes r
 WHERE w.wish_id = r.wish_id
-  AND w.account_id = $1;
+  AND w.account_id = $1
+  AND w.num IS DISTINCT FROM r.new_num;
 """
 
 UPDATE_NUM_SINCE_LAST_SQL = """
@@ -135,43 +134,93 @@ WHERE gachahistory.wish_id = pw.wish_id
   AND gachahistory.account_id = $1;
 """
 
+# The last numbered wish of each banner and how many wishes precede it (itself included).
+# New rows are inserted with num = 1, so the wish with the highest num is the last one that was
+# numbered before the import, ties are broken by the earliest wish for banners that had one wish.
+GET_NUM_ANCHORS_SQL = """
+WITH anchors AS (
+  SELECT DISTINCT ON (banner_type) banner_type, wish_id, num
+  FROM gachahistory
+  WHERE account_id = $1
+  ORDER BY banner_type, num DESC, wish_id
+)
+SELECT a.banner_type, a.wish_id, a.num, COUNT(*) AS position
+FROM anchors a
+JOIN gachahistory g
+  ON g.account_id = $1 AND g.banner_type = a.banner_type AND g.wish_id <= a.wish_id
+GROUP BY a.banner_type, a.wish_id, a.num;
+"""
 
-async def update_gacha_nums(pool: asyncpg.Pool, *, account: models.HoyoAccount) -> None:
-    """Update the num and num_since_last fields of the gacha histories."""
-    async with pool.acquire() as conn:
-        await conn.execute(UPDATE_NUM_SQL, account.id)
-        await conn.execute(UPDATE_NUM_SINCE_LAST_SQL, account.id)
-
+UPDATE_NUM_AFTER_SQL = """
+WITH ranked_wishes AS (
+  SELECT
+    wish_id,
+    $4 + ROW_NUMBER() OVER (ORDER BY wish_id) AS new_num
+  FROM gachahistory
+  WHERE account_id = $1 AND banner_type = $2 AND wish_id > $3
+)
+UPDATE gachahistory w
+SET num = r.new_num
+FROM ranked_wishes r
+WHERE w.wish_id = r.wish_id
+  AND w.account_id = $1
+  AND w.banner_type = $2;
+"""
 
-UPDATE_LB_RANK_SQL = """
-WITH ranked_leaderboard AS (
+UPDATE_NUM_SINCE_LAST_AFTER_SQL = """
+WITH prior_wishes AS (
+  SELECT rarity, MAX(num) AS prev_num
+  FROM gachahistory
+  WHERE account_id = $1 AND banner_type = $2 AND wish_id <= $3
+  GROUP BY rarity
+),
+previous_wishes AS (
   SELECT
-    uid,
-    type,
-    game,
-    value,
-    ROW_NUMBER() OVER (
-      PARTITION BY type, game
-      ORDER BY value {order}
-    ) AS new_rank
-  FROM Leaderboard
-  WHERE game = $1 AND type = $2
+    w.wish_id,
+    w.num,
+    COALESCE(LAG(w.num) OVER (PARTITION BY w.rarity ORDER BY w.wish_id), p.prev_num) AS prev_num
+  FROM gachahistory w
+  LEFT JOIN prior_wishes p ON p.rarity = w.rarity
+  WHERE w.account_id = $1 AND w.banner_type = $2 AND w.wish_id > $3
 )
-UPDATE Leaderboard l
-SET rank = r.new_rank
-FROM ranked_leaderboard r
-WHERE l.uid = r.uid
-  AND l.type = r.type
-  AND l.game = r.game;
+UPDATE gachahistory
+SET num_since_last =
+  CASE
+    WHEN pw.prev_num IS NULL THEN pw.num
+    ELSE pw.num - pw.prev_num
+  END
+FROM previous_wishes pw
+WHERE gachahistory.wish_id = pw.wish_id
+  AND gachahistory.account_id = $1
+  AND gachahistory.banner_type = $2;
 """
 
 
-async def update_lb_ranks(
-    pool: asyncpg.Pool, *, game: Game, type_: LeaderboardType, order: Literal["ASC", "DESC"]
+async def update_gacha_nums(
+    pool: asyncpg.Pool, *, account: models.HoyoAccount, full: bool = False
 ) -> None:
-    """Update the ranks of the leaderboards."""
+    """Update the num and num_since_last fields of the gacha histories.
+
+    Only the wishes after the last numbered wish of each banner are renumbered, unless some wishes
+    were inserted before it, in which case the whole history of the account is recomputed.
+
+    Args:
+        pool: The database connection pool.
+        account: The account whose gacha histories were imported.
+        full: Whether to always recompute the whole history.
+    """
     async with pool.acquire() as conn:
-        await conn.execute(UPDATE_LB_RANK_SQL.format(order=order), game, type_)
+        anchors = [] if full else await conn.fetch(GET_NUM_ANCHORS_SQL, account.id)
+        if full or any(anchor["position"] != anchor["num"] for anchor in anchors):
+            logger.debug(f"Recomputing all gacha nums of account {account.id}")
+            await conn.execute(UPDATE_NUM_SQL, account.id)
+            await conn.execute(UPDATE_NUM_SINCE_LAST_SQL, account.id)
+        else:
+            for anchor in anchors:
+                args = (account.id, anchor["banner_type"], anchor["wish_id"])
+                await conn.execute(UPDATE_NUM_AFTER_SQL, *args, anchor["num"])
+                await conn.execute(UPDATE_NUM_SINCE_LAST_AFTER_SQL, *args)
+    await models.GachaHistory.invalidate_stats((account.id,))
 
 
 def draw_locale(locale: Locale, account: models.HoyoAccount) -> Locale:
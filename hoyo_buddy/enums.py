@@ -173,6 +173,13 @@ class LeaderboardType(StrEnum):
     THEATER_DMG = "theater_dmg_lb_title"
 
 
+class RedeemCodeStatus(StrEnum):
+    VALID = "valid"
+    EXPIRED = "expired"
+    INVALID = "invalid"
+    MAX_USES = "max_uses"
+
+
 class OpenGameLabel(StrEnum):
     DEFAULT = "open_game_label"
     CLOUD = "open_game_cloud_label"
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 from collections import defaultdict
 from typing import TYPE_CHECKING, ClassVar, Literal
 
@@ -10,7 +11,6 @@ from seria.utils import create_bullet_list
 
 from hoyo_buddy.bot.error_handler import get_error_embed
 from hoyo_buddy.constants import (
-    CONCURRENT_TASK_NUM,
     HB_GAME_TO_GPY_GAME,
     MAX_PROXY_ERROR_NUM,
     MIMO_AUTO_DRAW_SUPPORT_GAMES,
@@ -39,21 +39,42 @@ if TYPE_CHECKING:
 
 
 class AutoMimoMixin(AutoTaskMixin):
-    _mimo_game_data: ClassVar[dict[Game, tuple[int, int]]]
+    _mimo_game_data: ClassVar[dict[Game, asyncio.Task[tuple[int, int]]]]
     _down_games: ClassVar[set[Game]]
     _error_counts: ClassVar[defaultdict[int, int]]
 
     @classmethod
-    async def _get_mimo_game_data(cls, client: genshin.Client, game: Game) -> tuple[int, int]:
+    async def _fetch_mimo_game_data(cls, client: genshin.Client, game: Game) -> tuple[int, int]:
         try:
-            game_id, version_id = await client._get_mimo_game_data(HB_GAME_TO_GPY_GAME[game])
+            return await client._get_mimo_game_data(HB_GAME_TO_GPY_GAME[game])
         except ValueError:
             logger.warning(f"Failed to get mimo game data for {game}")
             cls._down_games.add(game)
             raise
 
-        cls._mimo_game_data[game] = (game_id, version_id)
-        return game_id, version_id
+    @classmethod
+    async def _get_mimo_game_data(cls, client: genshin.Client, game: Game) -> tuple[int, int]:
+        """Get the mimo game and version IDs of a game.
+
+        The IDs are the same for every account, so they are fetched once per run and workers
+        that ask for them while the request is in flight wait for the same request. When it
+        fails, the first worker to notice retries with its own client and the others wait for
+        that retry instead of sending their own requests.
+        """
+        task = cls._mimo_game_data.get(game)
+        if task is not None:
+            try:
+                return await asyncio.shield(task)
+            except Exception:
+                # Fetched with another account's client, the error might not apply to this one,
+                # so retry unless another worker already is
+                retry = cls._mimo_game_data.get(game)
+                if retry is not None and retry is not task:
+                    return await asyncio.shield(retry)
+
+        task = asyncio.create_task(cls._fetch_mimo_game_data(client, game))
+        cls._mimo_game_data[game] = task
+        return await asyncio.shield(task)
 
     @classmethod
     async def _auto_mimo_task(
@@ -65,6 +86,8 @@ class AutoMimoMixin(AutoTaskMixin):
 
             if account.game in cls._down_games:
                 logger.debug(f"Skipping account {account} because {account.game} is down")
+                with error_handler():
+                    await cls.record_outcome(account, success=True, skipped=True)
                 queue.task_done()
                 continue
 
@@ -72,20 +95,22 @@ class AutoMimoMixin(AutoTaskMixin):
 
             notif_task_type: AutoTaskType | None = None
             try:
-                account.client.use_proxy = True
-                if task_type == "task":
-                    notif_task_type = "mimo_task"
-                    embed = await cls._complete_mimo_tasks(account)
-                    last_time_attr = "last_mimo_task_time"
-                elif task_type == "buy":
-                    notif_task_type = "mimo_buy"
-                    last_time_attr = "last_mimo_buy_time"
-                    embed = await cls._buy_mimo_valuables(account)
-                elif task_type == "draw":
-                    notif_task_type = "mimo_draw"
-                    last_time_attr = "last_mimo_draw_time"
-                    embed = await cls._draw_lottery(account)
+                with cls.track_account():
+                    account.client.use_proxy = True
+                    if task_type == "task":
+                        notif_task_type = "mimo_task"
+                        embed = await cls._complete_mimo_tasks(account)
+                        last_time_attr = "last_mimo_task_time"
+                    elif task_type == "buy":
+                        notif_task_type = "mimo_buy"
+                        last_time_attr = "last_mimo_buy_time"
+                        embed = await cls._buy_mimo_valuables(account)
+                    elif task_type == "draw":
+                        notif_task_type = "mimo_draw"
+                        last_time_attr = "last_mimo_draw_time"
+                        embed = await cls._draw_lottery(account)
             except Exception as e:
+                cls.record_error(e)
                 with error_handler():
                     if (
                         cls._error_counts[account.id] >= MAX_PROXY_ERROR_NUM
@@ -100,6 +125,7 @@ class AutoMimoMixin(AutoTaskMixin):
                             account_id=account.id,
                             task_type=notif_task_type,
                         )
+                        await cls.record_outcome(account, success=False)
                     else:
                         cls._error_counts[account.id] += 1
                         capture_exception(e)
@@ -111,6 +137,7 @@ class AutoMimoMixin(AutoTaskMixin):
                 )
                 setattr(account, last_time_attr, get_now())
                 await account.save(update_fields=(last_time_attr,))
+                await cls.record_outcome(account, success=True)
 
                 if embed is not None:
                     embed.set_footer(text=LocaleStr(key="mimo_auto_task_embed_footer"))
@@ -134,12 +161,10 @@ class AutoMimoMixin(AutoTaskMixin):
             client = account.client
             client.set_lang(locale)
 
-            game_id, version_id = cls._mimo_game_data.get(account.game, (None, None))
-            if game_id is None or version_id is None:
-                try:
-                    game_id, version_id = await cls._get_mimo_game_data(client, account.game)
-                except ValueError:
-                    return None
+            try:
+                game_id, version_id = await cls._get_mimo_game_data(client, account.game)
+            except ValueError:
+                return None
 
             result = await client.finish_and_claim_mimo_tasks(
                 game_id=game_id, version_id=version_id
@@ -184,12 +209,10 @@ class AutoMimoMixin(AutoTaskMixin):
             client = account.client
             client.set_lang(locale)
 
-            game_id, version_id = cls._mimo_game_data.get(account.game, (None, None))
-            if game_id is None or version_id is None:
-                try:
-                    game_id, version_id = await cls._get_mimo_game_data(client, account.game)
-                except ValueError:
-                    return None
+            try:
+                game_id, version_id = await cls._get_mimo_game_data(client, account.game)
+            except ValueError:
+                return None
 
             bought = await client.buy_mimo_valuables(game_id=game_id, version_id=version_id)
 
@@ -241,12 +264,10 @@ class AutoMimoMixin(AutoTaskMixin):
             client = account.client
             client.set_lang(locale)
 
-            game_id, version_id = cls._mimo_game_data.get(account.game, (None, None))
-            if game_id is None or version_id is None:
-                try:
-                    game_id, version_id = await cls._get_mimo_game_data(client, account.game)
-                except ValueError:
-                    return None
+            try:
+                game_id, version_id = await cls._get_mimo_game_data(client, account.game)
+            except ValueError:
+                return None
 
             info = await client.get_mimo_lottery_info(game_id=game_id, version_id=version_id)
             count = info.limit_count - info.current_count
@@ -333,23 +354,15 @@ class AutoMimoTask(AutoMimoMixin):
                 cls._error_counts = defaultdict(int)
 
                 # Auto task
-                queue = await cls.build_auto_task_queue(
-                    "mimo_task", games=MIMO_SUPPORT_GAMES, region=genshin.Region.OVERSEAS
+                processed = await cls.run_auto_task(
+                    "mimo_task",
+                    functools.partial(cls._auto_mimo_task, task_type="task"),
+                    games=MIMO_SUPPORT_GAMES,
+                    region=genshin.Region.OVERSEAS,
                 )
-                if queue.empty():
+                if processed == 0:
                     logger.debug(f"Queue is empty for {cls.__name__}")
                     return
-
-                logger.info(f"Starting {cls.__name__} for {queue.qsize()} accounts")
-                tasks = [
-                    asyncio.create_task(cls._auto_mimo_task(queue, task_type="task"))
-                    for _ in range(CONCURRENT_TASK_NUM)
-                ]
-
-                await queue.join()
-                for task in tasks:
-                    task.cancel()
-                await asyncio.gather(*tasks, return_exceptions=True)
             except Exception as e:
                 capture_exception(e)
             else:
@@ -376,23 +389,15 @@ class AutoMimoBuy(AutoMimoMixin):
                 cls._error_counts = defaultdict(int)
 
                 # Auto buy
-                queue = await cls.build_auto_task_queue(
-                    "mimo_buy", games=MIMO_SUPPORT_GAMES, region=genshin.Region.OVERSEAS
+                processed = await cls.run_auto_task(
+                    "mimo_buy",
+                    functools.partial(cls._auto_mimo_task, task_type="buy"),
+                    games=MIMO_SUPPORT_GAMES,
+                    region=genshin.Region.OVERSEAS,
                 )
-                if queue.empty():
+                if processed == 0:
                     logger.debug(f"Queue is empty for {cls.__name__}")
                     return
-
-                logger.info(f"Starting {cls.__name__} for {queue.qsize()} accounts")
-                tasks = [
-                    asyncio.create_task(cls._auto_mimo_task(queue, task_type="buy"))
-                    for _ in range(CONCURRENT_TASK_NUM)
-                ]
-
-                await queue.join()
-                for task in tasks:
-                    task.cancel()
-                await asyncio.gather(*tasks, return_exceptions=True)
             except Exception as e:
                 capture_exception(e)
             else:
@@ -419,23 +424,15 @@ class AutoMimoDraw(AutoMimoMixin):
                 cls._error_counts = defaultdict(int)
 
                 # Auto draw
-                queue = await cls.build_auto_task_queue(
-                    "mimo_draw", games=MIMO_AUTO_DRAW_SUPPORT_GAMES, region=genshin.Region.OVERSEAS
+                processed = await cls.run_auto_task(
+                    "mimo_draw",
+                    functools.partial(cls._auto_mimo_task, task_type="draw"),
+                    games=MIMO_AUTO_DRAW_SUPPORT_GAMES,
+                    region=genshin.Region.OVERSEAS,
                 )
-                if queue.empty():
+                if processed == 0:
                     logger.debug(f"Queue is empty for {cls.__name__}")
                     return
-
-                logger.info(f"Starting {cls.__name__} for {queue.qsize()} accounts")
-                tasks = [
-                    asyncio.create_task(cls._auto_mimo_task(queue, task_type="draw"))
-                    for _ in range(CONCURRENT_TASK_NUM)
-                ]
-
-                await queue.join()
-                for task in tasks:
-                    task.cancel()
-                await asyncio.gather(*tasks, return_exceptions=True)
             except Exception as e:
                 capture_exception(e)
             else:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 from collections import defaultdict
 from typing import TYPE_CHECKING, ClassVar
 
@@ -8,13 +9,8 @@ import genshin
 from loguru import logger
 
 from hoyo_buddy.bot.error_handler import get_error_embed
-from hoyo_buddy.constants import (
-    AUTO_REDEEM_SUPPORT_GAMES,
-    CONCURRENT_TASK_NUM,
-    HB_GAME_TO_GPY_GAME,
-    MAX_PROXY_ERROR_NUM,
-)
-from hoyo_buddy.db.models import DiscordEmbed
+from hoyo_buddy.constants import AUTO_REDEEM_SUPPORT_GAMES, HB_GAME_TO_GPY_GAME, MAX_PROXY_ERROR_NUM
+from hoyo_buddy.db.models import DiscordEmbed, RedeemCode
 from hoyo_buddy.enums import Locale
 from hoyo_buddy.hoyo.auto_tasks.mixin import AutoTaskMixin
 from hoyo_buddy.l10n import LocaleStr
@@ -49,26 +45,19 @@ class AutoRedeem(AutoTaskMixin):
 
                 game_codes = await cls.get_codes(session)
                 logger.debug(f"Game codes: {game_codes}")
-
-                queue = await cls.build_auto_task_queue(
-                    "redeem", games=AUTO_REDEEM_SUPPORT_GAMES, region=genshin.Region.OVERSEAS
+                await RedeemCode.preload(game_codes)
+
+                processed = await cls.run_auto_task(
+                    "redeem",
+                    functools.partial(
+                        cls._redeem_code_task, game_codes=game_codes, skip_redeemed=skip_redeemed
+                    ),
+                    games=AUTO_REDEEM_SUPPORT_GAMES,
+                    region=genshin.Region.OVERSEAS,
                 )
-                if queue.empty():
+                if processed == 0:
                     logger.debug(f"Queue is empty for {cls.__name__}")
                     return
-
-                logger.info(f"Starting {cls.__name__} for {queue.qsize()} accounts")
-                tasks = [
-                    asyncio.create_task(
-                        cls._redeem_code_task(queue, game_codes, skip_redeemed=skip_redeemed)
-                    )
-                    for _ in range(CONCURRENT_TASK_NUM)
-                ]
-
-                await queue.join()
-                for task in tasks:
-                    task.cancel()
-                await asyncio.gather(*tasks, return_exceptions=True)
             except Exception as e:
                 capture_exception(e)
             else:
@@ -106,13 +95,17 @@ class AutoRedeem(AutoTaskMixin):
             codes = game_codes.get(account.game, [])
             if not codes:
                 logger.debug(f"No codes for {account}, game={account.game}, marking task as done")
+                with error_handler():
+                    await cls.record_outcome(account, success=True, skipped=True)
                 queue.task_done()
                 continue
 
             try:
                 await account.fetch_related("user", "user__settings")
-                embed = await cls._redeem_codes(account, codes, skip_redeemed=skip_redeemed)
+                with cls.track_account():
+                    embed = await cls._redeem_codes(account, codes, skip_redeemed=skip_redeemed)
             except Exception as e:
+                cls.record_error(e)
                 with error_handler():
                     if cls._error_counts[account.id] >= MAX_PROXY_ERROR_NUM:
                         locale = account.user.settings.locale or Locale.american_english
@@ -124,6 +117,7 @@ class AutoRedeem(AutoTaskMixin):
                             account_id=account.id,
                             task_type="redeem",
                         )
+                        await cls.record_outcome(account, success=False)
                     else:
                         cls._error_counts[account.id] += 1
                         capture_exception(e)
@@ -132,6 +126,7 @@ class AutoRedeem(AutoTaskMixin):
                 logger.debug(f"Setting last time for {account}, now={get_now()}")
                 account.last_redeem_time = get_now()
                 await account.save(update_fields=("last_redeem_time",))
+                await cls.record_outcome(account, success=True)
 
                 if embed is not None:
                     cls._count += 1
@@ -8,7 +8,7 @@ import genshin
 from loguru import logger
 
 from hoyo_buddy.bot.error_handler import get_error_embed
-from hoyo_buddy.constants import CONCURRENT_TASK_NUM, MAX_PROXY_ERROR_NUM
+from hoyo_buddy.constants import MAX_PROXY_ERROR_NUM
 from hoyo_buddy.db import User
 from hoyo_buddy.db.models import DiscordEmbed
 from hoyo_buddy.enums import Locale
@@ -39,21 +39,12 @@ class DailyCheckin(AutoTaskMixin):
                 cls._count = 0
                 cls._error_counts = defaultdict(int)
 
-                queue = await cls.build_auto_task_queue("checkin", games=[game] if game else None)
-                if queue.empty():
+                processed = await cls.run_auto_task(
+                    "checkin", cls._daily_checkin_task, games=[game] if game else None
+                )
+                if processed == 0:
                     logger.debug(f"Queue is empty for {cls.__name__}, {game=}")
                     return
-
-                logger.info(f"Starting {cls.__name__} for {queue.qsize()} accounts")
-                tasks = [
-                    asyncio.create_task(cls._daily_checkin_task(queue))
-                    for _ in range(CONCURRENT_TASK_NUM)
-                ]
-
-                await queue.join()
-                for task in tasks:
-                    task.cancel()
-                await asyncio.gather(*tasks, return_exceptions=True)
             except Exception as e:
                 capture_exception(e)
             else:
@@ -70,8 +61,10 @@ class DailyCheckin(AutoTaskMixin):
 
             try:
                 await account.fetch_related("user", "user__settings")
-                embed = await cls._daily_checkin(account)
+                with cls.track_account():
+                    embed = await cls._daily_checkin(account)
             except Exception as e:
+                cls.record_error(e)
                 with error_handler():
                     if cls._error_counts[account.id] >= MAX_PROXY_ERROR_NUM:
                         locale = account.user.settings.locale or Locale.american_english
@@ -83,6 +76,7 @@ class DailyCheckin(AutoTaskMixin):
                             account_id=account.id,
                             task_type="checkin",
                         )
+                        await cls.record_outcome(account, success=False)
                     else:
                         cls._error_counts[account.id] += 1
                         capture_exception(e)
@@ -96,6 +90,7 @@ class DailyCheckin(AutoTaskMixin):
                 logger.debug(f"Setting last time for {account}, now={get_now()}")
                 account.last_checkin_time = get_now()
                 await account.save(update_fields=("last_checkin_time",))
+                await cls.record_outcome(account, success=True)
             finally:
                 await sleep("checkin")
                 queue.task_done()
@@ -7,13 +7,19 @@ from typing import TYPE_CHECKING, ClassVar
 import discord
 from loguru import logger
 
-from hoyo_buddy.constants import AUTO_TASK_FEATURE_KEYS
+from hoyo_buddy.constants import (
+    AUTO_TASK_FEATURE_KEYS,
+    EMBED_SENDER_BATCH_SIZE,
+    EMBED_SENDER_CONCURRENCY,
+)
 from hoyo_buddy.db.models import DiscordEmbed, Settings
 from hoyo_buddy.enums import Locale
 from hoyo_buddy.l10n import LocaleStr
 from hoyo_buddy.utils import sleep
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from hoyo_buddy.bot.bot import HoyoBuddy
     from hoyo_buddy.db.models import HoyoAccount
     from hoyo_buddy.types import AutoTaskType
@@ -50,27 +56,54 @@ class EmbedSender:
         ).translate(locale or Locale.american_english)
 
     @classmethod
-    async def _get_locale(cls, user_id: int) -> Locale | None:
-        settings = await Settings.get(user_id=user_id)
-        return Locale(settings.lang) if settings.lang else None
+    async def _get_locales(cls, user_ids: Iterable[int]) -> dict[int, Locale]:
+        settings = await Settings.filter(user_id__in=list(user_ids))
+        return {s.user_id: Locale(s.lang) for s in settings if s.lang}
 
     @classmethod
-    async def _send_embeds(cls, user_id: int, embeds: list[DiscordEmbed]) -> None:
-        for embed in embeds:
-            await embed.fetch_related("account")
+    async def _send_embeds(
+        cls, user_id: int, embeds: list[DiscordEmbed], locale: Locale | None
+    ) -> list[int]:
+        """Send the embeds to the user in order, return the IDs of the ones that can be deleted."""
+        done_ids: list[int] = []
 
+        for i, embed in enumerate(embeds):
             if embed.type == "error":
-                locale = await cls._get_locale(user_id)
                 content = cls._get_error_content(embed.task_type, locale, embed.account)
             else:
                 content = None
 
-            _, errored = await cls._bot.dm_user(
+            message, errored = await cls._bot.dm_user(
                 user_id, embed=discord.Embed.from_dict(embed.data), content=content
             )
             await sleep("dm")
-            if not errored:
-                await DiscordEmbed.filter(id=embed.id).delete()
+            if errored:
+                continue
+
+            if message is None:
+                # The user can't be DMed, the rest of the embeds would be dropped as well
+                done_ids.extend(e.id for e in embeds[i:])
+                break
+            done_ids.append(embed.id)
+
+        return done_ids
+
+    @classmethod
+    async def _send_embeds_task(
+        cls,
+        queue: asyncio.Queue[tuple[int, list[DiscordEmbed]]],
+        locales: dict[int, Locale],
+        done_ids: list[int],
+    ) -> None:
+        while True:
+            user_id, embeds = await queue.get()
+
+            try:
+                done_ids.extend(await cls._send_embeds(user_id, embeds, locales.get(user_id)))
+            except Exception as e:
+                cls._bot.capture_exception(e)
+            finally:
+                queue.task_done()
 
     @classmethod
     async def execute(cls, bot: HoyoBuddy) -> None:
@@ -87,18 +120,42 @@ class EmbedSender:
 
                 logger.info(f"Starting {cls.__name__} for {cnt} embeds")
 
+                # Embeds that failed to send stay in the table, so page by ID instead of
+                # fetching the first page again
+                last_id = 0
                 while True:
-                    embeds = await DiscordEmbed.all().limit(100)
+                    embeds = (
+                        await DiscordEmbed.filter(id__gt=last_id)
+                        .order_by("id")
+                        .limit(EMBED_SENDER_BATCH_SIZE)
+                        .prefetch_related("account")
+                    )
                     if not embeds:
                         logger.debug("No embeds to send for")
                         break
+                    last_id = embeds[-1].id
 
                     # Organize embeds into a dictionary with user_id as key
                     embeds_dict: defaultdict[int, list[DiscordEmbed]] = defaultdict(list)
                     for embed in embeds:
                         embeds_dict[embed.user_id].append(embed)
 
-                    for user_id, user_embeds in embeds_dict.items():
-                        await cls._send_embeds(user_id, user_embeds)
+                    locales = await cls._get_locales(embeds_dict.keys())
+                    queue: asyncio.Queue[tuple[int, list[DiscordEmbed]]] = asyncio.Queue()
+                    for item in embeds_dict.items():
+                        queue.put_nowait(item)
+
+                    done_ids: list[int] = []
+                    tasks = [
+                        asyncio.create_task(cls._send_embeds_task(queue, locales, done_ids))
+                        for _ in range(min(EMBED_SENDER_CONCURRENCY, queue.qsize()))
+                    ]
+                    await queue.join()
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+
+                    if done_ids:
+                        await DiscordEmbed.filter(id__in=done_ids).delete()
             except Exception as e:
                 bot.capture_exception(e)
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
+from collections import defaultdict
 from datetime import timedelta
-from typing import TYPE_CHECKING, TypeVar
+from typing import TYPE_CHECKING, ClassVar
 
-import ambr
 from loguru import logger
 
 from hoyo_buddy.constants import UID_TZ_OFFSET
@@ -16,26 +16,55 @@ from hoyo_buddy.l10n import LocaleStr
 from hoyo_buddy.utils import get_now
 
 if TYPE_CHECKING:
-    from hoyo_buddy.bot import HoyoBuddy
+    import datetime
+    from collections.abc import Iterable
 
+    import ambr
 
-CharacterOrWeapon = TypeVar("CharacterOrWeapon", ambr.Character, ambr.Weapon)
+    from hoyo_buddy.bot import HoyoBuddy
 
 
 class FarmChecker:
+    _item_id_to_name: ClassVar[dict[str, dict[str, str]]] = {}
+    """[locale][item_id] = item_name, shared by the checks of all UID prefixes on the same day."""
+    _item_names_date: ClassVar[datetime.date | None] = None
+
     def __init__(self, bot: HoyoBuddy) -> None:
         self._bot = bot
-        self._item_id_to_name = {}
-        """[locale][item_id] = item_name"""
 
-    async def _notify_user(self, item: CharacterOrWeapon, farm_notify: FarmNotify) -> None:
+    @classmethod
+    async def _load_item_names(cls, locales: Iterable[Locale], item_ids: Iterable[str]) -> None:
+        """Load the item names of the locales, reloading them if one of the items is missing."""
+        today = get_now().date()
+        if cls._item_names_date != today:
+            cls._item_id_to_name = {}
+            cls._item_names_date = today
+
+        item_ids = set(item_ids)
+        for locale in locales:
+            names = cls._item_id_to_name.get(locale.value)
+            if names is not None and item_ids <= names.keys():
+                continue
+
+            async with AmbrAPIClient(locale) as client:
+                characters = await client.fetch_characters()
+                weapons = await client.fetch_weapons()
+            cls._item_id_to_name[locale.value] = {
+                str(item.id): item.name for item in characters + weapons
+            }
+
+    async def _notify_user(
+        self, item: ambr.Character | ambr.Weapon, farm_notify: FarmNotify
+    ) -> bool:
+        """Notify the user that the item is farmable today, return whether the DM errored."""
         locale = farm_notify.account.user.settings.locale or Locale.american_english
 
         embed = DefaultEmbed(
             locale,
             title=LocaleStr(
                 key="farm_check.farmable_today",
-                name=self._item_id_to_name[locale.value][str(item.id)],
+                # Items released after the names were loaded fall back to the farm data's name
+                name=self._item_id_to_name.get(locale.value, {}).get(str(item.id), item.name),
             ),
         )
         embed.set_thumbnail(url=item.icon)
@@ -45,18 +74,10 @@ class FarmChecker:
         _, errored = await self._bot.dm_user(farm_notify.account.user.id, embed=embed)
         if errored:
             await FarmNotify.filter(account=farm_notify.account).update(enabled=False)
-
-    async def _check_and_notify(
-        self, item_id: str, items: list[CharacterOrWeapon], farm_notify: FarmNotify
-    ) -> bool:
-        for item in items:
-            if str(item.id) == item_id:
-                await self._notify_user(item, farm_notify)
-                return True
-        return False
+        return errored
 
     async def execute(self, uid_start: str) -> None:
-        try:  # noqa: PLR1702
+        try:
             logger.info(f"Starting farm check task for uid_start {uid_start}")
 
             farm_notifies = await FarmNotify.filter(enabled=True).all().prefetch_related("account")
@@ -66,43 +87,46 @@ class FarmChecker:
             weekday = (get_now() + timedelta(hours=UID_TZ_OFFSET.get(uid_start, 0))).weekday()
             farm_datas = await FarmDataFetcher.fetch(weekday)
 
+            # Items farmable today, weapon and character IDs don't overlap
+            farmable: dict[str, ambr.Character | ambr.Weapon] = {}
+            for farm_data in farm_datas:
+                for item in (*farm_data.characters, *farm_data.weapons):
+                    farmable.setdefault(str(item.id), item)
+
+            # Item ID to the notifies subscribed to it
+            subscribers: defaultdict[str, list[FarmNotify]] = defaultdict(list)
             for farm_notify in farm_notifies:
                 if not str(farm_notify.account.uid).startswith(uid_start):
                     continue
+                for item_id in set(farm_notify.item_ids):
+                    subscribers[item_id].append(farm_notify)
+
+            # Account ID to the notify and its farmable items, in subscription order
+            matches: dict[int, tuple[FarmNotify, list[ambr.Character | ambr.Weapon]]] = {}
+            for item_id in farmable.keys() & subscribers.keys():
+                for farm_notify in subscribers[item_id]:
+                    matches.setdefault(farm_notify.account.id, (farm_notify, []))[1].append(
+                        farmable[item_id]
+                    )
+            if not matches:
+                return
 
+            for farm_notify, _ in matches.values():
                 await farm_notify.account.fetch_related("user", "user__settings")
-                locale = farm_notify.account.user.settings.locale or Locale.american_english
-                if locale.value not in self._item_id_to_name:
-                    async with AmbrAPIClient(locale) as client:
-                        characters = await client.fetch_characters()
-                        weapons = await client.fetch_weapons()
-                    self._item_id_to_name[locale.value] = {
-                        str(item.id): item.name for item in characters + weapons
-                    }
-
-                notified: set[str] = set()
-
-                for item_id in farm_notify.item_ids:
-                    if item_id in notified:
-                        continue
-
-                    for farm_data in farm_datas:
-                        if len(item_id) == 5:
-                            # weapon
-                            notified_ = await self._check_and_notify(
-                                item_id, farm_data.weapons, farm_notify
-                            )
-                            if notified_:
-                                notified.add(item_id)
-                                break
-
-                        else:
-                            notified_ = await self._check_and_notify(
-                                item_id, farm_data.characters, farm_notify
-                            )
-                            if notified_:
-                                notified.add(item_id)
-                                break
+            await self._load_item_names(
+                {
+                    farm_notify.account.user.settings.locale or Locale.american_english
+                    for farm_notify, _ in matches.values()
+                },
+                {str(item.id) for _, items in matches.values() for item in items},
+            )
+
+            for farm_notify, items in matches.values():
+                order = {item_id: i for i, item_id in enumerate(farm_notify.item_ids)}
+                items.sort(key=lambda item: order[str(item.id)])
+                for item in items:
+                    if await self._notify_user(item, farm_notify):
+                        break
         except Exception as e:
             self._bot.capture_exception(e)
         finally:
@@ -1,40 +1,138 @@
 from __future__ import annotations
 
 import asyncio
+import collections
+import contextlib
 import datetime
-from typing import TYPE_CHECKING
+import math
+import os
+import socket
+from typing import TYPE_CHECKING, Any, ClassVar
 
+import genshin
 import tortoise.timezone
 from loguru import logger
 from tortoise.expressions import Case, Q, When
+from tortoise.transactions import in_transaction
 
 from hoyo_buddy.constants import (
+    AUTO_TASK_BATCH_SIZE,
     AUTO_TASK_INTERVALS,
     AUTO_TASK_LAST_TIME_FIELDS,
+    AUTO_TASK_LEASE_TTL,
     AUTO_TASK_TOGGLE_FIELDS,
+    CONCURRENT_TASK_NUM,
     UTC_8,
 )
 from hoyo_buddy.db import models
 from hoyo_buddy.db.utils import build_account_query
 from hoyo_buddy.enums import Game
+from hoyo_buddy.hoyo.clients.gpy import get_request_proxy
+from hoyo_buddy.scheduler.metrics import Metrics, get_proxy_label
 from hoyo_buddy.utils import get_now
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
-
-    import genshin
+    from collections.abc import Callable, Coroutine, Generator, Sequence
 
     from hoyo_buddy.types import AutoTaskType
 
+LEASE_OWNER = f"{socket.gethostname()}:{os.getpid()}"
+"""Identifies this scheduler process in auto task batch leases."""
+
+
+class AutoTaskQueue(asyncio.Queue["models.HoyoAccount"]):
+    """Queue shared by the workers of an auto task across all the batches leased by the process.
+
+    An account is done once a worker marks it done without putting it back for a retry, and a
+    batch is done once all of its accounts are. Done batches are put in `done_batches`.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.done_batches: asyncio.Queue[models.AutoTaskBatch] = asyncio.Queue()
+        self._room = asyncio.Event()
+        self._room.set()
+
+        self._batches: dict[int, models.AutoTaskBatch] = {}
+        self._pending: dict[int, int] = {}
+        """Batch ID to the number of its accounts that aren't done."""
+        self._account_batches: dict[int, int] = {}
+        """Account ID to the ID of the batch it belongs to."""
+        self._refs: collections.Counter[int] = collections.Counter()
+        """Account ID to the number of times it's in the queue or being processed."""
+        self._current: dict[asyncio.Task[Any], models.HoyoAccount] = {}
+        """Worker task to the account it's processing."""
+
+    def add_batch(
+        self, batch: models.AutoTaskBatch, accounts: Sequence[models.HoyoAccount]
+    ) -> None:
+        accounts = [account for account in accounts if account.id not in self._account_batches]
+        if not accounts:
+            self.done_batches.put_nowait(batch)
+            return
+
+        self._batches[batch.id] = batch
+        self._pending[batch.id] = len(accounts)
+        for account in accounts:
+            self._account_batches[account.id] = batch.id
+            self.put_nowait(account)
+
+        if self.qsize() >= CONCURRENT_TASK_NUM:
+            self._room.clear()
+
+    async def wait_for_room(self) -> None:
+        """Wait until the workers are about to run out of accounts."""
+        await self._room.wait()
+
+    def get_run_id(self, account: models.HoyoAccount) -> int:
+        return self._batches[self._account_batches[account.id]].run_id
+
+    def put_nowait(self, item: models.HoyoAccount) -> None:
+        self._refs[item.id] += 1
+        super().put_nowait(item)
+
+    def get_nowait(self) -> models.HoyoAccount:
+        item = super().get_nowait()
+        if self.qsize() < CONCURRENT_TASK_NUM:
+            self._room.set()
+
+        task = asyncio.current_task()
+        if task is not None:
+            self._current[task] = item
+        return item
+
+    def task_done(self) -> None:
+        super().task_done()
+
+        task = asyncio.current_task()
+        item = self._current.pop(task, None) if task is not None else None
+        if item is None:
+            return
+
+        self._refs[item.id] -= 1
+        if self._refs[item.id] > 0:
+            # Put back for a retry
+            return
+        del self._refs[item.id]
+
+        batch_id = self._account_batches.pop(item.id)
+        self._pending[batch_id] -= 1
+        if self._pending[batch_id] == 0:
+            del self._pending[batch_id]
+            self.done_batches.put_nowait(self._batches.pop(batch_id))
+
 
 class AutoTaskMixin:
+    _task_type: ClassVar[AutoTaskType]
+    _queue: ClassVar[AutoTaskQueue]
+
     @staticmethod
-    async def build_auto_task_queue(
+    def build_auto_task_query(
         task_type: AutoTaskType,
         *,
         games: Sequence[Game] | None = None,
         region: genshin.Region | None = None,
-    ) -> asyncio.Queue[models.HoyoAccount]:
+    ) -> Q:
         games = games or list(Game)
         query = build_account_query(games=games, region=region)
 
@@ -73,6 +171,25 @@ class AutoTaskMixin:
                 Q(cookies__contains="ltmid_v2") & Q(cookies__contains="stoken")
             )
 
+        return query
+
+    @staticmethod
+    def _checked_in_today(account: models.HoyoAccount) -> bool:
+        return (
+            account.last_checkin_time is not None
+            and account.last_checkin_time.astimezone(UTC_8).date() == get_now().date()
+        )
+
+    @classmethod
+    async def get_auto_task_account_ids(
+        cls,
+        task_type: AutoTaskType,
+        *,
+        games: Sequence[Game] | None = None,
+        region: genshin.Region | None = None,
+    ) -> list[int]:
+        query = cls.build_auto_task_query(task_type, games=games, region=region)
+
         # Supporters have priority
         supporter_ids: list[int] = await models.JSONFile.read("supporter_ids.json", default=[])
         logger.debug(f"Supporter IDs: {supporter_ids}")
@@ -82,21 +199,245 @@ class AutoTaskMixin:
             .order_by("-is_supporter", "id")
         )
 
-        queue: asyncio.Queue[models.HoyoAccount] = asyncio.Queue()
+        account_ids: list[int] = []
         cookie_game_pairs: set[tuple[str, Game]] = set()
         async for account in query_set:
             # Don't check-in for accounts with same cookies and game
             # Don't check-in on the same day
             if task_type == "checkin" and (
                 (account.cookies, account.game) in cookie_game_pairs
-                or (
-                    account.last_checkin_time is not None
-                    and account.last_checkin_time.astimezone(UTC_8).date() == get_now().date()
-                )
+                or cls._checked_in_today(account)
             ):
                 continue
 
             cookie_game_pairs.add((account.cookies, account.game))
-            await queue.put(account)
+            account_ids.append(account.id)
+
+        return account_ids
+
+    @classmethod
+    async def _finish_run(cls, run: models.AutoTaskRun) -> None:
+        if not await run.finish():
+            return
+
+        logger.info(
+            f"{run.task_type!r} run {run.id} finished in {run.duration}, total={run.total}, "
+            f"success={run.success_count}, error={run.error_count}"
+        )
+
+    @classmethod
+    async def enqueue_auto_task_batches(
+        cls,
+        task_type: AutoTaskType,
+        *,
+        games: Sequence[Game] | None = None,
+        region: genshin.Region | None = None,
+    ) -> None:
+        """Start a new run and split its accounts into batches, unless a run is already in progress.
+
+        The advisory lock makes sure only one scheduler process builds the batches of a run,
+        the others wait for it and then join the run by claiming batches. Batches outlive the
+        process, so a restarted scheduler resumes an unfinished run instead of starting over.
+        """
+        async with in_transaction() as conn:
+            await conn.execute_query(
+                "SELECT pg_advisory_xact_lock(hashtext($1));", [f"auto_task:{task_type}"]
+            )
+            if await models.AutoTaskBatch.filter(task_type=task_type).using_db(conn).exists():
+                logger.debug(f"Joining in-progress {task_type!r} run")
+                return
+
+            # Runs whose last batch was completed by a process that stopped before finishing them
+            unfinished_runs = await models.AutoTaskRun.filter(
+                task_type=task_type, finished_at__isnull=True
+            )
+            for unfinished_run in unfinished_runs:
+                await cls._finish_run(unfinished_run)
+
+            account_ids = await cls.get_auto_task_account_ids(task_type, games=games, region=region)
+            if not account_ids:
+                return
+
+            run = await models.AutoTaskRun.create(
+                task_type=task_type,
+                games=[game.value for game in games] if games else None,
+                region=region.value if region is not None else None,
+                total=len(account_ids),
+                batch_count=math.ceil(len(account_ids) / AUTO_TASK_BATCH_SIZE),
+                using_db=conn,
+            )
+            await models.AutoTaskBatch.enqueue(
+                run, account_ids, batch_size=AUTO_TASK_BATCH_SIZE, using_db=conn
+            )
+            logger.info(
+                f"Started {task_type!r} run {run.id} with {run.total} accounts in {run.batch_count} batches"
+            )
+
+        await models.AutoTaskOutcome.prune()
+
+    @classmethod
+    async def _get_run_query(cls, task_type: AutoTaskType, run_id: int) -> Q:
+        """Build the account query with the filters the run was started with.
+
+        A process that joins a run may have been called with other filters, batches are always
+        processed with the run's own so its accounts aren't dropped.
+        """
+        run = await models.AutoTaskRun.get(id=run_id)
+        games = [Game(game) for game in run.games] if run.games else None
+        region = genshin.Region(run.region) if run.region is not None else None
+        return cls.build_auto_task_query(task_type, games=games, region=region)
+
+    @classmethod
+    async def _get_batch_accounts(
+        cls, task_type: AutoTaskType, query: Q, batch: models.AutoTaskBatch
+    ) -> list[models.HoyoAccount]:
+        # Skip accounts that already have an outcome in case the batch was partially processed
+        # by a process that stopped, and re-apply the filters for accounts done outside this run
+        done_ids = await models.AutoTaskOutcome.get_done_account_ids(
+            batch.run_id, batch.account_ids
+        )
+        pending_ids = [account_id for account_id in batch.account_ids if account_id not in done_ids]
+        accounts = await models.HoyoAccount.filter(query, id__in=pending_ids)
+        positions = {account_id: i for i, account_id in enumerate(pending_ids)}
+        accounts.sort(key=lambda account: positions[account.id])
+
+        if task_type == "checkin":
+            accounts = [account for account in accounts if not cls._checked_in_today(account)]
+        return accounts
+
+    @classmethod
+    async def record_outcome(
+        cls, account: models.HoyoAccount, *, success: bool, skipped: bool = False
+    ) -> None:
+        """Record the final result of an account in the current run.
+
+        Skipped accounts are counted as successes in the run so its progress adds up.
+        """
+        if Metrics.enabled:
+            status = "skipped" if skipped else "success" if success else "error"
+            Metrics.ACCOUNTS_PROCESSED.labels(cls._task_type, status).inc()
+            Metrics.QUEUE_SIZE.labels(cls._task_type).set(cls._queue.qsize())
+        await models.AutoTaskOutcome.record(
+            run_id=cls._queue.get_run_id(account), account_id=account.id, success=success
+        )
+
+    @classmethod
+    def record_error(cls, e: Exception) -> None:
+        """Count an error raised while processing an account, retried or not.
+
+        Errors of requests are labelled with the proxy the request was actually sent through.
+        """
+        if not Metrics.enabled:
+            return
+
+        proxy = get_proxy_label(get_request_proxy(e))
+        Metrics.ERRORS.labels(cls._task_type, type(e).__name__, proxy).inc()
+
+    @classmethod
+    @contextlib.contextmanager
+    def track_account(cls) -> Generator[None]:
+        """Measure the latency of processing an account and count it as in flight meanwhile."""
+        if not Metrics.enabled:
+            yield
+            return
+
+        with (
+            Metrics.IN_FLIGHT.labels(cls._task_type).track_inprogress(),
+            Metrics.ACCOUNT_LATENCY.labels(cls._task_type).time(),
+        ):
+            yield
+
+    @staticmethod
+    async def _renew_lease_loop(batch: models.AutoTaskBatch) -> None:
+        while True:
+            await asyncio.sleep(AUTO_TASK_LEASE_TTL / 3)
+            if not await batch.renew_lease(ttl=AUTO_TASK_LEASE_TTL):
+                logger.warning(f"Lease of auto task batch {batch.id} was taken over")
+                return
+
+    @staticmethod
+    async def _complete_batches(
+        queue: AutoTaskQueue, renew_tasks: dict[int, asyncio.Task[None]]
+    ) -> None:
+        while True:
+            batch = await queue.done_batches.get()
+            try:
+                renew_task = renew_tasks.pop(batch.id, None)
+                if renew_task is not None:
+                    renew_task.cancel()
+                    with contextlib.suppress(asyncio.CancelledError):
+                        await renew_task
+                await batch.complete()
+            except Exception:
+                # The lease expires and another lease processes what's left of the batch
+                logger.exception(f"Failed to complete auto task batch {batch.id}")
+            finally:
+                queue.done_batches.task_done()
+
+    @classmethod
+    async def run_auto_task(
+        cls,
+        task_type: AutoTaskType,
+        worker: Callable[[asyncio.Queue[models.HoyoAccount]], Coroutine[Any, Any, None]],
+        *,
+        games: Sequence[Game] | None = None,
+        region: genshin.Region | None = None,
+    ) -> int:
+        """Process leased batches of the current run with a pool of workers until none are left.
+
+        The workers are shared by all the batches, a batch is completed as soon as all of its
+        accounts are done.
+
+        Args:
+            task_type: The auto task type.
+            worker: Coroutine function that consumes accounts from the queue.
+            games: The games to filter accounts by.
+            region: The region to filter accounts by.
+
+        Returns:
+            The number of accounts processed by this process.
+        """
+        await cls.enqueue_auto_task_batches(task_type, games=games, region=region)
+        cls._task_type = task_type
+        processed = 0
+        run_queries: dict[int, Q] = {}
+        renew_tasks: dict[int, asyncio.Task[None]] = {}
+
+        queue = cls._queue = AutoTaskQueue()
+        workers = [asyncio.create_task(worker(queue)) for _ in range(CONCURRENT_TASK_NUM)]
+        completer = asyncio.create_task(cls._complete_batches(queue, renew_tasks))
+
+        try:
+            # Lease the next batch as soon as the workers are about to run out of accounts,
+            # rather than waiting for the slowest account of the previous batch
+            while (
+                batch := await models.AutoTaskBatch.claim(
+                    task_type, owner=LEASE_OWNER, ttl=AUTO_TASK_LEASE_TTL
+                )
+            ) is not None:
+                renew_tasks[batch.id] = asyncio.create_task(cls._renew_lease_loop(batch))
+                if batch.run_id not in run_queries:
+                    run_queries[batch.run_id] = await cls._get_run_query(task_type, batch.run_id)
+
+                accounts = await cls._get_batch_accounts(
+                    task_type, run_queries[batch.run_id], batch
+                )
+                logger.info(f"{cls.__name__} leased batch {batch.id} with {len(accounts)} accounts")
+                processed += len(accounts)
+                queue.add_batch(batch, accounts)
+                if Metrics.enabled:
+                    Metrics.QUEUE_SIZE.labels(task_type).set(queue.qsize())
+
+                await queue.wait_for_room()
+
+            await queue.join()
+            await queue.done_batches.join()
+        finally:
+            for task in (*workers, completer, *renew_tasks.values()):
+                task.cancel()
+            await asyncio.gather(*workers, completer, *renew_tasks.values(), return_exceptions=True)
+
+        for run in await models.AutoTaskRun.filter(task_type=task_type, finished_at__isnull=True):
+            await cls._finish_run(run)
 
-        return queue
+        return processed
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import asyncio
 import datetime
+import heapq
+import io
 from collections import defaultdict
 from typing import TYPE_CHECKING, ClassVar, TypeAlias
 
@@ -9,8 +11,10 @@ import discord
 import genshin
 from genshin.models import HonkaiNotes, StarRailNote, VideoStoreState, ZZZNotes
 from genshin.models import Notes as GenshinNotes
+from loguru import logger
 
 from hoyo_buddy.bot.error_handler import get_error_embed
+from hoyo_buddy.constants import NOTES_CHECK_CONCURRENCY
 from hoyo_buddy.db import NotesNotify, draw_locale
 from hoyo_buddy.draw.main_funcs import draw_gi_notes_card, draw_hsr_notes_card, draw_zzz_notes_card
 from hoyo_buddy.embeds import DefaultEmbed
@@ -37,6 +41,7 @@ if TYPE_CHECKING:
     from genshin.models import HSREvent
 
     from hoyo_buddy.bot import HoyoBuddy
+    from hoyo_buddy.db import HoyoAccount
     from hoyo_buddy.embeds import ErrorEmbed
 
 Notes: TypeAlias = GenshinNotes | HonkaiNotes | StarRailNote | ZZZNotes
@@ -46,6 +51,15 @@ class NotesChecker:
     _lock: ClassVar[asyncio.Lock] = asyncio.Lock()
     _bot: ClassVar[HoyoBuddy]
 
+    _due_heap: ClassVar[list[tuple[datetime.datetime, int]]] = []
+    """Min-heap of (next check time, notify ID), may contain outdated entries."""
+    _due_times: ClassVar[dict[int, datetime.datetime]] = {}
+    """Current next check time of each scheduled notify."""
+    _schedule_loaded: ClassVar[bool] = False
+
+    _card_cache: ClassVar[dict[tuple[Game, int, Locale, bool], bytes | None]] = {}
+    """Notes cards drawn in the current pass, keyed by (game, uid, draw locale, dark mode)."""
+
     @classmethod
     def _calc_est_time(cls, game: Game, threshold: int, current: int) -> datetime.datetime:
         """Calculate the estimated time for resin/trailblaze power to reach the threshold."""
@@ -219,6 +233,40 @@ class NotesChecker:
         notify.est_time = est_time
         await notify.save(update_fields=("current_notif_count", "est_time"))
 
+    @classmethod
+    async def _draw_notes_card(
+        cls, account: HoyoAccount, notes: Notes | None, locale: Locale
+    ) -> bytes | None:
+        """Draw the notes card, reusing the card drawn for another notify of the account in this pass."""
+        dark_mode = account.user.settings.dark_mode
+        card_locale = draw_locale(locale, account)
+        key = (account.game, account.uid, card_locale, dark_mode)
+        if key in cls._card_cache:
+            return cls._card_cache[key]
+
+        draw_input = DrawInput(
+            dark_mode=dark_mode,
+            locale=card_locale,
+            session=cls._bot.session,
+            filename="notes.png",
+            executor=cls._bot.executor,
+            loop=cls._bot.loop,
+        )
+
+        if isinstance(notes, ZZZNotes):
+            buffer = await draw_zzz_notes_card(draw_input, notes)
+        elif isinstance(notes, StarRailNote):
+            buffer = await draw_hsr_notes_card(draw_input, notes)
+        elif isinstance(notes, GenshinNotes):
+            buffer = await draw_gi_notes_card(draw_input, notes)
+        else:
+            # No card for Honkai notes and planar fissure reminders
+            return None
+
+        card = buffer.getvalue()
+        cls._card_cache[key] = card
+        return card
+
     @classmethod
     async def _notify_user(cls, notify: NotesNotify, notes: Notes | None) -> None:
         try:
@@ -226,29 +274,8 @@ class NotesChecker:
             account = notify.account
 
             embed = cls._get_notify_embed(notify, notes, locale)
-            draw_input = DrawInput(
-                dark_mode=account.user.settings.dark_mode,
-                locale=draw_locale(locale, account),
-                session=cls._bot.session,
-                filename="notes.png",
-                executor=cls._bot.executor,
-                loop=cls._bot.loop,
-            )
-
-            if isinstance(notes, ZZZNotes):
-                buffer = await draw_zzz_notes_card(draw_input, notes)
-            elif isinstance(notes, StarRailNote):
-                buffer = await draw_hsr_notes_card(draw_input, notes)
-            elif isinstance(notes, GenshinNotes):
-                buffer = await draw_gi_notes_card(draw_input, notes)
-            else:
-                buffer = None
-
-            if buffer is None:
-                file_ = None
-            else:
-                buffer.seek(0)
-                file_ = discord.File(buffer, filename="notes.png")
+            card = await cls._draw_notes_card(account, notes, locale)
+            file_ = None if card is None else discord.File(io.BytesIO(card), filename="notes.png")
 
             view = View(author=None, locale=locale)
             buttons = NotesView.get_open_game_buttons(account)
@@ -545,6 +572,72 @@ class NotesChecker:
         notify.enabled = False
         await notify.save(update_fields=("enabled",))
 
+    @classmethod
+    def schedule(cls, notify_id: int, due: datetime.datetime | None = None) -> None:
+        """Schedule a notify to be checked at the given time, defaults to now.
+
+        Rescheduling a notify replaces its previous check time.
+        """
+        due = due or get_now()
+        cls._due_times[notify_id] = due
+        heapq.heappush(cls._due_heap, (due, notify_id))
+
+    @classmethod
+    def _pop_due_notify_ids(cls) -> list[int]:
+        now = get_now()
+        notify_ids: list[int] = []
+
+        while cls._due_heap and cls._due_heap[0][0] <= now:
+            due, notify_id = heapq.heappop(cls._due_heap)
+            if cls._due_times.get(notify_id) != due:
+                # Replaced by a later schedule call
+                continue
+
+            del cls._due_times[notify_id]
+            notify_ids.append(notify_id)
+
+        return notify_ids
+
+    @classmethod
+    def _get_next_check_time(cls, notify: NotesNotify) -> datetime.datetime:
+        """Get the earliest time the notify won't be skipped by `_determine_skip`."""
+        now = get_now()
+        times = [now]
+
+        if notify.est_time is not None:
+            times.append(notify.est_time)
+        if notify.last_check_time is not None:
+            times.append(notify.last_check_time + datetime.timedelta(minutes=notify.check_interval))
+        if notify.last_notif_time is not None:
+            times.append(
+                notify.last_notif_time + datetime.timedelta(minutes=notify.notify_interval)
+            )
+
+        if notify.notify_weekday is not None or notify.notify_time is not None:
+            reset_time = notify.account.server_reset_datetime
+            if (
+                notify.notify_weekday is not None
+                and notify.notify_weekday != reset_time.weekday() + 1
+            ):
+                times.append(reset_time)
+            if notify.notify_time is not None:
+                times.append(reset_time - datetime.timedelta(hours=notify.notify_time))
+
+        next_time = max(times)
+        if next_time <= now and cls._determine_skip(notify):
+            # Don't pop the notify again in the same pass
+            next_time = now + datetime.timedelta(minutes=1)
+        return next_time
+
+    @classmethod
+    async def _load_schedule(cls) -> None:
+        notifies = await NotesNotify.filter(enabled=True).prefetch_related("account")
+        for notify in notifies:
+            cls.schedule(notify.id, cls._get_next_check_time(notify))
+
+        cls._schedule_loaded = True
+        logger.info(f"Scheduled {len(notifies)} notes notifies")
+
     @classmethod
     def _determine_skip(cls, notify: NotesNotify) -> bool:
         """Determine if the notification should be skipped."""
@@ -581,15 +674,15 @@ class NotesChecker:
         return False
 
     @classmethod
-    async def _get_notes(cls, notify: NotesNotify) -> Notes | StarRailNote | ZZZNotes:
-        if notify.account.game is Game.GENSHIN:
-            notes = await notify.account.client.get_genshin_notes()
-        elif notify.account.game is Game.STARRAIL:
-            notes = await notify.account.client.get_starrail_notes()
-        elif notify.account.game is Game.ZZZ:
-            notes = await notify.account.client.get_zzz_notes()
-        elif notify.account.game is Game.HONKAI:
-            notes = await notify.account.client.get_honkai_notes()
+    async def _get_notes(cls, account: HoyoAccount) -> Notes | StarRailNote | ZZZNotes:
+        if account.game is Game.GENSHIN:
+            notes = await account.client.get_genshin_notes()
+        elif account.game is Game.STARRAIL:
+            notes = await account.client.get_starrail_notes()
+        elif account.game is Game.ZZZ:
+            notes = await account.client.get_zzz_notes()
+        elif account.game is Game.HONKAI:
+            notes = await account.client.get_honkai_notes()
         else:
             raise NotImplementedError
         return notes
@@ -602,49 +695,133 @@ class NotesChecker:
         return notify
 
     @classmethod
-    async def execute(cls, bot: HoyoBuddy) -> None:
-        if cls._lock.locked():
-            return
-
-        async with cls._lock:  # noqa: PLR1702
-            cls._bot = bot
-            notes_cache: defaultdict[Game, dict[int, Notes | StarRailNote | ZZZNotes]] = (
-                defaultdict(dict)
-            )
-
-            notifies = (
-                await NotesNotify.filter(enabled=True)
-                .all()
-                .order_by("account__uid")
-                .prefetch_related("account")
-            )
-
-            for notify_ in notifies:
-                notify = await cls._adjust_notify(notify_)
-                if cls._determine_skip(notify):
-                    continue
-
-                await notify.fetch_related("account__user", "account__user__settings")
+    async def _fetch_notes(
+        cls, account: HoyoAccount, notifies: Sequence[NotesNotify]
+    ) -> tuple[Notes | StarRailNote | ZZZNotes | None, Sequence[HSREvent] | None]:
+        """Fetch the notes and events needed by the notifies with the client of the account."""
+        notes: Notes | StarRailNote | ZZZNotes | None = None
+        events: Sequence[HSREvent] | None = None
+
+        if any(notify.type is not NotesNotifyType.PLANAR_FISSURE for notify in notifies):
+            notes = await cls._get_notes(account)
+        if any(notify.type is NotesNotifyType.PLANAR_FISSURE for notify in notifies):
+            events = (await account.client.get_starrail_event_calendar()).events
+        return notes, events
 
+    @classmethod
+    async def _check_account(cls, notifies: Sequence[NotesNotify]) -> None:
+        """Fetch the notes of a game account once and process all of its notifies.
+
+        The game account can be added by several users, its notes are fetched with the cookies
+        of each of them in turn until one succeeds. A failed fetch only fails the notifies of
+        the user whose cookies were used.
+        """
+        user_notifies: defaultdict[int, list[NotesNotify]] = defaultdict(list)
+        for notify in notifies:
+            user_notifies[notify.account.id].append(notify)
+
+        notes: Notes | StarRailNote | ZZZNotes | None = None
+        events: Sequence[HSREvent] | None = None
+        fetched = False
+
+        for group in user_notifies.values():
+            fetch_error: Exception | None = None
+            if not fetched:
                 try:
-                    if notify.type is NotesNotifyType.PLANAR_FISSURE:
-                        events = (await notify.account.client.get_starrail_event_calendar()).events
-                        notes = None
-                    else:
-                        events = None
-                        if notify.account.uid not in notes_cache[notify.account.game]:
-                            try:
-                                notes = await cls._get_notes(notify)
-                            except genshin.errors.InternalDatabaseError:
-                                continue
-                            notes_cache[notify.account.game][notify.account.uid] = notes
-                        else:
-                            notes = notes_cache[notify.account.game][notify.account.uid]
+                    notes, events = await cls._fetch_notes(group[0].account, notifies)
+                except genshin.errors.InternalDatabaseError:
+                    return
+                except Exception as e:
+                    fetch_error = e
+                else:
+                    fetched = True
 
+            for notify in group:
+                try:
+                    if fetch_error is not None:
+                        raise fetch_error
                     await cls._process_notify(notify, notes, events)
                 except Exception as e:
                     await cls._handle_notify_error(notify, e)
                 finally:
                     notify.last_check_time = get_now()
                     await notify.save(update_fields=("last_check_time",))
-                    await sleep("notes_check")
+
+    @classmethod
+    async def _check_account_task(cls, queue: asyncio.Queue[list[NotesNotify]]) -> None:
+        while True:
+            notifies = await queue.get()
+
+            try:
+                await cls._check_account(notifies)
+            except Exception as e:
+                cls._bot.capture_exception(e)
+            finally:
+                await sleep("notes_check")
+                queue.task_done()
+
+    @classmethod
+    async def _check_due_notifies(cls, notify_ids: Sequence[int]) -> None:
+        # Only notifies that are due are loaded, disabled and deleted ones are dropped here
+        notifies = (
+            await NotesNotify.filter(id__in=notify_ids, enabled=True)
+            .order_by("account__uid")
+            .prefetch_related("account")
+        )
+
+        # Notifies of the same game account share one notes request
+        account_notifies: defaultdict[tuple[Game, int], list[NotesNotify]] = defaultdict(list)
+        for notify_ in notifies:
+            notify = await cls._adjust_notify(notify_)
+            if cls._determine_skip(notify):
+                cls.schedule(notify.id, cls._get_next_check_time(notify))
+                continue
+
+            await notify.fetch_related("account__user", "account__user__settings")
+            account_notifies[notify.account.game, notify.account.uid].append(notify)
+
+        queue: asyncio.Queue[list[NotesNotify]] = asyncio.Queue()
+        for group in account_notifies.values():
+            queue.put_nowait(group)
+
+        tasks = [
+            asyncio.create_task(cls._check_account_task(queue))
+            for _ in range(min(NOTES_CHECK_CONCURRENCY, queue.qsize()))
+        ]
+        try:
+            await queue.join()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        for group in account_notifies.values():
+            for notify in group:
+                if notify.enabled:
+                    cls.schedule(notify.id, cls._get_next_check_time(notify))
+
+    @classmethod
+    async def execute(cls, bot: HoyoBuddy) -> None:
+        if cls._lock.locked():
+            return
+
+        async with cls._lock:
+            cls._bot = bot
+            cls._card_cache = {}
+            if not cls._schedule_loaded:
+                await cls._load_schedule()
+
+            notify_ids = cls._pop_due_notify_ids()
+            if not notify_ids:
+                return
+
+            try:
+                await cls._check_due_notifies(notify_ids)
+            except BaseException:
+                # The popped notifies that weren't rescheduled yet are retried in the next pass
+                for notify_id in notify_ids:
+                    if notify_id not in cls._due_times:
+                        cls.schedule(notify_id)
+                raise
+            finally:
+                cls._card_cache = {}
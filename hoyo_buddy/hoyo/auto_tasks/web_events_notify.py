@@ -2,18 +2,24 @@ from __future__ import annotations
 
 import asyncio
 import itertools
+from collections import defaultdict
 from typing import TYPE_CHECKING, ClassVar
 
 import genshin
 from loguru import logger
 
-from hoyo_buddy.constants import HB_GAME_TO_GPY_GAME
+from hoyo_buddy.constants import HB_GAME_TO_GPY_GAME, WEB_EVENTS_NOTIFY_CONCURRENCY
 from hoyo_buddy.db.models import HoyoAccount, JSONFile
 from hoyo_buddy.enums import Locale
 from hoyo_buddy.l10n import LocaleStr
 from hoyo_buddy.ui.hoyo.web_events import WebEventsView
+from hoyo_buddy.utils import sleep
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    import discord
+
     from hoyo_buddy.bot import HoyoBuddy
     from hoyo_buddy.enums import Game
 
@@ -37,7 +43,9 @@ class WebEventsNotify:
                 cls._bot = bot
                 cls._notify_count = 0
 
-                accounts = await HoyoAccount.filter(notif_settings__web_events=True)
+                accounts = await HoyoAccount.filter(
+                    notif_settings__web_events=True
+                ).prefetch_related("user__settings")
                 games = {account.game for account in accounts}
 
                 for game in games:
@@ -63,14 +71,19 @@ class WebEventsNotify:
                     if not notify_events:
                         continue
 
-                    notify_accounts = [account for account in accounts if account.game == game]
-                    for account in notify_accounts:
-                        await cls.notify_events(account, notify_events)
-                        cls._notify_count += 1
+                    # Users with several accounts of the game get the events once
+                    locale_user_ids: defaultdict[Locale, set[int]] = defaultdict(set)
+                    for account in accounts:
+                        if account.game != game:
+                            continue
+                        locale = account.user.settings.locale or Locale.american_english
+                        locale_user_ids[locale].add(account.user_id)
+
+                    await cls.notify_events(locale_user_ids, notify_events)
             except Exception as e:
                 cls._bot.capture_exception(e)
             finally:
-                logger.info(f"Web events notify finished, notified {cls._notify_count} accounts")
+                logger.info(f"Web events notify finished, notified {cls._notify_count} users")
                 logger.info(
                     f"Web events notify took {asyncio.get_event_loop().time() - start:.2f}s"
                 )
@@ -80,18 +93,46 @@ class WebEventsNotify:
         client = genshin.Client(game=HB_GAME_TO_GPY_GAME[game])
         return await client.get_web_events()
 
+    @classmethod
+    async def _notify_task(
+        cls, queue: asyncio.Queue[tuple[int, list[tuple[discord.Embed, ...]]]]
+    ) -> None:
+        while True:
+            user_id, chunks = await queue.get()
+
+            try:
+                for chunk in chunks:
+                    await cls._bot.dm_user(user_id, embeds=chunk)
+                    await sleep("dm")
+                cls._notify_count += 1
+            except Exception as e:
+                cls._bot.capture_exception(e)
+            finally:
+                queue.task_done()
+
     @classmethod
     async def notify_events(
-        cls, account: HoyoAccount, events: list[genshin.models.WebEvent]
+        cls, locale_user_ids: Mapping[Locale, Iterable[int]], events: list[genshin.models.WebEvent]
     ) -> None:
-        await account.fetch_related("user", "user__settings")
-        locale = account.user.settings.locale or Locale.american_english
-        embeds = [
-            WebEventsView.get_event_embed(event, locale).set_footer(
-                text=LocaleStr(key="web_events_embed_footer")
-            )
-            for event in events
-        ]
+        """DM the events to the users, the embeds are built once per locale."""
+        queue: asyncio.Queue[tuple[int, list[tuple[discord.Embed, ...]]]] = asyncio.Queue()
 
-        for chunk in itertools.batched(embeds, 10):
-            await cls._bot.dm_user(account.user.id, embeds=chunk)
+        for locale, user_ids in locale_user_ids.items():
+            embeds = [
+                WebEventsView.get_event_embed(event, locale).set_footer(
+                    text=LocaleStr(key="web_events_embed_footer")
+                )
+                for event in events
+            ]
+            chunks = list(itertools.batched(embeds, 10))
+            for user_id in user_ids:
+                queue.put_nowait((user_id, chunks))
+
+        tasks = [
+            asyncio.create_task(cls._notify_task(queue))
+            for _ in range(min(WEB_EVENTS_NOTIFY_CONCURRENCY, queue.qsize()))
+        ]
+        await queue.join()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import functools
+import hashlib
 import random
-from typing import TYPE_CHECKING, Any, Literal, NamedTuple, overload
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, NamedTuple, overload
 
+import aiohttp
 import enka
 import genshin
 import orjson
@@ -11,11 +15,14 @@ from loguru import logger
 from tortoise import Tortoise
 
 from hoyo_buddy import models
+from hoyo_buddy.bot.cache import LRUCache
 from hoyo_buddy.bot.error_handler import get_error_embed
 from hoyo_buddy.config import CONFIG
 from hoyo_buddy.constants import (
     AMBR_TRAVELER_ID_TO_ENKA_TRAVELER_ID,
     AMBR_UI_URL,
+    COOKIE_REFRESH_CACHE_SIZE,
+    COOKIE_REFRESH_TTLS,
     DMG_BONUS_IDS,
     ELEMENT_TO_BONUS_PROP_ID,
     GPY_PATH_TO_EKNA_PATH,
@@ -36,31 +43,47 @@ from hoyo_buddy.constants import (
     contains_traveler_id,
     convert_fight_prop,
 )
-from hoyo_buddy.db import JSONFile
+from hoyo_buddy.db import JSONFile, RedeemCode
 from hoyo_buddy.embeds import DefaultEmbed
-from hoyo_buddy.enums import Game, GenshinElement, Locale
+from hoyo_buddy.enums import Game, GenshinElement, Locale, RedeemCodeStatus
 from hoyo_buddy.exceptions import HoyoBuddyError
 from hoyo_buddy.hoyo.clients.yatta import YattaAPIClient
+from hoyo_buddy.hoyo.proxy_pool import proxy_pool
 from hoyo_buddy.l10n import LocaleStr
 from hoyo_buddy.utils import sleep
 from hoyo_buddy.utils.game import get_ascension_from_level, get_max_level_from_ascension
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping, Sequence
+    from collections.abc import Awaitable, Callable, Mapping, Sequence
 
     import yatta
 
     from hoyo_buddy.db import HoyoAccount
 
 
+REDEEM_CODE_STATUS_RETCODES: dict[RedeemCodeStatus, int] = {
+    RedeemCodeStatus.EXPIRED: -2001,
+    RedeemCodeStatus.INVALID: -2004,
+    RedeemCodeStatus.MAX_USES: -2006,
+}
+REDEEM_RETCODE_STATUSES: dict[int, RedeemCodeStatus] = {
+    -1065: RedeemCodeStatus.INVALID,
+    -2001: RedeemCodeStatus.EXPIRED,
+    -2003: RedeemCodeStatus.INVALID,
+    -2004: RedeemCodeStatus.INVALID,
+    -2006: RedeemCodeStatus.MAX_USES,
+}
+
+
 class MimoClaimTaksResult(NamedTuple):
     finished: list[genshin.models.MimoTask]
     claimed_points: int
     all_claimed: bool
 
 
-def _create_gpy_cache() -> genshin.cache.BaseCache:
-    """Create the genshin.py API cache, using Redis if available."""
+@functools.cache
+def _get_gpy_cache() -> genshin.cache.BaseCache:
+    """Get the genshin.py API cache shared by all clients, using Redis if available."""
     static_ttl = 3600 * 24 * 31  # 31 days
     if CONFIG.redis_url:
         redis = aioredis.from_url(CONFIG.redis_url)
@@ -68,7 +91,57 @@ def _create_gpy_cache() -> genshin.cache.BaseCache:
     return genshin.SQLiteCache(static_ttl=static_ttl)
 
 
+class _RequestCookieManager(genshin.client.manager.CookieManager):
+    """Copy of a client's cookie manager used by a single request, sharing its cookies.
+
+    Lets concurrent requests of one client go through different proxies and tells whether
+    genshin.py retried the request without the proxy after a proxy error.
+    """
+
+    def __init__(self, manager: genshin.client.manager.CookieManager, proxy: str | None) -> None:
+        vars(self).update(vars(manager))
+        vars(self).update(_proxy=None, _socks_proxy=None, fell_back=False)
+        self.proxy = proxy
+        self.proxy_url = proxy
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in {"_proxy", "_socks_proxy"} and value is None and getattr(self, name) is not None:
+            # genshin.py clears the proxy to retry directly after a proxy error
+            self.fell_back = True
+        super().__setattr__(name, value)
+
+    @property
+    def used_proxy(self) -> str | None:
+        """The proxy the request was sent through, None if it was sent directly."""
+        return None if self.fell_back else self.proxy_url
+
+
+_request_cookie_manager: ContextVar[tuple[ProxyGenshinClient, _RequestCookieManager] | None] = (
+    ContextVar("_request_cookie_manager", default=None)
+)
+
+
+REQUEST_PROXY_ATTR = "hb_request_proxy"
+"""Attribute of the errors raised by ProxyGenshinClient.request, set to the proxy of the request."""
+
+
+def get_request_proxy(e: BaseException) -> str | None:
+    """Get the proxy of the request that raised or caused the error, None if it was sent directly."""
+    error: BaseException | None = e
+    while error is not None:
+        if hasattr(error, REQUEST_PROXY_ATTR):
+            return getattr(error, REQUEST_PROXY_ATTR)
+        error = error.__cause__ or error.__context__
+    return None
+
+
 class ProxyGenshinClient(genshin.Client):
+    """Client that sends overseas requests through a proxy.
+
+    Unless a proxy URL is given, a proxy is drawn from the proxy pool for every request and
+    the outcome is reported back to the pool.
+    """
+
     def __init__(
         self,
         *args,
@@ -79,14 +152,14 @@ class ProxyGenshinClient(genshin.Client):
     ) -> None:
         effective_proxy: str | None = None
         if region is genshin.Region.OVERSEAS and use_proxy:
-            effective_proxy = proxy_url if proxy_url is not None else CONFIG.proxy
+            effective_proxy = proxy_url if proxy_url is not None else proxy_pool.choose()
         logger.debug(
             f"ProxyGenshinClient initialized with proxy: {effective_proxy!r} (region={region})"
         )
         super().__init__(
             *args,
             debug=True,
-            cache=_create_gpy_cache(),
+            cache=_get_gpy_cache(),
             region=region,
             proxy=effective_proxy,
             **kwargs,
@@ -94,24 +167,77 @@ class ProxyGenshinClient(genshin.Client):
         self._use_proxy = use_proxy
         self._proxy_url = proxy_url
 
+    @property
+    def cookie_manager(self) -> genshin.client.manager.BaseCookieManager:
+        scoped = _request_cookie_manager.get()
+        if scoped is not None and scoped[0] is self:
+            return scoped[1]
+        return self._cookie_manager
+
+    @cookie_manager.setter
+    def cookie_manager(self, value: genshin.client.manager.BaseCookieManager) -> None:
+        self._cookie_manager = value
+
     @property
     def use_proxy(self) -> bool:
         return self._use_proxy
 
     @use_proxy.setter
     def use_proxy(self, value: bool) -> None:
-        effective_proxy = self._proxy_url if self._proxy_url is not None else CONFIG.proxy
-        if effective_proxy is None:
+        if self._proxy_url is None and not proxy_pool:
             logger.warning("Proxy is not set in the config, setting use_proxy will have no effect.")
 
         if value and self.region is genshin.Region.OVERSEAS:
-            self.proxy = effective_proxy
+            self.proxy = self._proxy_url if self._proxy_url is not None else proxy_pool.choose()
         else:
             self.proxy = None
         self._use_proxy = value
 
+    @property
+    def _uses_proxy_pool(self) -> bool:
+        return (
+            self._use_proxy
+            and self._proxy_url is None
+            and self.region is genshin.Region.OVERSEAS
+            and bool(proxy_pool)
+        )
+
+    async def request(self, url: aiohttp.typedefs.StrOrURL, **kwargs: Any) -> Mapping[str, Any]:
+        manager = self._cookie_manager
+        if not isinstance(manager, genshin.client.manager.CookieManager):
+            return await super().request(url, **kwargs)
+
+        uses_proxy_pool = self._uses_proxy_pool
+        proxy = proxy_pool.choose() if uses_proxy_pool else (manager._socks_proxy or self.proxy)
+        # The request uses its own copy of the cookie manager, concurrent requests of this client
+        # would otherwise overwrite each other's proxy
+        request_manager = _RequestCookieManager(manager, proxy)
+        token = _request_cookie_manager.set((self, request_manager))
+        success: bool | None = None
+        try:
+            response = await super().request(url, **kwargs)
+        except Exception as e:
+            if isinstance(e, TimeoutError | aiohttp.ClientError):
+                success = False
+            elif isinstance(e, genshin.GenshinException):
+                # The proxy relayed the API's response, unless the request fell back to a direct connection
+                success = not request_manager.fell_back
+            setattr(e, REQUEST_PROXY_ATTR, request_manager.used_proxy)
+            raise
+        else:
+            success = not request_manager.fell_back
+        finally:
+            _request_cookie_manager.reset(token)
+            if uses_proxy_pool and success is not None:
+                proxy_pool.record(proxy, success=success)
+
+        return response
+
 
 class GenshinClient(ProxyGenshinClient):
+    _refreshed_cookies: ClassVar[LRUCache] = LRUCache(maxsize=COOKIE_REFRESH_CACHE_SIZE)
+    """Tokens fetched with an stoken, shared by the accounts of all games with the same stoken."""
+
     def __init__(self, account: HoyoAccount) -> None:
         game = HB_GAME_TO_GPY_GAME[account.game]
 
@@ -540,10 +666,50 @@ class GenshinClient(ProxyGenshinClient):
     ) -> Sequence[genshin.models.ZZZPartialAgent]:
         return await super().get_zzz_agents(uid)
 
+    @staticmethod
+    def _get_cookie_refresh_key(cookies: Mapping[str, str], token_names: Sequence[str]) -> str:
+        mid = cookies.get("mid") or cookies.get("ltmid_v2")
+        source = f"{cookies.get('stoken')}|{mid}|{','.join(token_names)}"
+        return hashlib.blake2b(source.encode(), digest_size=16).hexdigest()
+
+    async def _refresh_cookies(
+        self,
+        cookies: Mapping[str, str],
+        token_names: Sequence[str],
+        fetch: Callable[[], Awaitable[Mapping[str, str]]],
+        *,
+        reuse_current: bool = True,
+    ) -> dict[str, str]:
+        """Fetch tokens with the stoken, or reuse the ones fetched recently for the same stoken.
+
+        Args:
+            cookies: The cookies containing the stoken.
+            token_names: Names of the fetched tokens, determine how long they are reused.
+            fetch: Coroutine function that fetches the tokens.
+            reuse_current: Whether to reuse cached tokens identical to the ones in the cookies,
+                False when the current tokens were rejected.
+        """
+        key = self._get_cookie_refresh_key(cookies, token_names)
+        cached: dict[str, str] | None = await self._refreshed_cookies.get(key)
+        if cached is not None and (
+            reuse_current or any(cookies.get(name) != value for name, value in cached.items())
+        ):
+            return cached
+
+        tokens = dict(await fetch())
+        ttl = min(COOKIE_REFRESH_TTLS[name] for name in token_names)
+        await self._refreshed_cookies.set(key, tokens, ttl=ttl)
+        return tokens
+
     async def update_cookie_token(self) -> None:
         """Update the cookie token."""
         parsed_cookies = self._account.dict_cookies
-        cookies = await genshin.fetch_cookie_with_stoken_v2(parsed_cookies, token_types=[2, 4])
+        cookies = await self._refresh_cookies(
+            parsed_cookies,
+            ("ltoken_v2", "cookie_token_v2"),
+            lambda: genshin.fetch_cookie_with_stoken_v2(parsed_cookies, token_types=[2, 4]),
+            reuse_current=False,
+        )
         parsed_cookies.update(cookies)
         self.set_cookies(parsed_cookies)
         new_str_cookies = "; ".join(f"{k}={v}" for k, v in parsed_cookies.items())
@@ -558,11 +724,15 @@ class GenshinClient(ProxyGenshinClient):
         if not codes:
             return None
 
+        redeemed_codes = {c.upper() for c in self._account.redeemed_codes}
         results: list[tuple[str, str, bool]] = []
         for code in codes:
             if not code or (
-                code.capitalize() in {c.capitalize() for c in self._account.redeemed_codes}
-                and skip_redeemed
+                skip_redeemed
+                and (
+                    code.upper() in redeemed_codes
+                    or await self._get_known_redeem_error(code) is not None
+                )
             ):
                 continue
 
@@ -605,12 +775,53 @@ class GenshinClient(ProxyGenshinClient):
             return embed.description
         return f"{embed.title}\n{embed.description}"
 
+    @property
+    def _server(self) -> str | None:
+        try:
+            return genshin.utility.recognize_server(
+                self.uid, HB_GAME_TO_GPY_GAME[self._account.game]
+            )
+        except ValueError:
+            return None
+
+    async def _get_known_redeem_error(self, code: str) -> genshin.GenshinException | None:
+        """Return the error redeeming the code would raise according to the global code status."""
+        record = await RedeemCode.get_cached(self._account.game, code)
+        if record is None:
+            return None
+
+        if record.is_redeemable:
+            if self._server is not None and self._server in record.locked_servers:
+                return genshin.errors.RedemptionRegionLock({"retcode": -2008})
+            return None
+
+        retcode = REDEEM_CODE_STATUS_RETCODES[record.status]
+        try:
+            genshin.raise_for_retcode({"retcode": retcode, "message": ""})
+        except genshin.GenshinException as e:
+            return e
+
+    async def _learn_redeem_code_status(self, code: str, e: Exception | None) -> None:
+        game = self._account.game
+        if e is None or isinstance(e, genshin.RedemptionClaimed):
+            await RedeemCode.set_status(game, code, RedeemCodeStatus.VALID)
+        elif isinstance(e, genshin.errors.RedemptionRegionLock):
+            if self._server is not None:
+                await RedeemCode.add_locked_server(game, code, self._server)
+        elif isinstance(e, genshin.RedemptionInvalid) and (
+            status := REDEEM_RETCODE_STATUSES.get(e.retcode)
+        ):
+            await RedeemCode.set_status(game, code, status)
+
     async def redeem_code(self, code: str, *, locale: Locale) -> tuple[str, bool]:
         """Redeem a code, return a message and a boolean indicating success."""
         success = False
 
+        if (known_error := await self._get_known_redeem_error(code)) is not None:
+            return self._handle_redeem_error(known_error, locale), success
+
         try:
-            if code in self._account.redeemed_codes:
+            if code.upper() in {c.upper() for c in self._account.redeemed_codes}:
                 raise genshin.RedemptionClaimed
 
             await super().redeem_code(code)
@@ -637,12 +848,15 @@ class GenshinClient(ProxyGenshinClient):
             await sleep("redeem")
             return await self.redeem_code(code, locale=locale)
         except Exception as e:
-            if isinstance(e, genshin.RedemptionClaimed | genshin.RedemptionInvalid):
+            # Codes that can't be redeemed by anyone are tracked globally instead of per account
+            if isinstance(e, genshin.RedemptionClaimed):
                 await self._add_to_redeemed_codes(code)
+            await self._learn_redeem_code_status(code, e)
 
             msg = self._handle_redeem_error(e, locale)
         else:
             await self._add_to_redeemed_codes(code)
+            await self._learn_redeem_code_status(code, None)
             success = True
             msg = LocaleStr(key="redeem_code.success").translate(locale)
 
@@ -657,8 +871,12 @@ class GenshinClient(ProxyGenshinClient):
         if "stoken" not in cookies or "mid" not in cookies:
             return None
 
-        cookie_token = (await genshin.cn_fetch_cookie_token_with_stoken_v2(cookies))["cookie_token"]
-        cookies["cookie_token"] = cookie_token
+        tokens = await self._refresh_cookies(
+            cookies,
+            ("cookie_token",),
+            lambda: genshin.cn_fetch_cookie_token_with_stoken_v2(cookies),
+        )
+        cookies["cookie_token"] = tokens["cookie_token"]
         cookies["account_id"] = cookies["ltuid"]
         self.set_cookies(cookies)
         return cookies
@@ -676,17 +894,24 @@ class GenshinClient(ProxyGenshinClient):
         **kwargs,
     ) -> Mapping[str, str]:
         """Claim the daily reward."""
-        await self.update_cookies_for_checkin()
-        return await super().request_daily_reward(
-            endpoint,
-            game=game,
-            method=method,
-            lang=lang,
-            params=params,
-            headers=headers,
-            challenge=challenge,
-            **kwargs,
-        )
+        cookies = await self.update_cookies_for_checkin()
+        try:
+            return await super().request_daily_reward(
+                endpoint,
+                game=game,
+                method=method,
+                lang=lang,
+                params=params,
+                headers=headers,
+                challenge=challenge,
+                **kwargs,
+            )
+        except genshin.InvalidCookies:
+            if cookies is not None:
+                # Don't reuse the rejected cookie token for the other games of the account
+                key = self._get_cookie_refresh_key(cookies, ("cookie_token",))
+                await self._refreshed_cookies.delete(key)
+            raise
 
     @overload
     async def get_notes_(self, game: Literal[genshin.Game.GENSHIN]) -> genshin.models.Notes: ...
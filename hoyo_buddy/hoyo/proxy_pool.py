@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import random
+import time
+from typing import TYPE_CHECKING
+
+import aiohttp
+from loguru import logger
+
+from hoyo_buddy.config import CONFIG
+from hoyo_buddy.constants import (
+    PROXY_CIRCUIT_COOLDOWN,
+    PROXY_CIRCUIT_MAX_COOLDOWN,
+    PROXY_FAILURE_THRESHOLD,
+    PROXY_HEALTH_CHECK_INTERVAL,
+    PROXY_HEALTH_CHECK_URL,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+SCORE_DECAY = 0.1
+"""Weight of the latest outcome in the exponential moving average of a proxy's success rate."""
+MIN_SCORE = 0.05
+"""Lowest score a proxy can have, so it still gets a little traffic to recover with."""
+
+
+class ProxyState:
+    def __init__(self, url: str, weight: int) -> None:
+        self.url = url
+        self.weight = weight
+
+        self.score = 1.0
+        """Exponential moving average of the success rate."""
+        self.consecutive_failures = 0
+        self.open_until = 0.0
+        """Monotonic time until which the circuit is open and the proxy isn't used."""
+        self.cooldown = PROXY_CIRCUIT_COOLDOWN
+
+    @property
+    def is_open(self) -> bool:
+        return time.monotonic() < self.open_until
+
+    @property
+    def effective_weight(self) -> float:
+        return self.weight * max(self.score, MIN_SCORE)
+
+    def record(self, *, success: bool) -> None:
+        self.score += SCORE_DECAY * (float(success) - self.score)
+
+        if success:
+            if self.consecutive_failures >= PROXY_FAILURE_THRESHOLD:
+                logger.info(f"Proxy {self} recovered, closing its circuit")
+            self.consecutive_failures = 0
+            self.cooldown = PROXY_CIRCUIT_COOLDOWN
+            return
+
+        self.consecutive_failures += 1
+        if self.consecutive_failures < PROXY_FAILURE_THRESHOLD or self.is_open:
+            return
+
+        # Open or re-open (after a failed half-open attempt) the circuit
+        self.open_until = time.monotonic() + self.cooldown
+        logger.warning(
+            f"Proxy {self} failed {self.consecutive_failures} times in a row, "
+            f"ejecting it for {self.cooldown}s"
+        )
+        self.cooldown = min(self.cooldown * 2, PROXY_CIRCUIT_MAX_COOLDOWN)
+
+    def __str__(self) -> str:
+        # Don't log credentials
+        return self.url.rpartition("@")[2]
+
+
+class ProxyPool:
+    """Weighted pool of proxies with passive health scoring and circuit breaking.
+
+    Every request draws a proxy, weighted by its configured weight and its recent success rate.
+    A proxy that fails several times in a row is ejected for a cooldown that doubles each time it
+    fails again after coming back. Active probes close circuits as soon as the proxy is reachable.
+    """
+
+    def __init__(self, proxies: Mapping[str, int]) -> None:
+        self._proxies = {url: ProxyState(url, weight) for url, weight in proxies.items()}
+        self._health_check_task: asyncio.Task[None] | None = None
+
+    @classmethod
+    def from_config(cls) -> ProxyPool:
+        if CONFIG.proxies:
+            return cls(CONFIG.proxies)
+        if CONFIG.proxy is not None:
+            return cls({CONFIG.proxy: 1})
+        return cls({})
+
+    def __bool__(self) -> bool:
+        return bool(self._proxies)
+
+    def choose(self) -> str | None:
+        """Draw a proxy for a request, return None if the pool is empty."""
+        if not self._proxies:
+            return None
+
+        available = [proxy for proxy in self._proxies.values() if not proxy.is_open]
+        if not available:
+            # Every proxy is ejected, use the one that comes back first rather than going direct
+            return min(self._proxies.values(), key=lambda proxy: proxy.open_until).url
+
+        weights = [proxy.effective_weight for proxy in available]
+        return random.choices(available, weights=weights)[0].url
+
+    def record(self, url: str | None, *, success: bool) -> None:
+        """Record the outcome of a request made through a proxy of the pool."""
+        if url is None:
+            return
+
+        proxy = self._proxies.get(url)
+        if proxy is not None:
+            proxy.record(success=success)
+
+    async def _probe(self, session: aiohttp.ClientSession, proxy: ProxyState) -> None:
+        try:
+            async with session.head(
+                PROXY_HEALTH_CHECK_URL, proxy=proxy.url, timeout=aiohttp.ClientTimeout(total=10)
+            ):
+                pass
+        except (TimeoutError, aiohttp.ClientError) as e:
+            logger.debug(f"Health check of proxy {proxy} failed: {e!r}")
+            proxy.record(success=False)
+        else:
+            # Any response means the proxy can reach HoYoLAB
+            if proxy.is_open:
+                proxy.open_until = 0.0
+            proxy.record(success=True)
+
+    async def _health_check_loop(self) -> None:
+        # aiohttp only supports HTTP proxies, SOCKS proxies rely on passive health scoring
+        proxies = [p for p in self._proxies.values() if p.url.startswith(("http://", "https://"))]
+        async with aiohttp.ClientSession() as session:
+            while True:
+                await asyncio.gather(*(self._probe(session, proxy) for proxy in proxies))
+                await asyncio.sleep(PROXY_HEALTH_CHECK_INTERVAL)
+
+    def start_health_checks(self) -> None:
+        if not self._proxies or self._health_check_task is not None:
+            return
+        self._health_check_task = asyncio.create_task(self._health_check_loop())
+
+    async def stop_health_checks(self) -> None:
+        if self._health_check_task is None:
+            return
+
+        self._health_check_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._health_check_task
+        self._health_check_task = None
+
+
+proxy_pool = ProxyPool.from_config()
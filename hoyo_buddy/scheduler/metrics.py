@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from typing import ClassVar, Final
+from urllib.parse import urlparse
+
+import prometheus_client
+from loguru import logger
+from prometheus_client import (
+    GC_COLLECTOR,
+    PLATFORM_COLLECTOR,
+    PROCESS_COLLECTOR,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+)
+
+from hoyo_buddy.config import CONFIG
+from hoyo_buddy.utils.misc import SLEEP_OBSERVERS
+
+REGISTRY = CollectorRegistry()
+"""Registry of the scheduler metrics, only served by the scheduler process.
+
+The auto tasks are also imported by the bot, the metrics don't end up in its default registry.
+"""
+for collector in (PROCESS_COLLECTOR, PLATFORM_COLLECTOR, GC_COLLECTOR):
+    REGISTRY.register(collector)
+
+
+class Metrics:
+    """Metrics of the scheduler process sent to the Prometheus server"""
+
+    PREFIX: Final[str] = "scheduler_"
+    """Metric's prefix"""
+
+    enabled: ClassVar[bool] = False
+    """Whether the metrics server was started, metrics are only recorded in the scheduler."""
+
+    ACCOUNTS_PROCESSED: Final[Counter] = Counter(
+        PREFIX + "accounts_processed",
+        "Number of accounts processed by auto tasks",
+        ["task", "status"],
+        registry=REGISTRY,
+    )
+    """Number of accounts processed by auto tasks, status is either success or error"""
+
+    QUEUE_SIZE: Final[Gauge] = Gauge(
+        PREFIX + "queue_size",
+        "Number of accounts waiting in the current batch",
+        ["task"],
+        registry=REGISTRY,
+    )
+    """Number of accounts waiting in the current batch"""
+
+    IN_FLIGHT: Final[Gauge] = Gauge(
+        PREFIX + "in_flight_accounts",
+        "Number of accounts being processed by workers",
+        ["task"],
+        registry=REGISTRY,
+    )
+    """Number of accounts being processed by workers"""
+
+    ACCOUNT_LATENCY: Final[Histogram] = Histogram(
+        PREFIX + "account_latency_seconds",
+        "Time taken to process a single account",
+        ["task"],
+        buckets=(0.5, 1, 2.5, 5, 10, 20, 30, 60, 120, 300),
+        registry=REGISTRY,
+    )
+    """Time taken to process a single account, including retries made by the task itself (unit: seconds)"""
+
+    ERRORS: Final[Counter] = Counter(
+        PREFIX + "errors",
+        "Number of errors raised by auto tasks",
+        ["task", "exception", "proxy"],
+        registry=REGISTRY,
+    )
+    """Number of errors raised by auto tasks, including the ones that are retried"""
+
+    SLEEP_SECONDS: Final[Counter] = Counter(
+        PREFIX + "sleep_seconds", "Time spent in throttling sleeps", ["name"], registry=REGISTRY
+    )
+    """Time spent in throttling sleeps (unit: seconds)"""
+
+
+def get_proxy_label(proxy: str | None) -> str:
+    """Return the host of the proxy without credentials, or "direct" if no proxy is used."""
+    if proxy is None:
+        return "direct"
+    return urlparse(proxy).netloc.rpartition("@")[2]
+
+
+def start_metrics_server() -> None:
+    Metrics.enabled = True
+    SLEEP_OBSERVERS.append(lambda name, seconds: Metrics.SLEEP_SECONDS.labels(name).inc(seconds))
+
+    port = CONFIG.scheduler_prometheus_port
+    if port is None:
+        logger.warning(
+            "Scheduler Prometheus port is not set in the settings, skipping server start"
+        )
+        return
+
+    try:
+        prometheus_client.start_http_server(port, registry=REGISTRY)
+    except OSError as e:
+        logger.error(f"Failed to start scheduler Prometheus server: {e}")
+    else:
+        logger.info(f"Scheduler Prometheus server started on port {port}")
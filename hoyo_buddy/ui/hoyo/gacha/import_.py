@@ -6,13 +6,12 @@ import discord
 import genshin
 
 from hoyo_buddy.constants import MW_EVENT_BANNER_TYPES
-from hoyo_buddy.db import GachaHistory, get_dyk, update_gacha_nums
+from hoyo_buddy.db import GachaHistory, GachaHistoryRow, get_dyk, update_gacha_nums
 from hoyo_buddy.embeds import DefaultEmbed
 from hoyo_buddy.emojis import LINK, LOADING
 from hoyo_buddy.enums import Game
 from hoyo_buddy.exceptions import AuthkeyExtractError, FeatureNotImplementedError, UIDMismatchError
 from hoyo_buddy.hoyo.clients.ambr import AmbrAPIClient
-from hoyo_buddy.hoyo.clients.gpy import GenshinClient
 from hoyo_buddy.l10n import LocaleStr
 from hoyo_buddy.ui import Button, Label, Modal, TextInput, URLButtonView, View
 
@@ -126,7 +125,7 @@ class URLImport(Button[GachaImportView]):
             return
 
         url = modal.url.value
-        client = GenshinClient(self.account)
+        client = self.account.client
         try:
             authkey = genshin.utility.extract_authkey(url)
         except Exception as e:
@@ -144,8 +143,7 @@ class URLImport(Button[GachaImportView]):
         ).add_acc_info(self.account)
         await i.edit_original_response(embed=embed, view=None)
 
-        records: list[GachaHistory] = []
-        before = await GachaHistory.get_wish_count(self.account)
+        records: list[GachaHistoryRow] = []
 
         if self.account.game is Game.GENSHIN:
             wishes: list[genshin.models.Wish] = [
@@ -166,15 +164,13 @@ class URLImport(Button[GachaImportView]):
                     raise ValueError(msg)
 
                 records.append(
-                    GachaHistory(
+                    GachaHistoryRow(
                         wish_id=wish.id,
                         rarity=wish.rarity,
                         time=wish.time,
                         banner_type=banner_type,
                         item_id=item_id,
-                        account=self.account,
                         banner_id=None,
-                        game=Game.GENSHIN,
                     )
                 )
 
@@ -191,15 +187,13 @@ class URLImport(Button[GachaImportView]):
                 )
 
                 records.append(
-                    GachaHistory(
+                    GachaHistoryRow(
                         wish_id=wish.id,
                         rarity=wish.rarity,
                         time=wish.time,
                         banner_type=banner_type,
                         item_id=wish.item_id,
-                        account=self.account,
                         banner_id=wish.banner_id,
-                        game=Game.GENSHIN,
                     )
                 )
 
@@ -213,15 +207,13 @@ class URLImport(Button[GachaImportView]):
                 self._check_uid(warp)
 
                 records.append(
-                    GachaHistory(
+                    GachaHistoryRow(
                         wish_id=warp.id,
                         rarity=warp.rarity,
                         time=warp.time,
                         banner_type=warp.banner_type,
                         item_id=warp.item_id,
-                        account=self.account,
                         banner_id=warp.banner_id,
-                        game=Game.STARRAIL,
                     )
                 )
 
@@ -235,28 +227,24 @@ class URLImport(Button[GachaImportView]):
                 self._check_uid(signal)
 
                 records.append(
-                    GachaHistory(
+                    GachaHistoryRow(
                         wish_id=signal.id,
                         rarity=signal.rarity,
                         time=signal.time,
                         banner_type=signal.banner_type,
                         item_id=signal.item_id,
-                        account=self.account,
                         banner_id=None,
-                        game=Game.ZZZ,
                     )
                 )
         else:
             raise FeatureNotImplementedError(platform=self.account.platform, game=self.account.game)
 
-        await GachaHistory.bulk_create(records)
-
-        after = await GachaHistory.get_wish_count(self.account)
+        count = await GachaHistory.copy_rows(i.client.pool, self.account, records)
         await update_gacha_nums(i.client.pool, account=self.account)
 
         embed = DefaultEmbed(
             self.view.locale,
             title=LocaleStr(key="gacha_import_success_title"),
-            description=LocaleStr(key="gacha_import_success_message", count=after - before),
+            description=LocaleStr(key="gacha_import_success_message", count=count),
         ).add_acc_info(self.account)
         await i.edit_original_response(embed=embed)
@@ -80,6 +80,7 @@ class DeleteConfirmButton(Button[GachaLogManageView]):
 
     async def callback(self, i: Interaction) -> Any:
         await GachaHistory.filter(account=self.view.account).delete()
+        await GachaHistory.invalidate_stats((self.view.account.id,))
         embed = ErrorEmbed(
             self.view.locale,
             title=LocaleStr(key="gacha_log_delete_done_embed_title"),
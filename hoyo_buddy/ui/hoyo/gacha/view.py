@@ -15,7 +15,7 @@ from hoyo_buddy.constants import (
     MW_EVENT_BANNER_TYPES,
     STANDARD_ITEMS,
 )
-from hoyo_buddy.db import GachaHistory, GachaStats, get_dyk, get_last_gacha_num
+from hoyo_buddy.db import GachaHistory, GachaStats, get_dyk
 from hoyo_buddy.embeds import DefaultEmbed
 from hoyo_buddy.emojis import CURRENCY_EMOJIS
 from hoyo_buddy.enums import Game
@@ -26,8 +26,6 @@ from hoyo_buddy.utils import ephemeral
 from hoyo_buddy.utils.gacha import calculate_gacha_stats
 
 if TYPE_CHECKING:
-    import asyncpg
-
     from hoyo_buddy.db import HoyoAccount
     from hoyo_buddy.enums import Locale
     from hoyo_buddy.types import Interaction, User
@@ -36,20 +34,6 @@ if TYPE_CHECKING:
 GlobalStat: TypeAlias = Literal[
     "lifetime_pulls", "avg_5star_pulls", "avg_4star_pulls", "avg_3star_pulls", "win_rate"
 ]
-GET_RANKING_SQL = """
-SELECT
-    ranked.rank,
-    (SELECT COUNT(*) FROM gachastats WHERE game = $1 AND banner_type = $3) AS total_rows
-FROM (
-    SELECT
-        account_id,
-        ROW_NUMBER() OVER (ORDER BY {row} {order}) as rank
-    FROM gachastats
-    WHERE game = $1 AND banner_type = $3
-) ranked
-WHERE account_id = $2;
-"""
-
 RANK_ORDERS: Final[dict[GlobalStat, Literal["ASC", "DESC"]]] = {
     "lifetime_pulls": "DESC",
     "avg_5star_pulls": "ASC",
@@ -59,21 +43,6 @@ RANK_ORDERS: Final[dict[GlobalStat, Literal["ASC", "DESC"]]] = {
 }
 
 
-async def get_ranking(
-    pool: asyncpg.Pool,
-    *,
-    game: Game,
-    row: GlobalStat,
-    order: Literal["ASC", "DESC"],
-    account_id: int,
-    banner_type: int,
-) -> tuple[int, int]:
-    async with pool.acquire() as conn:
-        return await conn.fetchrow(
-            GET_RANKING_SQL.format(row=row, order=order), game.value, account_id, banner_type
-        )
-
-
 class ViewGachaLogView(View):
     def __init__(self, account: HoyoAccount, *, author: User, locale: Locale) -> None:
         super().__init__(author=author, locale=locale)
@@ -118,14 +87,14 @@ class ViewGachaLogView(View):
             return False
         return gacha.item_id in STANDARD_ITEMS[self.account.game]
 
-    async def get_ranking_str(self, pool: asyncpg.Pool, *, stat: GlobalStat) -> str:
-        rank, total = await get_ranking(
-            pool,
-            game=self.account.game,
-            row=stat,
-            order=RANK_ORDERS[stat],
+    async def get_ranking_str(self, *, stat: GlobalStat, value: float) -> str:
+        rank, total = await GachaStats.get_rank(
             account_id=self.account.id,
+            game=self.account.game,
             banner_type=self.banner_type,
+            stat=stat,
+            value=value,
+            order=RANK_ORDERS[stat],
         )
 
         if rank == 0 or total == 0:
@@ -136,7 +105,7 @@ class ViewGachaLogView(View):
         )
         return f"{top_percent} ({rank}/{total})"
 
-    async def get_stats_embed(self, pool: asyncpg.Pool) -> DefaultEmbed:
+    async def get_stats_embed(self) -> DefaultEmbed:
         lifetime_pulls = await self.get_pulls_count()
         if lifetime_pulls == 0:
             raise NoGachaLogFoundError
@@ -150,53 +119,41 @@ class ViewGachaLogView(View):
         bangboo_channel_pulls = await self.get_pulls_count(banner_type=5)
         lifetime_currency = (lifetime_pulls - bangboo_channel_pulls) * 160
 
-        last_gacha_num = await get_last_gacha_num(self.account, banner=self.banner_type)
+        gacha_stats = await calculate_gacha_stats(
+            account_id=self.account.id, game=self.account.game, banner_type=self.banner_type
+        )
 
         # Five star pity
         if not is_standard_ode:
-            last_five_star_num = await get_last_gacha_num(
-                self.account, banner=self.banner_type, rarity=5
-            )
-            current_five_star_pity = last_gacha_num - last_five_star_num
+            current_five_star_pity = gacha_stats.five_star_pity
             max_five_star_pity = BANNER_FIVE_STAR_GUARANTEE_NUMS[self.account.game][
                 self.banner_type
             ]
         else:
-            last_five_star_num = 0
             current_five_star_pity = 0
             max_five_star_pity = 0
 
         # Four star pity
-        last_four_star_num = await get_last_gacha_num(
-            self.account, banner=self.banner_type, rarity=4
-        )
-        current_four_star_pity = last_gacha_num - last_four_star_num
+        current_four_star_pity = gacha_stats.four_star_pity
         max_four_star_pity = 70 if is_standard_ode else 10
         if not is_standard_ode and current_four_star_pity > max_four_star_pity:
-            current_four_star_pity = last_gacha_num - last_five_star_num
+            current_four_star_pity = gacha_stats.five_star_pity
 
         # Three star pity
         if is_standard_ode:
-            last_three_star_num = await get_last_gacha_num(
-                self.account, banner=self.banner_type, rarity=3
-            )
-            current_three_star_pity = last_gacha_num - last_three_star_num
+            current_three_star_pity = gacha_stats.three_star_pity
             max_three_star_pity = 5
             if current_three_star_pity > max_three_star_pity:
-                current_three_star_pity = last_gacha_num - last_four_star_num
+                current_three_star_pity = gacha_stats.four_star_pity
         else:
-            last_three_star_num = 0
             current_three_star_pity = 0
             max_three_star_pity = 0
 
-        gacha_stats = await calculate_gacha_stats(
-            account_id=self.account.id, game=self.account.game, banner_type=self.banner_type
-        )
         banner_wins = gacha_stats.fifty_fifty_wins
         banner_5stars = gacha_stats.fifty_fifty_total
         total_five_stars = gacha_stats.total_five_stars
         total_four_stars = gacha_stats.total_four_stars
-        total_three_stars = await self.get_pulls_count(rarity=3, banner_type=self.banner_type)
+        total_three_stars = gacha_stats.total_three_stars
         banner_total_pulls = gacha_stats.total_pulls
         five_star_avg_pulls = gacha_stats.avg_pulls_per_five_star
         four_star_avg_pulls = gacha_stats.avg_pulls_per_four_star
@@ -309,7 +266,7 @@ class ViewGachaLogView(View):
         global_stats_parts.append(
             LocaleStr(
                 key="gacha_log_global_stats_lifetime",
-                lifetime=await self.get_ranking_str(pool, stat="lifetime_pulls"),
+                lifetime=await self.get_ranking_str(stat="lifetime_pulls", value=lifetime_pulls),
             ).translate(self.locale)
         )
 
@@ -318,7 +275,9 @@ class ViewGachaLogView(View):
                 LocaleStr(
                     key="gacha_log_global_stats_luck",
                     rarity=5,
-                    luck=await self.get_ranking_str(pool, stat="avg_5star_pulls"),
+                    luck=await self.get_ranking_str(
+                        stat="avg_5star_pulls", value=five_star_avg_pulls
+                    ),
                 ).translate(self.locale)
             )
 
@@ -327,7 +286,9 @@ class ViewGachaLogView(View):
                 LocaleStr(
                     key="gacha_log_global_stats_luck",
                     rarity=4,
-                    luck=await self.get_ranking_str(pool, stat="avg_4star_pulls"),
+                    luck=await self.get_ranking_str(
+                        stat="avg_4star_pulls", value=four_star_avg_pulls
+                    ),
                 ).translate(self.locale)
             )
 
@@ -336,7 +297,9 @@ class ViewGachaLogView(View):
                 LocaleStr(
                     key="gacha_log_global_stats_luck",
                     rarity=3,
-                    luck=await self.get_ranking_str(pool, stat="avg_3star_pulls"),
+                    luck=await self.get_ranking_str(
+                        stat="avg_3star_pulls", value=three_star_avg_pulls
+                    ),
                 ).translate(self.locale)
             )
 
@@ -355,7 +318,9 @@ class ViewGachaLogView(View):
             global_win_rate_stats = LocaleStr(
                 key="win_rate_global_stats",
                 title=title,
-                win_rate=await self.get_ranking_str(pool, stat="win_rate"),
+                win_rate=await self.get_ranking_str(
+                    stat="win_rate", value=gacha_stats.fifty_fifty_win_rate
+                ),
             ).translate(self.locale)
             global_stats += f"\n{global_win_rate_stats}"
 
@@ -371,7 +336,7 @@ class ViewGachaLogView(View):
 
     async def start(self, i: Interaction) -> None:
         await i.response.defer(ephemeral=ephemeral(i))
-        embed = await self.get_stats_embed(i.client.pool)
+        embed = await self.get_stats_embed()
         await i.followup.send(embed=embed, view=self, content=await get_dyk(i))
         self.message = await i.original_response()
 
@@ -389,7 +354,7 @@ class BannerTypeSelector(Select[ViewGachaLogView]):
     async def callback(self, i: Interaction) -> Any:
         self.view.banner_type = int(self.values[0])
         await i.response.defer(ephemeral=ephemeral(i))
-        embed = await self.view.get_stats_embed(i.client.pool)
+        embed = await self.view.get_stats_embed()
         self.update_options_defaults()
 
         button: GoToWebAppButton | None = next(
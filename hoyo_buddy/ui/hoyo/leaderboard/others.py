@@ -77,11 +77,8 @@ class LbPaginator(PaginatorView):
         )
 
     async def fetch_page(self) -> Page:
-        self.lbs = (
-            await Leaderboard.filter(game=self.game, type=self.lb_type)
-            .order_by(f"{'rank' if self.order == 'DESC' else '-rank'}")
-            .limit(10)
-            .offset(self._current_page * 10)
+        self.lbs = await Leaderboard.get_page(
+            type_=self.lb_type, game=self.game, order=self.order, page=self._current_page
         )
         return Page(embed=self.get_page_embed(self.lbs))
 
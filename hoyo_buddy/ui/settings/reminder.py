@@ -373,6 +373,10 @@ class NotesReminderMixin:
 
         await notify.save()
 
+        from hoyo_buddy.hoyo.auto_tasks.notes_check import NotesChecker  # noqa: PLC0415
+
+        NotesChecker.schedule(notify.id)
+
 
 class BaseReminderContainer(ui.DefaultContainer["SettingsView"], NotesReminderMixin):
     def __init__(self, items: Iterable[ReminderItem]) -> None:
@@ -1,31 +1,48 @@
 from __future__ import annotations
 
+import bisect
+import dataclasses
+import datetime
 import re
+import time
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import Literal
+from typing import TYPE_CHECKING, Any, ClassVar, Literal
 
 import aiohttp
 import chompjs
 from loguru import logger
+from tortoise import Tortoise
 
-from hoyo_buddy.constants import STANDARD_ITEMS
+from hoyo_buddy.constants import BANNER_INDEX_TTL, STANDARD_ITEMS
 from hoyo_buddy.db.models import GachaHistory, HoyoAccount, JSONFile
 from hoyo_buddy.enums import Game
 from hoyo_buddy.models.gacha import GIBanner, HSRBanner, ZZZBanner
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 HSR_BANNER_URL = "https://starrailstation.com/api/v1/warp_config"
 ZZZ_BANNER_URL = "https://zzz.rng.moe/api/v1/gacha/config?game=zzz"
 GI_BANNER_URL = "https://raw.githubusercontent.com/MadeBaruna/paimon-moe-api/refs/heads/main/src/data/banners.ts"
 
+HSR_BANNERS_FILENAME = "hsr_banners.json"
+GI_BANNERS_FILENAME = "gi_banners.json"
 
-async def fetch_hsr_banners(session: aiohttp.ClientSession) -> list[HSRBanner]:
+
+async def fetch_hsr_banner_data(session: aiohttp.ClientSession) -> dict[str, Any]:
     async with session.get(HSR_BANNER_URL) as resp:
         resp.raise_for_status()
         data = await resp.json()
-        return [
-            HSRBanner(id=int(banner_id), **banner)
-            for banner_id, banner in data.get("config", {}).get("banners", {}).items()
-        ]
+        return data.get("config", {}).get("banners", {})
+
+
+def parse_hsr_banners(data: dict[str, Any]) -> list[HSRBanner]:
+    return [HSRBanner(id=int(banner_id), **banner) for banner_id, banner in data.items()]
+
+
+async def fetch_hsr_banners(session: aiohttp.ClientSession) -> list[HSRBanner]:
+    return parse_hsr_banners(await fetch_hsr_banner_data(session))
 
 
 async def fetch_zzz_banners(session: aiohttp.ClientSession) -> list[ZZZBanner]:
@@ -38,7 +55,7 @@ async def fetch_zzz_banners(session: aiohttp.ClientSession) -> list[ZZZBanner]:
         ]
 
 
-async def fetch_gi_banners(session: aiohttp.ClientSession) -> list[GIBanner]:
+async def fetch_gi_banner_data(session: aiohttp.ClientSession) -> dict[str, Any]:
     async with session.get(GI_BANNER_URL) as resp:
         resp.raise_for_status()
         content = await resp.text()
@@ -48,40 +65,147 @@ async def fetch_gi_banners(session: aiohttp.ClientSession) -> list[GIBanner]:
 
     if not match:
         logger.error("Failed to find banners in GI banner data")
-        return []
+        return {}
 
     banners_str = match.group(1)
+    return chompjs.parse_js_object(banners_str)
 
-    banners_dict = chompjs.parse_js_object(banners_str)
-    banners_dict = {int(k): v for k, v in banners_dict.items()}
 
-    return [GIBanner(id=k, **v) for k, v in banners_dict.items()]
+def parse_gi_banners(data: dict[str, Any]) -> list[GIBanner]:
+    return [GIBanner(id=int(k), **v) for k, v in data.items()]
 
 
-def check_zzz_item_is_standard(item: GachaHistory) -> bool:
-    return item.item_id in STANDARD_ITEMS.get(Game.ZZZ, [])
+async def fetch_gi_banners(session: aiohttp.ClientSession) -> list[GIBanner]:
+    return parse_gi_banners(await fetch_gi_banner_data(session))
+
+
+async def update_banner_data(session: aiohttp.ClientSession) -> None:
+    """Fetch the banner catalogues used to calculate 50/50 win rates and persist them."""
+    try:
+        hsr_data = await fetch_hsr_banner_data(session)
+        if hsr_data:
+            await JSONFile.write(HSR_BANNERS_FILENAME, hsr_data)
+    except Exception:
+        logger.exception("Failed to fetch HSR banner data")
+
+    try:
+        gi_data = await fetch_gi_banner_data(session)
+        if gi_data:
+            await JSONFile.write(GI_BANNERS_FILENAME, gi_data)
+    except Exception:
+        logger.exception("Failed to fetch GI banner data")
+
+    HSRBannerIndex.clear_cache()
+    GIBannerIndex.clear_cache()
+
+
+async def _read_banner_data(filename: str) -> dict[str, Any]:
+    data: dict[str, Any] = await JSONFile.read(filename)
+    if not data:
+        # Never fetched on this database, fetch it once
+        async with aiohttp.ClientSession() as session:
+            await update_banner_data(session)
+        data = await JSONFile.read(filename)
+    return data
+
+
+class HSRBannerIndex:
+    """Featured 5 star item IDs of each HSR banner."""
+
+    _cached: ClassVar[tuple[float, HSRBannerIndex] | None] = None
+
+    def __init__(self, banners: Sequence[HSRBanner]) -> None:
+        self._featured = {banner.id: frozenset(banner.five_stars) for banner in banners}
+
+    @classmethod
+    async def get(cls) -> HSRBannerIndex:
+        if cls._cached is not None and time.monotonic() < cls._cached[0]:
+            return cls._cached[1]
+
+        index = cls(parse_hsr_banners(await _read_banner_data(HSR_BANNERS_FILENAME)))
+        cls._cached = (time.monotonic() + BANNER_INDEX_TTL, index)
+        return index
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        cls._cached = None
+
+    def get_featured(self, banner_id: int | None) -> frozenset[int]:
+        if banner_id is None:
+            return frozenset()
+        return self._featured.get(banner_id, frozenset())
 
 
-def check_hsr_item_is_standard(item: GachaHistory, hsr_banners: list[HSRBanner]) -> bool:
-    is_standard = item.item_id in STANDARD_ITEMS.get(Game.STARRAIL, [])
-    for banner in hsr_banners:
-        if item.banner_id == banner.id and item.item_id in banner.five_stars:
-            return False
-    return is_standard
+class GIBannerIndex:
+    """Featured 5 star item IDs of GI banners running at a given time.
 
+    Banners overlap, so the timeline is split at every banner start and end, and the union of
+    the featured items of the banners running in each segment is precomputed.
+    """
 
-def check_gi_item_is_standard(
-    item: GachaHistory, gi_banners: list[GIBanner], item_names: dict[int, str]
-) -> bool:
-    is_standard = item.item_id in STANDARD_ITEMS.get(Game.GENSHIN, [])
+    _cached: ClassVar[tuple[float, GIBannerIndex] | None] = None
 
-    for banner in gi_banners:
-        if banner.start_at <= item.time.replace(tzinfo=None) <= banner.end_at:
-            five_star_item_ids = banner.get_five_star_item_ids(item_names)
-            if item.item_id in five_star_item_ids:
-                return False
+    def __init__(self, banners: Sequence[GIBanner], item_names: dict[int, str]) -> None:
+        name_to_ids: defaultdict[str, set[int]] = defaultdict(set)
+        for item_id, name in item_names.items():
+            name_to_ids[name.replace(" ", "_").lower()].add(item_id)
 
-    return is_standard
+        intervals = [
+            (
+                banner.start_at,
+                # End times are inclusive
+                banner.end_at + datetime.timedelta(microseconds=1),
+                frozenset(
+                    item_id for name in banner.five_stars for item_id in name_to_ids.get(name, ())
+                ),
+            )
+            for banner in banners
+        ]
+
+        self._boundaries = sorted({t for start, end, _ in intervals for t in (start, end)})
+        self._featured = [
+            frozenset().union(*(ids for start, end, ids in intervals if start <= boundary < end))
+            for boundary in self._boundaries
+        ]
+
+    @classmethod
+    async def get(cls) -> GIBannerIndex:
+        if cls._cached is not None and time.monotonic() < cls._cached[0]:
+            return cls._cached[1]
+
+        banners = parse_gi_banners(await _read_banner_data(GI_BANNERS_FILENAME))
+        gi_data: dict[str, dict[str, str]] = await JSONFile.read(
+            "gi_gacha_data_en-us.json", default={}
+        )
+        index = cls(banners, {int(k): v["name"] for k, v in gi_data.items()})
+        cls._cached = (time.monotonic() + BANNER_INDEX_TTL, index)
+        return index
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        cls._cached = None
+
+    def get_featured(self, pulled_at: datetime.datetime) -> frozenset[int]:
+        i = bisect.bisect_right(self._boundaries, pulled_at) - 1
+        if i < 0:
+            return frozenset()
+        return self._featured[i]
+
+
+def check_zzz_item_is_standard(item: GachaHistory) -> bool:
+    return item.item_id in STANDARD_ITEMS.get(Game.ZZZ, [])
+
+
+def check_hsr_item_is_standard(item: GachaHistory, hsr_banners: HSRBannerIndex) -> bool:
+    if item.item_id in hsr_banners.get_featured(item.banner_id):
+        return False
+    return item.item_id in STANDARD_ITEMS.get(Game.STARRAIL, [])
+
+
+def check_gi_item_is_standard(item: GachaHistory, gi_banners: GIBannerIndex) -> bool:
+    if item.item_id in gi_banners.get_featured(item.time.replace(tzinfo=None)):
+        return False
+    return item.item_id in STANDARD_ITEMS.get(Game.GENSHIN, [])
 
 
 def get_gacha_icon(*, item_id: int, gacha_data: dict[str, dict[str, str]]) -> str:
@@ -93,8 +217,10 @@ class GachaStatsResult:
     total_pulls: int
     five_star_pity: int
     four_star_pity: int
+    three_star_pity: int
     total_five_stars: int
     total_four_stars: int
+    total_three_stars: int
     avg_pulls_per_five_star: float
     avg_pulls_per_four_star: float
     fifty_fifty_wins: int
@@ -111,33 +237,17 @@ async def calc_50_50_stats(*, account: HoyoAccount, banner_type: int) -> tuple[i
     if not five_stars:
         return 0, 0
 
-    gi_banners: list[GIBanner] = []
-    item_names: dict[int, str] = {}
-    hsr_banners: list[HSRBanner] = []
-
-    async with aiohttp.ClientSession() as session:
-        if account.game is Game.GENSHIN:
-            gi_banners = await fetch_gi_banners(session)
-            gi_data: dict[str, dict[str, str]] = await JSONFile.read(
-                "gi_gacha_data_en-us.json", default={}
-            )
-            item_names = {int(k): v["name"] for k, v in gi_data.items()}
-        elif account.game is Game.STARRAIL:
-            hsr_banners = await fetch_hsr_banners(session)
-
-    is_standards: list[bool] = []
-    for item in five_stars:
-        if account.game is Game.GENSHIN:
-            is_standard = check_gi_item_is_standard(item, gi_banners, item_names)
-        elif account.game is Game.STARRAIL:
-            is_standard = check_hsr_item_is_standard(item, hsr_banners)
-        elif account.game is Game.ZZZ:
-            is_standard = check_zzz_item_is_standard(item)
-        else:
-            logger.error(f"Unknown game for checking is_standard: {account.game}")
-            continue
-
-        is_standards.append(is_standard)
+    if account.game is Game.GENSHIN:
+        gi_banners = await GIBannerIndex.get()
+        is_standards = [check_gi_item_is_standard(item, gi_banners) for item in five_stars]
+    elif account.game is Game.STARRAIL:
+        hsr_banners = await HSRBannerIndex.get()
+        is_standards = [check_hsr_item_is_standard(item, hsr_banners) for item in five_stars]
+    elif account.game is Game.ZZZ:
+        is_standards = [check_zzz_item_is_standard(item) for item in five_stars]
+    else:
+        logger.error(f"Unknown game for checking is_standard: {account.game}")
+        is_standards = []
 
     status: list[Literal[50, 100]] = [50]
     wins = 0
@@ -151,43 +261,43 @@ async def calc_50_50_stats(*, account: HoyoAccount, banner_type: int) -> tuple[i
     return wins, status.count(50)
 
 
+GACHA_STATS_SQL = """
+SELECT
+  COUNT(*) AS total_pulls,
+  COUNT(*) FILTER (WHERE rarity = 5) AS total_five_stars,
+  COUNT(*) FILTER (WHERE rarity = 4) AS total_four_stars,
+  COUNT(*) FILTER (WHERE rarity = 3) AS total_three_stars,
+  COALESCE(MAX(num), 0) AS last_num,
+  COALESCE(MAX(num) FILTER (WHERE rarity = 5), 0) AS last_five_star_num,
+  COALESCE(MAX(num) FILTER (WHERE rarity = 4), 0) AS last_four_star_num,
+  COALESCE(MAX(num) FILTER (WHERE rarity = 3), 0) AS last_three_star_num
+FROM gachahistory
+WHERE account_id = $1 AND banner_type = $2;
+"""
+"""Nums follow the wish ID order, so the highest num of a rarity is the one of its last pull."""
+
+
 async def calculate_gacha_stats(
     *,
     account_id: int,
     game: Game,  # noqa: ARG001
     banner_type: int,
 ) -> GachaStatsResult:
-    account = await HoyoAccount.get(id=account_id)
+    """Calculate the stats of a banner type, cached until the account's gacha history changes."""
+    generation = await GachaHistory.get_stats_generation(account_id)
+    cached = await GachaHistory.get_cached_stats(account_id, generation, banner_type)
+    if cached is not None:
+        return GachaStatsResult(**cached)
 
-    last_gacha = (
-        await GachaHistory.filter(account=account, banner_type=banner_type).first().only("num")
-    )
-    last_gacha_num = last_gacha.num if last_gacha else 0
-
-    last_five_star = (
-        await GachaHistory.filter(account=account, banner_type=banner_type, rarity=5)
-        .first()
-        .only("num")
-    )
-    last_five_star_num = last_five_star.num if last_five_star else 0
+    account = await HoyoAccount.get(id=account_id)
 
-    last_four_star = (
-        await GachaHistory.filter(account=account, banner_type=banner_type, rarity=4)
-        .first()
-        .only("num")
+    _, rows = await Tortoise.get_connection("default").execute_query(
+        GACHA_STATS_SQL, [account_id, banner_type]
     )
-    last_four_star_num = last_four_star.num if last_four_star else 0
-
-    five_star_pity = last_gacha_num - last_five_star_num
-    four_star_pity = last_gacha_num - last_four_star_num
-
-    total_pulls = await GachaHistory.filter(account=account, banner_type=banner_type).count()
-    total_five_stars = await GachaHistory.filter(
-        account=account, banner_type=banner_type, rarity=5
-    ).count()
-    total_four_stars = await GachaHistory.filter(
-        account=account, banner_type=banner_type, rarity=4
-    ).count()
+    row = rows[0]
+    total_pulls: int = row["total_pulls"]
+    total_five_stars: int = row["total_five_stars"]
+    total_four_stars: int = row["total_four_stars"]
 
     avg_pulls_per_five_star = total_pulls / total_five_stars if total_five_stars else 0.0
     avg_pulls_per_four_star = total_pulls / total_four_stars if total_four_stars else 0.0
@@ -197,15 +307,21 @@ async def calculate_gacha_stats(
     )
     fifty_fifty_win_rate = fifty_fifty_wins / fifty_fifty_total if fifty_fifty_total else 0.0
 
-    return GachaStatsResult(
+    result = GachaStatsResult(
         total_pulls=total_pulls,
-        five_star_pity=five_star_pity,
-        four_star_pity=four_star_pity,
+        five_star_pity=row["last_num"] - row["last_five_star_num"],
+        four_star_pity=row["last_num"] - row["last_four_star_num"],
+        three_star_pity=row["last_num"] - row["last_three_star_num"],
         total_five_stars=total_five_stars,
         total_four_stars=total_four_stars,
+        total_three_stars=row["total_three_stars"],
         avg_pulls_per_five_star=avg_pulls_per_five_star,
         avg_pulls_per_four_star=avg_pulls_per_four_star,
         fifty_fifty_wins=fifty_fifty_wins,
         fifty_fifty_total=fifty_fifty_total,
         fifty_fifty_win_rate=fifty_fifty_win_rate,
     )
+    await GachaHistory.set_cached_stats(
+        account_id, generation, banner_type, dataclasses.asdict(result)
+    )
+    return result
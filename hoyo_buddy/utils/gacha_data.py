@@ -1,12 +1,17 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import time
+import unicodedata
+from collections import defaultdict
+from typing import TYPE_CHECKING, ClassVar
 
+import hb_data
 from loguru import logger
 from pydantic import ValidationError
 
-from hoyo_buddy.constants import LOCALE_TO_HOYO_LANG
+from hoyo_buddy.constants import GACHA_DATA_VERSION_CHECK_INTERVAL, LOCALE_TO_HOYO_LANG
 from hoyo_buddy.db.models import JSONFile
+from hoyo_buddy.enums import Game
 from hoyo_buddy.models.gacha_api import (
     GIGachaConfigResponse,
     HSRGachaCharacterListResponse,
@@ -24,6 +29,10 @@ ZZZ_GACHA_API_URL = (
     "https://starward-static.scighost.com/metadata/v1/zzz/ZZZGachaInfo.nap_global.{lang}.json"
 )
 
+GACHA_DATA_VERSION_FILENAME = "gacha_data_version.json"
+NGRAM_SIZE = 3
+"""Length of the longest substrings of item names indexed by GachaItemIndex."""
+
 GachaData = dict[str, dict[str, str]]
 
 
@@ -138,3 +147,136 @@ async def update_gacha_data(session: aiohttp.ClientSession) -> None:
                 await JSONFile.write(f"zzz_gacha_data_{lang}.json", zzz_data)
         except Exception:
             logger.exception(f"Failed to fetch ZZZ gacha data for lang={lang!r}")
+
+    await GachaItemIndex.bump_version()
+
+
+def get_gacha_data_filename(game: Game, lang: str) -> str:
+    if game is Game.GENSHIN:
+        return f"gi_gacha_data_{lang}.json"
+    if game is Game.STARRAIL:
+        return f"hsr_gacha_data_{lang}.json"
+    if game is Game.ZZZ:
+        return f"zzz_gacha_data_{lang}.json"
+    msg = f"Unsupported game: {game}"
+    raise ValueError(msg)
+
+
+class GachaItemIndex:
+    """Gacha item data of a game in a language, with an n-gram index of the item names.
+
+    Every 1 to NGRAM_SIZE long substring of the normalized names maps to the items that contain
+    it, so a search intersects a few small sets instead of scanning every name. Grams are made of
+    characters rather than words, which works for CJK names too.
+
+    Indexes are cached in process until update_gacha_data bumps the version of the gacha data,
+    which is shared by the processes through the database.
+    """
+
+    _cached: ClassVar[dict[tuple[Game, str], tuple[int, GachaItemIndex]]] = {}
+    _version: ClassVar[tuple[float, int] | None] = None
+    """Monotonic time until which the version is trusted and the version itself."""
+
+    def __init__(self, data: GachaData, *, version: int = 0) -> None:
+        self.data = data
+        self.version = version
+        """Version of the gacha data the index was built from."""
+        self._names = {
+            int(item_id): self.normalize(item.get("name", "")) for item_id, item in data.items()
+        }
+
+        ngrams: defaultdict[str, set[int]] = defaultdict(set)
+        for item_id, name in self._names.items():
+            for size in range(1, NGRAM_SIZE + 1):
+                for start in range(len(name) - size + 1):
+                    ngrams[name[start : start + size]].add(item_id)
+        self._ngrams = {gram: frozenset(item_ids) for gram, item_ids in ngrams.items()}
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Normalize an item name or a search query, equally normalized queries match the same items."""
+        # NFKC folds full-width and compatibility characters, casefold is a stricter lower()
+        return unicodedata.normalize("NFKC", text).casefold()
+
+    def search(self, query: str) -> set[int]:
+        """Return the IDs of the items whose name contains the query, case-insensitively."""
+        query = self.normalize(query)
+        if not query:
+            return set(self._names)
+
+        size = min(len(query), NGRAM_SIZE)
+        postings = sorted(
+            (
+                self._ngrams.get(query[start : start + size], frozenset())
+                for start in range(len(query) - size + 1)
+            ),
+            key=len,
+        )
+        candidates = set(postings[0]).intersection(*postings[1:])
+        if len(query) <= NGRAM_SIZE:
+            return candidates
+
+        # Grams can appear in the name out of order, so longer queries need to be checked
+        return {item_id for item_id in candidates if query in self._names[item_id]}
+
+    def search_ranked(self, query: str, *, limit: int | None = None) -> list[int]:
+        """Return the IDs of the items whose name contains the query, best matches first.
+
+        Exact matches come first, then the names that start with the query, then the names where
+        the query appears earlier, shorter names first when tied.
+        """
+        normalized = self.normalize(query)
+
+        def sort_key(item_id: int) -> tuple[bool, bool, int, int]:
+            name = self._names[item_id]
+            return (
+                name != normalized,
+                not name.startswith(normalized),
+                name.find(normalized),
+                len(name),
+            )
+
+        return sorted(self.search(query), key=sort_key)[:limit]
+
+    @staticmethod
+    async def _load(game: Game, lang: str) -> GachaData:
+        data: GachaData = await JSONFile.read(get_gacha_data_filename(game, lang), default={})
+
+        if game is Game.GENSHIN:
+            async with hb_data.GIClient() as client:
+                mw_costumes = client.get_mw_costumes()
+                mw_items = client.get_mw_items()
+                for costume in mw_costumes:
+                    data[str(costume.id)] = {"name": costume.name, "icon": ""}
+                for item in mw_items:
+                    data[str(item.id)] = {"name": item.name, "icon": ""}
+
+        return data
+
+    @classmethod
+    async def _get_version(cls) -> int:
+        if cls._version is not None and time.monotonic() < cls._version[0]:
+            return cls._version[1]
+
+        version: int = await JSONFile.read(GACHA_DATA_VERSION_FILENAME, default=0)
+        cls._version = (time.monotonic() + GACHA_DATA_VERSION_CHECK_INTERVAL, version)
+        return version
+
+    @classmethod
+    async def get(cls, game: Game, lang: str) -> GachaItemIndex:
+        version = await cls._get_version()
+        cached = cls._cached.get((game, lang))
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        index = cls(await cls._load(game, lang), version=version)
+        cls._cached[game, lang] = (version, index)
+        return index
+
+    @classmethod
+    async def bump_version(cls) -> None:
+        """Make every process reload the gacha data on its next version check."""
+        version: int = await JSONFile.read(GACHA_DATA_VERSION_FILENAME, default=0)
+        await JSONFile.write(GACHA_DATA_VERSION_FILENAME, version + 1)
+        cls._version = None
+        cls._cached.clear()
@@ -497,12 +497,18 @@ async def add_to_hoyo_codes(
         resp.raise_for_status()
 
 
+SLEEP_OBSERVERS: list[Callable[[SleepTime, float], None]] = []
+"""Callbacks called with the name and duration of every throttling sleep, used for metrics."""
+
+
 async def sleep(name: SleepTime) -> None:
     try:
         time = SLEEP_TIMES[name]
     except KeyError:
         logger.error(f"Invalid sleep time name: {name!r}")
         time = 0.0
+    for observer in SLEEP_OBSERVERS:
+        observer(name, time)
     await asyncio.sleep(time)
 
 
@@ -0,0 +1,110 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "autotaskbatch" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "task_type" VARCHAR(20) NOT NULL,
+    "account_ids" JSONB NOT NULL,
+    "lease_owner" VARCHAR(64),
+    "lease_expires_at" TIMESTAMPTZ
+);
+CREATE INDEX IF NOT EXISTS "idx_autotaskbat_task_ty_eaa539" ON "autotaskbatch" ("task_type");
+COMMENT ON TABLE "autotaskbatch" IS 'A batch of accounts waiting to be processed by an auto task.';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "autotaskbatch";"""
+
+
+MODELS_STATE = (
+    "eJztXetv2zgS/1cEf2kXyBWN81zjcIBsK4lvHTuwnXbbZkHQEh3rIlFePZK6i/7vR+ph60"
+    "EplizbUsMPDWqSQ1E/joYzw+Hwn4ZuKEizPoiybDjYHhi2Ohsj21bxo9VoCf80MNQR+U9m"
+    "uyOhAReLdStaYMOp5hJCjwJTCitMMbVsE8o2aTODmoVIkYIs2VQXtmpgUoodTaOFhkwaEq"
+    "p1kYPVvx0EbOMR2XNkkopvf5FiFSvoO7KCn4snMFORpkRewx8NUBU6Brce2MuFW9fD9pVL"
+    "QJ86BbKhOTpOEi2W9tzAKyoV27T0EWFkQhspofehw/VhCIq8oZMC23TQaszKukBBM+hodu"
+    "j9NwRFNjAFlAzHm7hH+pR/NY9PL04vT85PL0kTdySrkouf3nuuQfAIXSgGk8ZPtx7a0Gvh"
+    "4roG0p3PJSBAyHMkP6kYzKCqOSZK4to2DA1BzMY2s58Y1FPSURGsg4I12GuOC9BewV8I7Q"
+    "wo28Nhnw5at6y/NbegN6G/DcL83hcyuL9tS6P3x7/RYtJItVF4DrIwtxxZRpa1Neahfjjm"
+    "Ecx1VTeADa2nglgz6TnGKRgXkyFMeo5xEuOps9yGjWPkHGE2wlswcYycI5xEWDHhyzZMHK"
+    "fnGKdgvAUbx+k5xhGMTaQgpBdk4iQxR5eFbjH2TRJzdCPovqApQM+IPjMfslHCPaKa17uw"
+    "N1ipk2L2FLKuacEUyk8v0FRAosZoGkxL3PdOJKdjiNHEIH/c+eiRl4JYZrG079q5MZaGuO"
+    "6rag6NnwFDBaXrR7irje/qiTlryGuSl0Me7B1x3BG7UuNnBOgorrRKb+rxEojho/tWdHB0"
+    "KIE/zLGNCbE82tCW5w2WwyzS4CjTU0aaUitmumr6mousIQpuY8GYCf57W8ILVKmTTbANYY"
+    "qEhWnQdQIpwnQpQCzQhwj0KR8aMdi36uwBP2D3FZElQBMJ1pz89ZppmmCRcsXRkLnqwToS"
+    "YPBDIELDonT+86doZpirh9Gnq/YDhlgRvKm0yG/BILwsEHliLoPBCiqmFaolKAZGH4S+16"
+    "s9h7Y7JGzYgkmY+oWMC31fqHSUhmBQD+IDXo1LkMl7LVT5iRAif0DOwgVrC7djLnfjpm5G"
+    "n/t/ZS+ja9S7ECTg6xAOY+MXIYrBSAZfzjpTNpA6/A40hB9tKkWaHzNQ+ySOOjfi6H3z42"
+    "+xxcavabpV0WV7LRUZ6/Z/x8PBa55v1qp9j8lbflNU2T4SNNWy/9rVEl7KysHCkr55ZAUP"
+    "MHx/K/4Zh7fTH7ZdFAzLfjTdXtwO2jGsXXEGjBeCQx62jZEVYlyfK/cIbpRxz083YNzz01"
+    "TGpVUsMD15bQHIUHO6BA5b1VEWqlH6GLSK38GH4D+VBDoD2EnvVhpPxNu7CCt3xYlEa5pu"
+    "6TJW+v48NgmrToTPvcmNQH8KX4cDKc7xq3aTrw06JqoDAGy8AKiEXzsoDoq203bLU9g6pI"
+    "esDc5Ifaa6JpOWu9vQ/NaQiaQg3SHTV2UdyxMMj3TAf3HNY7eaRxz9TaV4nG5X+sdu5fjl"
+    "BmL8MlWKX8aFuALNJ0A/oZw+gwjdHl0GO5PUJTpiZMeyDR2oOpFzuXS6BOGhtLrGN7frmm"
+    "h1PmwLkwBnLimeRi71Lo2+lnpelmwNsL5IlQ8XcfkgOyaxzG2PJ5OgTtD3lAUrQVgTNLOU"
+    "OenPSTbzrnS5/nBwHTSPczQbYBtBvTjKUWoONRNqG+kLjQCQy2MRotmfwtCYT4+3EMBRiX"
+    "DS3EAknDRTZQKtigJpzYlRYUL8lFNpiNDx3ZskppZDLBVoA9PQtLy7OOwOOMoRlOfq41wj"
+    "/2xgLZCsQg1QuPJCndELxzsNb48zc+nDbGquFG+iFDsWAvoJgCbDL5fJ3FFCvhschdV18T"
+    "D1Bwk7emI/N4JsQHtY9axxLQ3GN71BS7hG2JqrWOjpCyjbD3g8EUcjsddvCTcGfoJqSxjb"
+    "0BRGUNUe8M1w8IfYC6p8GuHEVB7w169fW8JXhDW6Y/jVwIj8MI0HPBlOWsIEQdOiG5eTOd"
+    "JVK761eRgFhjrsmN6jtvqY6oILEZVz0GAPpqHnivu92Tw5uWh+PDm/PDu9uDi7/LjyySWr"
+    "sgzIdu+afhIRnFMiJqJgJ5G+MkykPuI/0HLDIIj7wMlaOZQ3jX8IMdAGwQ/787vPoUa/NX"
+    "RDVk/DXDZYvvd4m6NM/3vQeh5qXbIP3vGAtBC0CJjej9VzPd7hnvgde+Kd3CJ0t+JzN/Dt"
+    "QXpGDMEwR2/IkxGami1OW3Jn6AxWqmqWctaqEupYZbbzY8KzoI6b7OXA22yN8V1vJPaB2P"
+    "4yHhONdqGaUBPgdGlZD/h22GkJt0gnaxRVUcngDVJ6dz+SwFWvM+kNiZZ855hImBHzkvT3"
+    "gMW7DhjfiN3h55YgLgwZakvyJJlG1SnGywPu3V6DyY0kTqRRS1D1R0BWLEj3HDVoElCmmi"
+    "E/AVu1NUT07Zvel3vQla6IQi6Roc3VpSOQ1yFqOakVx2Pxvk806B8/fhBlASraEkDLou9K"
+    "tHFx1AVkJvt9aXBNaOdUC1hhT4gHw1ux/6UlQGzokFKaU5UwkwtKJVRwuqiwFg8MzWXalq"
+    "NHETdJl7a3WVa5LzZrKfCt+JVFSpBq9wbi6Avbwd1mWP3tLxNJjC8exGCzQRApkycaJ0pZ"
+    "QhxOtbZ3axGIE55JhJVC8xim47N46FnUIHnRHDpJ0L6WOsnZBmvEWeoScRZfIf5HVVr2Mp"
+    "HuMo4QleAprtSqUZqjuCoRf27gRc/dtmY5HULVR5n+Brfhavt7X+F+jqlxH8POs5m8Javu"
+    "+OMmxwtIq1Qp6tbFnN2mlgQwPaTEb14T/PYersODT8sLPuXbMEd8G4Zvw3jAdm+J9MAYaS"
+    "xVaF2ZqQgpuhxqdpA0bnk/5xpmbtvLhkDGrguXmruWmgeSAKolG6Yi6VMU/aZY9dlywGuJ"
+    "Vi0rIwq4yfP6B57X51Giu6Na7r6dBMZV9+D6bnX38k+u5wax1viVfLCmMulu67fRzxWgnS"
+    "tA3GzMbzYyvu4SgNsy91N18Mud/WlvevcVNHU3bToz9DFUm6lzz0g7vG7Hc6jXWQVHmL4Z"
+    "a4nJOjoRouLngCLykFToeTMchWn4mZ+dbOXyVIVlLVZbLUDXUJ7DjOj7SH3mIvRIW+4w6v"
+    "5FteY+KMFpphDnTKnv2eTB93tZokJTsbkVFCLiVlBWFL4JTdVe5uDMNUHNgC3NLC8Srcgj"
+    "FVsViVT0ta08snhN8VZZPrzgbQ5cjOqNg5eL5yI0hYA7QIhX2eecHD0HYn7r/THZcaWQAp"
+    "ZK7BWgQYth22SBFiN8k/gdLNlBedKNZzuokFcwOYsVtLky9kIq7NWvi59kb05912cydnMG"
+    "pXlUxkFGoVf8KavMQ2V7U6LoxdRCnky4vCUt3YtSYdlYdT1UU2eubQ4WDjNbXSp8ScK3Ci"
+    "F8fgRn9ORtGoZXmgHTmDBJG4NxRomrCWQGSt3hfbsvCXcjqdMb9/xdkpWrxK2M7jaNJLHP"
+    "wPV0C1xPOa6puJ5sgevJ4XD9+OFjZWF9UTEwmYlpM/AME3EG5Rbrr2Sxcr/qtkbrYYyusF"
+    "nLsLpiVm+62TUnDUPG9o5yxwUfvBviyC0tniyuftvUlHXznpAP09QzFL/8BYfrDb+E3iAb"
+    "xpPKunMn4waNNUldPoassINd5Dwg8uI534WJa4q6YLrzdHfoWZVRzqQREaKaJOSIAXm+CZ"
+    "DxuJcQkOcpQM4WBYD0iGoJ5PHJBkAen6TnhTmJA2miRz8ZZJFFb0196GVv+EkajSVx3BJo"
+    "7s4OWQElmk1TLpTncpPvPv2zT3z1WJWfcicwCtHUklXLF54LZ6qpMsN6yDqMsSbiZzEiaO"
+    "qqbgBdxaru6GBhqKwN7VSjjE28P1fLFk7csjdvFKI/L4E8R/KTypCjr1yfGaPlPBrdaKCh"
+    "qiZSEGLEumUiG6PkuCa/fRcimtEgJ7RJYo5uCrpTh3F2YENwfVp+81IauIoJXwqjGxBzeG"
+    "PRHNCygwWpUOJpZgclnOuoVk7Juh3rcGfF5X4vhU3RiU12wae2MlNLVowtZzbcA5/Yykws"
+    "Xay2nNlIF3xqqzC1nnVSfF5j9HxSDzyp/iXsOVXSEBXXReOuacrgSCFoKazdvPScIUlKnj"
+    "kkzvKspIiefaRpQNagSvErIpxSO+ES6sASimfMO+IZ86qXMS89SDGUiYvmMGasAW2f7uqP"
+    "EdJW99qxoYwnTq4PpLEwcWvOWg7zQBFPJVRTKNxEe1tCMTBsZK0z+9UIiVwhvDHQgIVsmz"
+    "w1A7wg5dfrEPrBvC6I41C/VV3Ms5mKZnAEr3HW5uBEE0fWB5KcMd+eMu6+RCLge1V3lBXt"
+    "Te9smwWteKb68vWhX+Nyrg0kcNnw7f5yLp7rv2yztiJHYfoIKsicGqQjlmQMV2cKRy3WsO"
+    "SjMMFhqdVZGCLd+FGYHYtN9rm2zQIvU0637T3sUuzc9KRP0q00mLQEYlSo6BnpCNtAmwb3"
+    "m3dupDGplInREi4m3zO4GvWkQXd807trCVTIzkwVYcWaq4tQQ/fKdtC9vW5597UDRX8MVf"
+    "vXrHsNgmvWw00aBYQ8P1rCj5Ywp/EZak6+A9orCn46u6JHAOvrfoymqsWMSL6MRLWYFbtX"
+    "dVBLvT2GH5ncXiCi7+RhQMUzI4/9EqU60AXtjX9+VnxvriJGTNhFyjBiYh7UdCMG04a7uh"
+    "xlbcQEKQO4AXMQA4YgV9h+2ffyQ9STMVVojx8wVVRuQed+NJIGnS8EI6KGtsHd8LM0InLz"
+    "AV/3gPTnndRtCadEpx2Pgl9nD/iOaKvnbosuUYIJ7YXXwv91STsnjwHd3rgzvKeW0u8PWO"
+    "rcDMHwCnwWR9Sp5LaRRp+kLlg/9piMqy1OiHlDujluugpz0OsxGdO4MxInnRvQEUdkJMdk"
+    "YJ96XWkIxpPhSCIFdGx9cSCOwFVvPL53y85ddf22NxDJjwuvyzYdFe2TDrXXvSfPJ7M/Jg"
+    "W/b6h2e5x20rw4XzEZ/ZHFX+Nbsd9PLsz8zp1W+RHd3p5P4VCzKDmP46hC+KAbY79liD6f"
+    "0qpMKfWNFZnLMB2fxANPoqfaErPGRuYz1JJzOdahpqWnm0+S18w6L2P99wRTUQyT1G8QQm"
+    "rye0t2SqLybAwZ5PsD8awSCPpR2dugmNJFnc7Il4GkPScCdm5oDIU+G78IYb3ueCkDN38x"
+    "YOsEG60jKWrB28HuBaEnBTJOYG8EX4j67SE4NxzTAlM0M8zc7BenfXvo8dsE3sBVK4cKp6"
+    "/uXSur0F/GHkE4LDh9gyAclHyYENBqHJHZ08bAXnao07cPNEiGmAA6ffs1aF/LdGjHm0WN"
+    "ZgSNJmNGzSdAP6KcrvIIHXeWR6O0VCBTOWgjPVdmyTjd/qIDGvPp8Ra72LsOD5hbZjFEE4"
+    "QcUh/SHz9+FIM0QbhXSJsVhtRGUPegKSpUU3rgR/pZm7tAWeZNOhcl5KtWfNUqyrdxUs6w"
+    "yfWrKLYJWg5uciUrCm6CloO7Zbzga6kLgiOvGzpciiYu2LXtu5u0BVs5TlyoGE6TAMJ0h0"
+    "kwU9U5L5vlJ+EukrwuEqqpg7yHQyNEB0t89O+Zg2WKujB1VM1WsfWBPvY/W5gB+wi5TsRZ"
+    "ubEEUA4O+ecOtIrR8yCdAwfpKKqlq5alEixz5RSL0x0uo9g7/QRA0353JLyjKib93Jvvqp"
+    "5mLIdqEgrDoHWvZyrZJM1Lh7TLkZukQhtAscAUyzZ0oOpEk9gWEberHu2pxoDwxFDxzdIt"
+    "wajtRmnRfEhlZkKqZ/ajnOaKiExVnjcYBotfc5RlssB1m8oYLfyw1+umyDMyrdSbwtjohU"
+    "jqeVy2eXa2wVYDaZV+Fxiti0UHLXLt2vjN6wngTpIlkSfazETL6cp7iISnTCpBRS8/jOjn"
+    "/wF+x+Vz"
+)
@@ -0,0 +1,135 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "autotaskrun" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "task_type" VARCHAR(20) NOT NULL,
+    "started_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "finished_at" TIMESTAMPTZ,
+    "total" INT NOT NULL DEFAULT 0,
+    "batch_count" INT NOT NULL DEFAULT 0,
+    "completed_batches" INT NOT NULL DEFAULT 0,
+    "success_count" INT NOT NULL DEFAULT 0,
+    "error_count" INT NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS "idx_autotaskrun_task_ty_96731b" ON "autotaskrun" ("task_type");
+COMMENT ON TABLE "autotaskrun" IS 'A single run of an auto task, shared by all scheduler processes that take part in it.';
+        CREATE TABLE IF NOT EXISTS "autotaskoutcome" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "account_id" INT NOT NULL,
+    "success" BOOL NOT NULL,
+    "created_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "run_id" INT NOT NULL REFERENCES "autotaskrun" ("id") ON DELETE CASCADE,
+    CONSTRAINT "uid_autotaskout_run_id_1d3c69" UNIQUE ("run_id", "account_id")
+);
+COMMENT ON TABLE "autotaskoutcome" IS 'The final result of an account in an auto task run.';
+        DELETE FROM "autotaskbatch";
+        ALTER TABLE "autotaskbatch" ADD "run_id" INT NOT NULL;
+        ALTER TABLE "autotaskbatch" ADD CONSTRAINT "fk_autotask_autotask_4cbe7077" FOREIGN KEY ("run_id") REFERENCES "autotaskrun" ("id") ON DELETE CASCADE;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "autotaskbatch" DROP CONSTRAINT IF EXISTS "fk_autotask_autotask_4cbe7077";
+        ALTER TABLE "autotaskbatch" DROP COLUMN "run_id";
+        DROP TABLE IF EXISTS "autotaskrun";
+        DROP TABLE IF EXISTS "autotaskoutcome";"""
+
+
+MODELS_STATE = (
+    "eJztXetv2zgS/1cEf9k9IFc0zqtrHA6QHSXxbWIHttPdtlkQtETHvEiUT4+m7qL/+5F62H"
+    "pQiiXLttTwQ4Oa5FDUj6PhzHA4/LtlmBrS7XeyqpoucQamg2dj5DiYPNmtjvR3i0AD0f/k"
+    "tjuSWnCxWLdiBQ6c6h4h9CkIo7CjFFPbsaDq0DYzqNuIFmnIVi28cLBJaClxdZ0VmiptSK"
+    "nWRS7B/3MRcMwn5MyRRSu+/EWLMdHQN2SHPxfPYIaRrsVeIxgNwBobg1cPnOXCq+sT58oj"
+    "YE+dAtXUXYOkiRZLZ26SFRUmDit9QgRZ0EFa5H3YcAMYwiJ/6LTAsVy0GrO2LtDQDLq6E3"
+    "n/DUFRTcIApcPxJ+6JPeWf7ePTi9MPJ+enH2gTbySrkosf/nuuQfAJPSgGk9YPrx460G/h"
+    "4boG0pvPJaBAqHOkPmMCZhDrroXSuHZNU0eQ8LHN7ScB9ZR2VAbrsGAN9prjQrRX8JdCOw"
+    "fK7nB4ywZt2Pb/dK+gP2G/Tcr8/hcyeLjrKqNfj//Bimkj7KDoHORhbruqimx7a8wj/QjM"
+    "Y5gb2DCBA+3nklhz6QXGGRiXkyFceoFxGuOpu9yGjRPkAmE+wlswcYJcIJxGWLPgyzZMnK"
+    "QXGGdgvAUbJ+kFxjGMLaQhZJRk4jSxQJeHbjn2TRMLdGPovqApQF8Re2YxZOOEe0S1qHdh"
+    "b7AyJ8XsOWJds4IpVJ9foKWBVI3ZNrmWeOCdSE/HkKCJSf9489GnLwWJymPpwLVzYy5Ned"
+    "1X3RwaP0KGCkvXj/BWm8DVk3DW0NekL4d82HvyuCdfKq0fMaDjuLIqo20kSyCBT95bscGx"
+    "oYT+MNcxJ9Ty6EJHnbd4DrNYg6NcTxltyqyY6arpay6ylix5jSVzJgXvbUsvEDMnm+SY0h"
+    "RJC8tk6wTSpOlSgkRiD5HYU961ErBv1dkjeSTeKyJbghaS7Dn96zfTdcmm5ZqrI2vVg30k"
+    "wfCHRIWGzeiC50/RzLRWD2NPx84jgUST/Km06W/JpLwsUXliLcPBSpiwCmxLmknQO+nW79"
+    "WZQ8cbEjEdyaJM/ULHhb4tMBulKZnMg/hIVuOSVPpeC6w+U0IUDMhdeGBt4XYs5G7c1M0Y"
+    "cP/P7GX0jHoPghR8PcphfPxiRAkY6eCrWWeqBtKA34COyJPDpEj7fQ5qH+VR70Ye/dp+/4"
+    "/EYhPUtL2q+LK9loqcdfs/4+HgNc83b9V+IPQtv2hYdY4kHdvOX7tawitZOXhYsjePreAh"
+    "hr/eyX8m4e3dDrseCqbtPFleL14H3QTWnjgD5gvFoQjbJshKMW7AlXsEN86456cbMO75aS"
+    "bjsioemL68tgHkqDmXFA4HGygP1Th9Alot6OBd+J9aAp0D7KR/p4wn8t19jJUv5YnCatpe"
+    "6TJR+ut5YhJWnUh/9Cc3EvspfR4OlCTHr9pNPrfYmJgOAIj5AqAWfe2wOCyKm2guKbYDty"
+    "aoZvdtD99FBStjykCIIZiG74qqTfiJ/I6WG6r8oXI68nurH4qbKv1r/thA4X/FsqreOBi6"
+    "jmp685ZpHoRNNjIQzEjjV02ECVVjZ5hAnSq/Np0TT70nUaU5qshLFMm0ZVCyD47C/CXk3I"
+    "iZ9pfQonerRdcm6KEZYje6UpXz0R7GObsz/aJC96FqIfbWJRS5OGUFKtwhuJO+gzYk+jKQ"
+    "IQ3R6QJxJ1Q6odIJlW4Nb446F6D/uioXakMbeHqZJ1RHTLkK1a9Q4Tp63d3qu0Ed+IykBb"
+    "QCXynPBbyjpwjfqfCdNtV3SkWuVU5niVMKnaVmOgs1abE9LzWzCVLhUTywR5GtpnqBdWLV"
+    "fn/K5/tDLxVrtLxtTZARNpCJWYLqTSKnmsaCqaIamPq73QXw49K+SRQD/0hhDkzRvUn0kG"
+    "WZVmHsElRvBrkCUVYJAcn7uLsB4dXvI6RD733SYGaF/tRPucsyxmP8Fmw3VIRGZKejQXjs"
+    "0qfQoz3knbmM1R/leRVU2nJ3Zyy/tFRqN9LukBV4Zlzbj1V4YgMW2zg7NuiT6G9q0yfpdm"
+    "XW7za05MMGZv2HTKv+Q9Ko16D1DNgnVHBrJ0YnNnfiyrFrO6YBsEHlXKEwsxThoQLNWl+8"
+    "rhsSaBbAtrAocNaS4WkWijjLom9k6FmebA2xvsiUDxdJ+aC6loXY9jfjyTSoE/Qty8pLEj"
+    "YEzTxvkPLnJJ95V86g2+HgOmye5Gg+wA6CRnmU49QCai7UDjIWVD0vthEQodmfwtCaT4+3"
+    "EMBxiXDS3kAknLQzZQKrSvgt5uYLsCB5Lqg0xOjEgbI0prZLLRXoAMvU9cLBNtwOBMoxlO"
+    "f4aa7Tfw6wF0jFUAcMrqJQ5/Qi8M7C2+fMQvown1ooxZsoxa6NgHECoMVxjuYyd5xQHFCN"
+    "w+q5eLj6g0JcIxWcFEM2pD2seta6Vgbjm/6gI10jYs8xkfrGAqrOIxlP5NFI7t92pBuTPE"
+    "PckcYOtKQRxPojuRkOfpf7YVVAI51Y2iP5/PlzR/qMiM4OMX42CaI/LPORTIaTjjRB0LJZ"
+    "DM1kjgzsfcCHV2CYw47rPerip0wXXISoYaF6v7XbJycX7fcn5x/OTi8uzj68X/nk0lV5Bm"
+    "S3f80+iRjOrwb0hd7RLSP6HkIna+1Q3jSUL8JAdYrlo8JLZ98auqGrp2ktWzzfe7LNUa7/"
+    "PWw9j7Su2Afv+kDaCNpmGCG5eq7PO8ITv2NPvFtYhO5WfO4Gvj1Iz5ghGOXoTQMCojQNW5"
+    "wqiwcgmaoZHzRSC3WspFOn+hPGCeFZUsdN93LgbbbW+L4/km+B3P00HlONdoEtqEtwurTt"
+    "R3I37HWkO2TQNYqpqHTwJi29fxgp4Krfm/SHVEu+dy126k9l/T0S+b4Hxjfy5fCPjiQvTB"
+    "XqS/oklcWEa+bLI+nfXYPJjSJPlFFHwsYToCsWZHuOOrQoKFPdVJ+Bgx0dUX37pv/pAVwq"
+    "V1QhV+jQ5njpSvR1qFpOa+XxWH64pRr09+/fqbIANX0JoG2zd6XauDy6BHQmb2+VwTWlnT"
+    "MtYIU9JR4M7+TbTx0JEtOAjNKaYspMYWzC4VVwtqjwFg8CrWXWlqNPkTRJl46/WVa7LzZv"
+    "KQis+JVFSpHq9gfy6BPfwd3lWP3dTxNF5sVogzDUtnCM9oqymTHaP1MkLyJaqXmM0olZPP"
+    "Qs6pC+aAGdJGzfSJ3kbIM14ixziThLrhD/ZSotf5nIdhnHiCrwFNdq1ajMUVwgGHSnngcv"
+    "8KLvbVvznA6R6qNcf4PXcLX9va9wP9fShY9h5xcsvCWr7vj9Jqf2aKtMKerVJZzdFudEUH"
+    "ZISdC8IfjtPVxHBJ9WF3wqtmGOxDaM2Ibxgb28o9KDEKTzVKF1Za4ipBlqpNlBbpYq+jk3"
+    "8DKpvWwI5Oy6CKm5a6l5IAmAbdW0NMWYovg3xavPlwN+S7RqWRtRIEye1z/woj6PCt0d9X"
+    "L37SQwrr75YHaru1efEKYwiI3Gr+KDNSIZZemNfqEA7VwBEmZjcbOR83VXANyW19HUB7/C"
+    "F9LsTe++gpbh3eTMDX2M1Obq3DPajqzbiWudm6yCI8LejLfE5B2diFCJc0AxeUgrjKKXrk"
+    "RpxJmfnWzlitvTqlqstlqArqE6hznR97H63EXoibXcYdT9C7bnASjhaaYI50yZ79kSwfd7"
+    "WaIiU7G5FRQhElZQXhS+BS3sLAtw5pqgYcBWZpaXiVYUkYqdmkQqBtpWEVm8pnirLB9d8D"
+    "YHLkH1xsErxHMxmlLAHSDEq+pzTq5RALGg9f6Y7LhWSAEbU3sF6NAukiQ2Tfgm8TtYsoPq"
+    "pJvIdlAjr2B6Fmtoc+XshdTYq98UP8nenPqez2Ts5QzK8qiMw4xCr/hTVpmHqvamxNFLqI"
+    "UimXB1S5q4E3IH2oGOZ55tDhYuN1tdJnxpwrcKIfz6BM7YydssDK90E2YxYZo2AeOMEdcT"
+    "yByULocP3VtFuh8pvf64H+ySrFwlXmV8t2mkyLccXE+3wPVU4JqJ68kWuJ4cDtf377a4gG"
+    "PHsL5gAixuYtocPKNEgkGFxfozWazCr7qt0XoYoytq1nKsroTVm212zWnDiLG9o9xx4Qfv"
+    "hTgKS0ski2veNjVj3aIn5KM0zQzFr37BEXrDT6E3qKb5jHl37uTcoLEmacrHkBd2sIucB1"
+    "RefOUdAsgWMWuKpmC683R36CtWUcGkETGihiTkSAB5vgmQybiXCJDnGUDOFiWA9IkaCeTx"
+    "yQZAHp9k54U5SQJpoacgGWSZRW9Nfehlb/hRGY0VedyRWO7OHl0BFZZNUy2V53KT7z77s0"
+    "999QSrz4UTGEVoGsmq1QvPhTvVscqxHvIOY6yJxFmMGJoGNkxgYIIN1wALExe6PplP/GZu"
+    "UY5nsMX6EqhzpD5jjhx95frMBK3g0fhGAwtVtZCGECfWLRfZBKXANf3texCxjAYFoU0TC3"
+    "Qz0J26nLMDG4Ib0Iqbl7LA1Sz4UhrdkFjAm4jmgLYTLkilEk9zO6jgXEe9cko27ViHNyse"
+    "9/spbMpObLoLMbW1mVq6Ymw5s9EexMTWZmLZYrXlzMa6EFNbh6n1rZPy85qgF5N64EkNLm"
+    "EvqJJGqIQumnRNMwZHGkVL4+3mZecMSVOKzCFJluclRfTtI10Hqg4xw6+McMrsREioA0so"
+    "kTHvSGTMq1/GvOwgxUgmLpbDmLMGdAO6q99HSF/da8eHMpk4uTmQJsLE7TlvOSwCRTKVUE"
+    "Oh8BLtbQnFwHSQvc7s1yAkCoXwJkADNnIc+tQc8MKUX69DGATzeiCOI/3WdTHPZyqWwRG8"
+    "xlmbgxNPHNkcSArGfPvKuPcSqYDvVd1RXrQ3u7NtFrYSmeqr14d+jsu5NpDAVcO3+8u5RK"
+    "7/qs3amhyFuUVQQ9bUpB3xJGO0Olc46omGFR+FCQ9Lrc7CUOkmjsLsWGzyz7VtFniZcbpt"
+    "72GXcu+mr3xU7pTBpCNRowKjr8hAxAH6NLzfvHejjGmlSo2WaDH9nsHVqK8MLsc3/fuOxI"
+    "TszMKIaPYcLyINvSvbweXddce/rx1oxlOkOrhm3W8QXrMebdIqIeTF0RJxtIQ7jV+h7hY7"
+    "oL2iEKeza3oEsLnux3iqWsKJ5MtJVEt4sXt1B7XS22PEkcntBSL6Rh8GMJmZReyXONWBLm"
+    "hv/f2j5ntzNTFioi5SjhGT8KBmGzGENdzV5ShrIyZMGSAMmIMYMBS50vbLvpcfqp6MmUJ7"
+    "/EiYonIHeg+jkTLofaIYUTW0C+6HfygjKjcfyXUfKH/eK5cd6ZTqtONR+OvskdxTbfXca3"
+    "FJlWBKe+G3CH59YJ3Tx4DL/rg3fGCW0m+PROndDMHwCvwhj5hTyWujjD4ql2D92GM6rq48"
+    "oeYN7ea47SnMYa/HdEzj3kie9G5ATx7RkRzTgX3sXypDMJ4MRwotYGO7lQfyCFz1x+MHr+"
+    "zcU9fv+gOZ/rjwu+yyUbE+2VD7lw/0+XT2x7Tgtw3Vbp/TTtoX5ysmYz/y+Gt8J9/ephdm"
+    "cedOp/qIbn/Pp3SoWZxcxHHUIXzQi7HfMkRfTGldppT5xsrMZZROTOKBJ9FXbalZ4yDrK9"
+    "TTczk2oK5np5tPkzfMOq9i/fcFU1kM09RvEEJm8vtLdkai8nwMOeT7A/GsFggGUdnboJjR"
+    "RZPOyFeBpDOnAnZu6hyFPh+/GGGz7nipArdgMeDrBButIxlqwdvB7gWhZw1yTmBvBF+E+u"
+    "0hODddywZTNDOtwuyXpH176InbBN7AVSuHCqev710rq9Bfzh5BNCw4e4MgGpR8mBDQehyR"
+    "2dPGwF52qLO3D3RIh5gCOnv7NWzfyHRox5tFjeYEjaZjRq1nwD6igq7yGJ1wlsejtDBQmR"
+    "x0kFEos2SSbn/RAa359HiLXexdhwfMbascoilCAWkA6ffv38tBmiLcK6TtGkPqIGj40JQV"
+    "qhk9iCP9vM1doC2LJp2LE4pVK7lqleXbJKlg2PT6VRbbFK0AN72SlQU3RSvA3TJe8LXUBe"
+    "GR1w0dLmUTF+za9t1N2oKtHCceVBynSQhhtsMknKn6nJfN85MIF0lRFwnT1EHRw6ExooMl"
+    "PvrXzCUqQ12aulh3MLHfscf+ewszYB8h16k4Ky+WAKrhIf/CgVYJehGkc+AgHQ3bBrZtTL"
+    "EslFMsSXe4jGK/GCcAWs4vR9IvTMVkn3v7l7qnGSugmkTCMFjd65lKNknz0qPtCuQmqdEG"
+    "UCIwxXZMA2CDahLbIuJ11Wc9NRgQkRgquVm6JRiN3Sgtmw+pykxIzcx+VNBckZGF1XmLY7"
+    "AENUd5Jgtct6mN0SIOe71uinxFlp15UxgfvQhJM4/Lts/ONthqoK2y7wJjdYnooEWhXZug"
+    "eTMB3EmyJPpEh5toOVt5j5CIlEkVqOjVhxH9+D/aLBp7"
+)
@@ -0,0 +1,124 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "redeemcode" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "game" VARCHAR(32) NOT NULL,
+    "code" VARCHAR(32) NOT NULL,
+    "status" VARCHAR(16) NOT NULL DEFAULT 'valid',
+    "locked_servers" JSONB NOT NULL,
+    "updated_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT "uid_redeemcode_game_51d7e6" UNIQUE ("game", "code")
+);
+COMMENT ON COLUMN "redeemcode"."game" IS 'GENSHIN: Genshin Impact\nSTARRAIL: Honkai: Star Rail\nHONKAI: Honkai Impact 3rd\nZZZ: Zenless Zone Zero\nTOT: Tears of Themis';
+COMMENT ON COLUMN "redeemcode"."status" IS 'VALID: valid\nEXPIRED: expired\nINVALID: invalid\nMAX_USES: max_uses';
+COMMENT ON TABLE "redeemcode" IS 'Status of a redemption code learned from redeem attempts, shared by all accounts.';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "redeemcode";"""
+
+
+MODELS_STATE = (
+    "eJztXetv2zgS/1cEf9k9IFfUzqtrHA6QHSXxrWMHttPdtlkQtETHukiUT4+m7qL/+5F62H"
+    "pQiiTLttTwQ4Oa5FDUj6PhzHA4/LulGwrSrHeiLBsOtkeGrS6myLZV/GS1usLfLQx1RP6T"
+    "2e5EaMHVatuKFthwrrmE0KPAlMIKU8wt24SyTdosoGYhUqQgSzbVla0amJRiR9NooSGTho"
+    "RqW+Rg9X8OArbxhOwlMknFl79IsYoV9A1Zwc/VM1ioSFMir+GPBqgKHYNbD+z1yq0bYPva"
+    "JaBPnQPZ0BwdJ4lWa3tp4A2Vim1a+oQwMqGNlND70OH6MARF3tBJgW06aDNmZVugoAV0ND"
+    "v0/jlBkQ1MASXD8SbuiT7ln5322eXZh9OLsw+kiTuSTcnlD+89tyB4hC4Uo1nrh1sPbei1"
+    "cHHdAunO5xoQIOQlkp9VDBZQ1RwTJXHtGYaGIGZjm9lPDOo56agM1kHBFuwtxwVob+AvhX"
+    "YGlL3xeEgHrVvW/zS3YDCjvw3C/N4XMnq460mTX9v/oMWkkWqj8BxkYW45sowsa2fMQ/1w"
+    "zCOY66puABtazyWxZtJzjFMwLidDmPQc4yTGc2e9CxvHyDnCbIR3YOIYOUc4ibBiwpddmD"
+    "hOzzFOwXgHNo7Tc4wjGJtIQUgvycRJYo4uC91y7Jsk5uhG0H1Bc4C+IvrMYshGCQ+IalHv"
+    "wsFgpU6KxXPIuqYFcyg/v0BTAYkao2MwLXHfO5GcjjFGM4P8cedjQF4KYpnF0r5r59ZYG+"
+    "K2r7o5NH4EDBWUbh/hrja+qyfmrCGvSV4OebD3xWlfvJJaPyJAR3GlVXpHj5dADJ/ct6KD"
+    "o0MJ/GGObcyI5dGDtrxssRxmkQYnmZ4y0pRaMfNN09dcZC1RcBsLxkLw39sSXqBKnWyCbQ"
+    "hzJKxMg64TSBHmawFigT5EoE9514rBvlNnj/gRu6+ILAGaSLCW5K/XTNMEi5QrjobMTQ/W"
+    "iQCDHwIRGhal858/RwvD3DyMPl21HzHEiuBNpUV+CwbhZYHIE3MdDFZQMa1QLUExMHonDL"
+    "1e7SW03SFhwxZMwtQvZFzo20qlozQEg3oQH/FmXIJM3mulys+EEPkDclYuWDu4HQu5G/O6"
+    "GX3u/5m9jK5R70KQgK9POIyNX4QoBiMZfDXrTNVA6vAb0BB+sqkU6bzPQO2jOOnfipNfO+"
+    "//EVts/JqOWxVdtrdSkbFu/2c6Hr3m+Wat2g+YvOUXRZXtE0FTLfuvfS3hlawcLCzpm0dW"
+    "8ADDX+/EP+Pw9ofjnouCYdlPptuL20EvhrUrzoDxQnAowrYxslKM63PlAcGNMu7FWQ7GvT"
+    "hLZVxaxQLTk9cWgAw154rAYas6ykI1Sh+DVvE7eBf8p5ZAZwA7G9xJ05l4dx9h5StxJtGa"
+    "jlu6jpX+ehGbhE0nwh+D2a1AfwqfxyMpzvGbdrPPLTomqgMAbLwAqIRfOygOiqImmoOL7c"
+    "BtCarZfTvAd1HBypgwECIIJuG7JmqT+oR/R+ucKn+gnE683uqHYl6lf8sfORT+Vyyr6o2D"
+    "sWPLhjtvqeZB0CSXgWCEGr9qIsyIGrtQMdSI8muROXHVexxWmsOKvECQTFoGJftgKMxfAs"
+    "4NmWl/cS16v1p0bYIemiF2wytVOR/tcZyze9MvKnQfyiaib11CkYtSVqDCHYM7yTsoY6yt"
+    "fRnSEJ3OF3dcpeMqHVfptvBmqHM++q+rcoE2lMPTSz2hGqLKVaB+BQrXyevuVs8NasNnJK"
+    "yg6ftKWS7gPT2F+06577SpvlMics1yOkuUkussNdNZiEmrWstSMxsj5R7FI3sU6WqqFVgn"
+    "Nu0Pp3y+P/ZSsUXL3dYEKWEDqZjFqN4kcrKhr6gqqoC5t9tdAD8m7ZtE0fePFObABN2bRA"
+    "+ZpmEWxi5G9WaQKxBlFROQrI+75xNe/z5BGnTfJwlmWuhP/ZS7NGM8wm/+dkNFaIR2OhqE"
+    "xz59Cn3SQ9aZy0j9SZZXQSYt93fG8ktLJnYj6Q6ZvmfGsbxYhSc6YL6Ns2eDPo5+Xps+Tr"
+    "cvs36/oSUfcpj1H1Kt+g9xo16B5jOgn1DBrZ0IHd/ciSrHjmUbOlB1IucKhZklCI8VaNb6"
+    "4nbdkEAzH7aVSYAz1xRPo1DEWRp9I0PPsmRrgPVlqny4jMsH2TFNRLe/KU8mQZ2hb2lWXp"
+    "ywIWhmeYOkP2fZzLtxBg3Ho5ugeZyj2QDbCOrlUY5Sc6iZUNtIXxH1vNhGQIjmcApDazlv"
+    "7yCAoxLhtJNDJJx2UmUCrYr5LZbGCzAhfi6oNETo+IGyJKaWQywVaAPT0LTCwTbMDjjKEZ"
+    "SX6tNSI/9sYK2QrEINULiKQp3RC8c7DW+PMwvpw2xqrhTnUYodCwH9FECT4RzNZO4oIT+g"
+    "GoXVdfEw9QcJO3oiOCmCbEB7XPWsdSONpreDUVe4QdhaqlgY6Cso2494OhMnE3Ew7Aq3Bn"
+    "6GaleY2tAUJlDVHvHtePS7OAiqfBrh1FQe8efPn7vCZ4Q1eojxs4ER+WEaj3g2nnWFGYKm"
+    "RWNoZkukq+4HfHwFhjrsmN6jnvqU6oILETUsVO+3Tuf09LLz/vTiw/nZ5eX5h/cbn1yyKs"
+    "uA7A1u6CcRwfnVgL7AO7pjRN9D4GStHcp5Q/lCDFSnWD4ivDT6raFbsnoa5rrF8r3H25xk"
+    "+t+D1stQ64p98I4HpIWgZQQRkpvnerzDPfF79sQ7hUXofsXnfuA7gPSMGIJhjs4bEBCmad"
+    "jiVFk8AE5Vzdig4VqoYyWdOtWfMI4Jz5I6brKXI2+ztab3g4k4BGLv03RKNNqVakJNgPO1"
+    "ZT3iu3G/K9whnaxRVEUlgzdI6f3DRALXg/5sMCZa8r1j0lN/Mu3vEYv3fTC9Fa/Gf3QFcW"
+    "XIUFuTJ8k0JlwxXh7x4O4GzG4lcSZNuoKqPwGyYkG656hBk4Ay1wz5GdiqrSGib98OPj2A"
+    "K+maKOQSGdpSXTsCeR2ilpNacToVH4ZEg/7+/TtRFqCirQG0LPquRBsXJ1eAzORwKI1uCO"
+    "2SagEb7AnxaHwnDj91BYgNHVJKc64SZgpiE46vgtNFhbV4YGiu07YcPYq4Sbq2vc2y2n2x"
+    "WUuBb8VvLFKCVG8wEief2A7uHsPq732aSSIrRhsEobaFY7Q3lM2M0f6ZInkRVkrNY5iOz+"
+    "KxZ1GD5EUL6CRB+0bqJOc51ojz1CXiPL5C/JeqtOxlIt1lHCGqwFNcq1WjMkdxgWDQvXoe"
+    "3MCLgbttzXI6hKpPMv0NbsPN9vehwv0cU+M+hr1fsPCWrLr2+zyn9kirVCnq1sWc3SbjRF"
+    "B6SInfvCH4HTxchwefVhd8yrdhTvg2DN+G8YC9uiPSA2OksVShbWWmIqTocqjZUW6WKvo5"
+    "N/AyqYNsCGTsunCpuW+peSQJoFqyYSqSPkfRb4pVny0HvJZo07I2ooCbPK9/4EV9HhW6O+"
+    "rl7ttLYFx988HsV3evPiFMYRAbjV/FB2t4MsrSG/1cAdq7AsTNxuJmI+PrrgC4Ha+jqQ9+"
+    "hS+kOZjefQ1N3b3JmRn6GKrN1LkXpB3etuPXOjdZBUeYvhlrick6OhGi4ueAIvKQVOhFL1"
+    "0J0/AzP3vZyuW3p1W1WO20AN1AeQkzou8j9ZmL0BNtuceo+xfVWvqgBKeZQpwzp75nkwff"
+    "H2SJCk1FfisoRMStoKwofBOaqr0uwJlbgoYBW5lZXiZakUcqdmsSqehrW0Vk8ZbirbJ8eM"
+    "HLD1yM6o2DV4jnIjSlgDtCiFfV55wcvQBifuvDMVm7VkgBSyX2CtCgVSRJbJLwTeJ3tGQH"
+    "1Uk3nu2gRl7B5CzW0ObK2AupsVe/KX6Sgzn1XZ/J1M0ZlOZRmQYZhV7xp2wyD1XtTYmiF1"
+    "MLeTLh6pY0fifkHrQDTV24tjlYOcxsdanwJQnfKoTw6xM4pydv0zC81gyYxoRJ2hiMC0pc"
+    "TyAzULoaP/SGknA/kfqD6cDfJdm4StzK6G7TRBKHDFzPdsD1jOOaiuvpDrieHg/X9+92uI"
+    "Bjz7C+qBiYzMS0GXiGiTiDcov1Z7JYuV91V6P1OEZX2KxlWF0xqzfd7FqShiFje0+544IP"
+    "3g1x5JYWTxbXvG1qyrpFT8iHaZoZil/9gsP1hp9Cb5AN41ll3bmTcYPGlqQpH0NW2ME+ch"
+    "4QefGVdQggXcRsKZqC6d7T3aGvqowKJo2IEDUkIUcMyIs8QMbjXkJAXqQAuViVANIjaiSQ"
+    "7dMcQLZP0/PCnMaBNNGTnwyyzKK3pT72sjf+KE2mkjjtCjR3Z5+sgBLNpimXynOZ57tP/+"
+    "wTXz1W5efCCYxCNI1k1eqF58qZa6rMsB6yDmNsifhZjAiauqobQFexqjs6WBlqoeuT2cRv"
+    "5hblaAZbVVsDeYnkZ5UhR1+5PjNGy3k0utFAQ1VNpCDEiHXLRDZGyXFNfvsuRDSjQUFok8"
+    "Qc3RR05w7j7EBOcH1afvNSGriKCV9KoxsQc3hj0RzQsoMFqVTiaWYHFZzrqFdOyaYd63Bn"
+    "xeV+L4VN2YlNdsGntjZTS1aMHWc23AOf2NpMLF2sdpzZSBd8auswtZ51Un5eY/R8Uo88qf"
+    "4l7AVV0hAV10XjrmnK4EghaCms3bz0nCFJSp45JM7yrKSInn2kaUDWoErxKyOcUjvhEurI"
+    "EopnzDvhGfPqlzEvPUgxlImL5jBmrAE9n+769wnSNvfasaGMJ05uDqSxMHFryVoOi0ARTy"
+    "XUUCjcRHs7QjEybGRtM/s1CIlCIbwx0ICFbJs8NQO8IOXX6xD6wbwuiNNQv3VdzLOZimZw"
+    "BK9xVn5wookjmwNJwZhvTxl3XyIR8L2pO8mK9qZ3ti2CVjxTffX60M9xOVcOCVw1fPu/nI"
+    "vn+q/arK3JUZghggoy5wbpiCUZw9WZwlGLNaz4KExwWGpzFoZIN34UZs9ik32uLV/gZcrp"
+    "toOHXYr924H0UbqTRrOuQIwKFX1FOsI20ObB/eb9W2lKKmVitISLyfcMricDaXQ1vR3cdw"
+    "UqZBemirBiLdVVqKF7ZTu4urvpeve1A0V/ClX716x7DYJr1sNNWiWEPD9awo+WMKfxK9Sc"
+    "Yge0NxT8dHZNjwA21/0YTVWLGZF8GYlqMSt2r+6gVnp7DD8yubtARN/Iw4CKF0YR+yVKda"
+    "QL2lt//6j53lxNjJiwi5RhxMQ8qOlGDKYN93U5ytaICVIGcAPmKAYMQa60/XLo5YeoJ1Oq"
+    "0LYfMVVU7kD/YTKRRv1PBCOihvbA/fgPaULk5iO+GQDpz3vpqiucEZ12Ogl+nT/ie6KtXr"
+    "gtrogSTGgvvRb+rw+0c/IYcDWY9scP1FL67RFL/dsxGF+DP8QJdSq5baTJR+kKbB/bJuPq"
+    "iTNi3pBu2h1XYQ56bZMxTfsTcda/BX1xQkbSJgP7OLiSxmA6G08kUkDHNhRH4gRcD6bTB7"
+    "fswlXX7wYjkfy49Lrs0VHRPulQB1cP5Plk9qek4LecarfHaaedy4sNk9EfWfw1vROHw+TC"
+    "zO/c6VYf0e3t+ZQONYuS8ziOOoQPujH2O4bo8ymty5RS31iZuQzT8Uk88iR6qi0xa2xkfo"
+    "Vaci6nOtS09HTzSfKGWedVrP+eYCqLYZL6DUJITX5vyU5JVJ6NIYP8cCCe1wJBPyp7FxRT"
+    "umjSGfkqkLSXRMAuDY2h0GfjFyFs1h0vVeDmLwZsnSDXOpKiFrwd7F4QelYg4wR2LvhC1G"
+    "8PwaXhmBaYo4VhFma/OO3bQ4/fJvAGrlo5Vjh9fe9ambinrvrkR4uxSxCqPcnaJPDObslB"
+    "u9f2CFr0+hbHjROAAqXV3RqBdiBoCJoYKcLCNHTB61iAtk3bWCeCtYSkTJivBSLOBB9X61"
+    "3c47mfJzB3MIJAD/ft+fbFnrcveEjOTxGSE4iKvLv4QXu+g+/ndXXFW9kPYUt9ODxpTJUn"
+    "x2Jfw0dxOLjqCm71I5b+vB9M6BYd+rZSiRx+xIOR30LFfhsahfgwlaZe/KFjoVJM3c6T37"
+    "Sdnt+0nchvqhnyM1KAl0G30NnnJCU/+5wWXxEJCFpRP7kCIEPbzPbBRymbeYc1UbugMsba"
+    "urU5EdUEt7yvcYS88puzSzWIm9mchWOow+FzcunKcPiU3nHORNXjzPiBVM2DhGymK6QaJE"
+    "MsoMkE7RuZH7id7xhVximq5CEq8xnoTG3wlSysIToePRI9tqACmcpBatEWYc043QGVw+W8"
+    "vYPasW9te2mZ5RBNEHJIfUi/f/9eDtIE4UEh7dQYUhtB3YOmrFBN6YHnuGJFOwJlXTQLc5"
+    "SQr1rxVass38ZJOcMm16+y2CZoObjJlawsuAlaDu6OB2hey+UV5IDJuQNZNpPXvm3fvBuP"
+    "xfJ47eQ4caFiOE0CCNMdJsFM1SeBTJafhLtIirpIqKYOimZLiRAdzRv+r4WDZXfneO6omq"
+    "1i6x197L8b5CN3Tw64wbVQDrJeFT55EKPnUetHjlpXVEtXLUslWBbaaIrTHW+b6Rf9FEDT"
+    "/uVE+IWqmPRz7/xS972nAqpJaK+b1r2eui9P3sM+aVcgWV+NIqJikdqWbehA1YkmsSsibl"
+    "cD2lODAeGZUuPRgzuC0djIwbIJQqtMDdrMdKAFzRURmaq8bDEMFr/mJMtkgds2tTFaePjg"
+    "66YIDa9JvTqXjV6IpJnRZ53z8xxbDaRV+uW4tC4WLr8qtGvjN28mgHvJHkqeaDNvHklX3k"
+    "MkPIdoBSp69WFEP/4PuVWr0A=="
+)
@@ -0,0 +1,113 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_dmchannel_user_id_424922" ON "dmchannel" ("user_id");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_dmchannel_user_id_424922";"""
+
+
+MODELS_STATE = (
+    "eJztXetv2zgS/1cEf9k9IFc0zqtrHA6QbSXxbWIHttPdtlkQtETHukiUT4+m7qL/+5F62H"
+    "pQsiTLttTwQ4Oa5FDUj6PhzHA4/LulGwrSrHeiLBsOtoeGrc4nyLZV/Gy1OsLfLQx1RP6T"
+    "2e5EaMHlctOKFthwprmE0KPAlMIKU8ws24SyTdrMoWYhUqQgSzbVpa0amJRiR9NooSGTho"
+    "RqU+Rg9X8OArbxjOwFMknFl79IsYoV9A1Zwc/lC5irSFMir+GPBqgKHYNbD+zV0q0bYPva"
+    "JaBPnQHZ0BwdJ4mWK3th4DWVim1a+owwMqGNlND70OH6MARF3tBJgW06aD1mZVOgoDl0ND"
+    "v0/jlBkQ1MASXD8SbumT7ln+3T86vzD2eX5x9IE3ck65KrH957bkDwCF0ohtPWD7ce2tBr"
+    "4eK6AdKdzxUgQMgLJL+oGMyhqjkmSuLaNQwNQczGNrOfGNQz0lEZrIOCDdgbjgvQXsNfCu"
+    "0MKLuj0R0dtG5Z/9PcgsGU/jYI83tfyPDxviuNfz39By0mjVQbhecgC3PLkWVkWTtjHuqH"
+    "Yx7BXFd1A9jQeimJNZOeY5yCcTkZwqTnGCcxnjmrXdg4Rs4RZiO8AxPHyDnCSYQVE77uws"
+    "Rxeo5xCsY7sHGcnmMcwdhECkJ6SSZOEnN0WeiWY98kMUc3gu4rmgH0FdFnFkM2SnhAVIt6"
+    "Fw4GK3VSzF9C1jUtmEH55RWaCkjUGG2DaYn73onkdIwwmhrkjzsfA/JSEMsslvZdO7fGyh"
+    "A3fdXNofEjYKigdPMId7XxXT0xZw15TfJyyIO9J056Yl9q/YgAHcWVVultPV4CMXx234oO"
+    "jg4l8Ic5tjEllkcX2vKixXKYRRqcZHrKSFNqxczWTbe5yFqi4DYWjLngv7clvEKVOtkE2x"
+    "BmSFiaBl0nkCLMVgLEAn2IQJ/yrhWDfafOnvATdl8RWQI0kWAtyF+vmaYJFilXHA2Z6x6s"
+    "EwEGPwQiNCxK5z9/huaGuX4YfbpqP2GIFcGbSov8FgzCywKRJ+YqGKygYlqhWoJiYPROuP"
+    "N6tRfQdoeEDVswCVO/knGhb0uVjtIQDOpBfMLrcQkyea+lKr8QQuQPyFm6YO3gdizkbszr"
+    "ZvS5/2f2MrpGvQtBAr4e4TA2fhGiGIxk8NWsM1UDqcNvQEP42aZSpP0+A7WP4rh3K45/bb"
+    "//R2yx8WvablV02d5IRca6/Z/JaLjN881atR8xecsviirbJ4KmWvZf+1rCK1k5WFjSN4+s"
+    "4AGGv96Lf8bh7d2Nui4KhmU/m24vbgfdGNauOAPGK8GhCNvGyEoxrs+VBwQ3yriX5zkY9/"
+    "I8lXFpFQtMT15bADLUnD6Bw1Z1lIVqlD4GreJ38C74Ty2BzgB2OriXJlPx/iHCyn1xKtGa"
+    "tlu6ipX+ehmbhHUnwh+D6a1AfwqfR0MpzvHrdtPPLTomqgMAbLwCqIRfOygOiqImmoOL7c"
+    "BtCKrZfTvAd1HBypgwECIIJuG7JmqT+ox/R6ucKn+gnI693uqHYl6lf8MfORT+LZZV9cbB"
+    "yLFlw523VPMgaJLLQDBCjbeaCFOixs5VDDWi/FpkTlz1HoeV5rAiLxAkk5ZByT4YCvOXgH"
+    "NDZtpfXIverxZdm6CHZojd8EpVzkd7HOfs3vSLCt2HsonoW5dQ5KKUFahwx+BO8g7KCGsr"
+    "X4Y0RKfzxR1X6bhKx1W6DbwZ6pyP/nZVLtCGcnh6qSdUQ1S5CtSvQOE62e5u9dygNnxBwh"
+    "Kavq+U5QLe01O475T7TpvqOyUi1yyns0Qpuc5SM52FmLSqtSg1szFS7lE8skeRrqZagXVi"
+    "3f5wyuf7Yy8VG7TcbU2QEjaQilmM6k0iJxv6kqqiCph5u90F8GPSvkkUff9IYQ5M0L1J9J"
+    "BpGmZh7GJUbwa5AlFWMQHJ+ri7PuH172OkQfd9kmCmhf7UT7lLM8Yj/OZvN1SERmino0F4"
+    "7NOn0CM9ZJ25jNSfZHkVZNJyf2csv7RkYjeS7pDpe2Ycy4tVeKYD5ts4ezbo4+jntenjdP"
+    "sy6/cbWvIhh1n/IdWq/xA36hVovgD6CRXc2onQ8c2dqHLsWLahA1Uncq5QmFmC8FiBZq0v"
+    "btcNCTTzYVuaBDhzRfE0CkWcpdE3MvQsS7YGWF+lyoeruHyQHdNEdPub8mQS1Cn6lmblxQ"
+    "kbgmaWN0j6c5rNvGtn0N1oeBM0j3M0G2AbQb08ylFqDjUTahvpS6KeF9sICNEcTmFoLWan"
+    "OwjgqEQ4a+cQCWftVJlAq2J+i4XxCkyIXwoqDRE6fqAsianlEEsF2sA0NK1wsA2zA45yBO"
+    "WF+rzQyD8bWEskq1ADFK6iUGf0wvFOw9vjzEL6MJuaK8V5lGLHQkA/A9BkOEczmTtKyA+o"
+    "RmF1XTxM/UHCjp4IToogG9AeVz1r3UjDye1g2BFuELYWKhYG+hLK9hOeTMXxWBzcdYRbA7"
+    "9AtSNMbGgKY6hqT/h2NPxdHARVPo1wZipP+PPnzx3hM8IaPcT42cCI/DCNJzwdTTvCFEHT"
+    "ojE00wXSVfcDPr4CQx12TO9RV31OdcGFiBoWqvdbu312dtV+f3b54eL86uriw/u1Ty5ZlW"
+    "VAdgc39JOI4Lw1oC/wju4Y0fcYOFlrh3LeUL4QA9Uplo8IL41+a+iWrJ6GuWqxfO/xNieZ"
+    "/veg9SLUumIfvOMBaSFoGUGE5Pq5Hu9wT/yePfFOYRG6X/G5H/gOID0jhmCYo/MGBIRpGr"
+    "Y4VRYPgFNVMzZouBbqWEmnTvUnjGPCs6SOm+zlyNtsrcnDYCzeAbH7aTIhGu1SNaEmwNnK"
+    "sp7w/ajXEe6RTtYoqqKSwRuk9OFxLIHrQW86GBEt+cEx6ak/mfb3hMWHHpjciv3RHx1BXB"
+    "oy1FbkSTKNCVeM1yc8uL8B01tJnErjjqDqz4CsWJDuOWrQJKDMNEN+AbZqa4jo27eDT4+g"
+    "L10ThVwiQ1uoK0cgr0PUclIrTibi4x3RoL9//06UBahoKwAti74r0cbFcR+Qmby7k4Y3hH"
+    "ZBtYA19oR4OLoX7z51BIgNHVJKc6YSZgpiE46vgtNFhbV4YGiu0rYcPYq4Sbqyvc2y2n2x"
+    "WUuBb8WvLVKCVHcwFMef2A7uLsPq736aSiIrRhsEobaFY7TXlM2M0f6ZInkRVkrNY5iOz+"
+    "KxZ1GD5EUL6CRB+0bqJBc51oiL1CXiIr5C/JeqtOxlIt1lHCGqwFNcq1WjMkdxgWDQvXoe"
+    "3MCLgbttzXI6hKpPMv0NbsP19vehwv0cU+M+hr1fsPCWrLrT93lO7ZFWqVLUrYs5u03Gia"
+    "D0kBK/eUPwO3i4Dg8+rS74lG/DnPBtGL4N4wHbvyfSA2OksVShTWWmIqTocqjZUW6WKvo5"
+    "N/AyqYNsCGTsutRUajYW7JpYQ33Vkg1TkfQZin5SrPpsMeC1ROuWtZEE3OLZ/n0XdXlU6O"
+    "2ol7dvL3Fx9U0Hs1/Vvfp8MIVBbDR+FZ+r4bkoS+/z11X/4Vbjm7YaGV93BcDteBtNffAr"
+    "fB/NwfTua2jq7kXOzMjHUG2mzj0n7fCmHb/VuckqOML0zVhLTNbJiRAVPwYUkYekQi9650"
+    "qYhh/52ctOLr88rarFaqcF6AbKC5gRfB+pz1yEnmnLPQbdv6rWwgclOMwU4pwZdT2bPPb+"
+    "IEtUaCryW0EhIm4FZQXhm9BU7VUBztwQNAzYyszyMsGKPFCxU5NARV/bKiKLNxRvleXDC1"
+    "5+4GJUbxy8QjwXoSkF3BEivKo+5uToBRDzWx+OyU5rhRSwVGKvAA1aRXLEJgnfJH5Hy3VQ"
+    "nXTjyQ5q5BU8VMjIvm4mqrFXvyl+koM59V2fycRNGZTmUZkECYW2+FPWiYeq9qZE0YuphT"
+    "yXcHVLGr8Scg/agabOXdscLB1msrpU+JKEbxVC+PUZXNCDt2kYXmsGTGPCJG0MxjklrieQ"
+    "GSj1R4/dO0l4GEu9wWTg75KsXSVuZXS3aSyJdwxcz3fA9Zzjmorr2Q64nh0P1/fvdrh/Y8"
+    "+wvqoYmMy8tBl4hok4g3KL9WeyWLlfdVej9ThGV9isZVhdMas33exakIYhY3tPqeOCD94N"
+    "ceSWFs8V17xtasq6RQ/Ih2maGYpf/YLD9YafQm+QDeNFZV25k3GBxoakKR9DVtjBPlIeEH"
+    "nxlXUIIF3EbCiagunes92hr6qMCuaMiBA1JB9HDMjLPEDG415CQF6mADlflgDSI2okkKdn"
+    "OYA8PUtPC3MWB9JEz34uyDKL3ob62Mve6KM0nkjipCPQ1J09sgJKNJmmXCrNZZ7vPv2zT3"
+    "z1WJVfCucvCtE0klWrF55LZ6apMsN6yDqMsSHiZzEiaOqqbgBdxaru6GBpqIVuT2YTv5lL"
+    "lKMJbFVtBeQFkl9UhhzdcntmjJbzaHSjgYaqmkhBiBHrlolsjJLjmvz2XYhoRoOC0CaJOb"
+    "op6M4cxtmBnOD6tPzipTRwFRO+lkY3IObwxqI5oGUHC1KpvNPMDio411GvlJJNO9bhzorL"
+    "/V4Km7ITm+yCT21tppasGDvObLgHPrG1mVi6WO04s5Eu+NTWYWo966T8vMbo+aQeeVL9O9"
+    "gLqqQhKq6Lxl3TlMGRQtBSWLt56TlDkpQ8c0ic5VlJET37SNOArEGV4ldGOKV2wiXUkSUU"
+    "z5h3wjPm1S9jXnqQYigTF81hzFgDuj7d9e9jpK2vtWNDGU+c3BxIY2Hi1oK1HBaBIp5KqK"
+    "FQuIn2doRiaNjI2mT2axAShUJ4Y6ABC9k2eWoGeEHKr+0Q+sG8LoiTUL91XcyzmYpmcATb"
+    "OCs/ONHEkc2BpGDMt6eMuy+RCPhe151kRXvTK9vmQSueqb56fejnuJsrhwSuGr79383Fc/"
+    "1XbdbW5CjMHYIKMmcG6YglGcPVmcJRizWs+ChMcFhqfRaGSDd+FGbPYpN9ri1f4GXK6baD"
+    "h12KvduB9FG6l4bTjkCMChV9RTrCNtBmwfXmvVtpQiplYrSEi8n3DK7HA2nYn9wOHjoCFb"
+    "JzU0VYsRbqMtTQvbEd9O9vOt517UDRn0PV/i3rXoPglvVwk1YJIc+PlvCjJcxp/Ao1p9gB"
+    "7TUFP51d0yOAzXU/RlPVYkYkX0aiWsyK3as7qJXeHsOPTO4uENE38jCg4rlRxH6JUh3pfv"
+    "bW3z9qvjdXEyMm7CJlGDExD2q6EYNpw31djrIxYoKUAdyAOYoBQ5Arbb8cevkh6smEKrSn"
+    "T5gqKveg9zgeS8PeJ4IRUUO74GH0hzQmcvMJ3wyA9OeD1O8I50SnnYyDXxdP+IFoq5duiz"
+    "5RggntldfC//WBdk4eA/qDSW/0SC2l356w1LsdgdE1+EMcU6eS20Yaf5T6YPPYUzKurjgl"
+    "5g3p5rTtKsxBr6dkTJPeWJz2bkFPHJORnJKBfRz0pRGYTEdjiRTQsd2JQ3EMrgeTyaNbdu"
+    "mq6/eDoUh+XHlddumoaJ90qIP+I3k+mf0JKfgtp9rtcdpZ++pyzWT0RxZ/Te7Fu7vkwszv"
+    "3OlUH9Ht7fmUDjWLkvM4jjqED7ox9juG6PMprcuUUt9YmbkM0/FJPPIkeqotMWtsZH6FWn"
+    "IuJzrUtPR080nyhlnnVaz/nmAqi2GS+g1CSE1+b8lOSVSejSGD/HAgXtQCQT8qexcUU7po"
+    "0hn5KpC0F0TALgyNodBn4xchbNYdL1Xg5i8GbJ0g1zqSoha8HexeEXpRIOMEdi74QtRvD8"
+    "GF4ZgWmKG5YRZmvzjt20OP3ybwBq5aOVY4fX3vWhm7p6565EeLsUsQqj3J2iTwzm7JQbtt"
+    "ewQten2L48YJQIHS6m6NQDsQNARNjBRhbhq64HUsQNumbawTwVpAUibMVgIRZ4KPq/Uu7v"
+    "HczxOYOxhBoIf79nz7Ys/bFzwk56cIyQlERd5d/KA938H387q64q3sh7ChPhyeNKbKk2Ox"
+    "r+GjeDfodwS3+glLfz4MxnSLDn1bqkQOP+HB0G+hYr8NjUJ8nEgTL/7QsVAppj7Nk9/0ND"
+    "2/6Wkiv6lmyC9IAV4G3UJnn5OU/OxzWnxFJCBoSf3kCoAMbTPbBx+lbOYd1kTtgsoIa6vW"
+    "+kRUE9zyvsYR8sqvzy7VIG5mfRaOoQ6Hz8mlK8PhU3rHORNVjzPjB1I1DxKyma6QapAMsY"
+    "AmE7RvZH7g03zHqDJOUSUPUZkvQGdqg1uysIboePRI9NiCCmQqB6lFW4Q143QHVA4Xs9Md"
+    "1I59a9sLyyyHaIKQQ+pD+v3793KQJggPCmm7xpDaCOoeNGWFakoPPMcVK9oRKKuiWZijhH"
+    "zViq9aZfk2TsoZNrl+lcU2QcvBTa5kZcFN0HJwdzxAsy2XV5ADJucOZNlMXvu2ffNuPBbL"
+    "47WT48SFiuE0CSBMd5gEM1WfBDJZfhLuIinqIqGaOiiaLSVCdDRv+L/mDpbdneOZo2q2iq"
+    "139LH/bpCP3D054AbXQjnIelX45EGMnketHzlqXVEtXbUslWBZaKMpTne8baZf9DMATfuX"
+    "E+EXqmLSz739S933ngqoJqG9blq3PXVfnryHPdKuQLK+GkVExSK1LdvQgaoTTWJXRNyuBr"
+    "SnBgPCM6XGowd3BKOxkYNlE4RWmRq0melAC5orIjJVedFiGCx+zUmWyQI3bWpjtPDwwe2m"
+    "CA2vSb06l41eiKSZ0Wfti4scWw2kVfrluLQuFi6/LLRr4zdvJoB7yR5Knmgzbx5JV95DJD"
+    "yHaAUqevVhRD/+Dzsrq4U="
+)
@@ -0,0 +1,115 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "leaderboard" DROP COLUMN "rank";
+        CREATE INDEX IF NOT EXISTS "idx_leaderboard_type_3829e8" ON "leaderboard" ("type", "game", "value");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_leaderboard_type_3829e8";
+        ALTER TABLE "leaderboard" ADD "rank" INT NOT NULL DEFAULT 0;"""
+
+
+MODELS_STATE = (
+    "eJztXetv2zgS/1cEf9k9IFc0zqtrHA6QbSXxbWIHttPdtlkQtETHukiUT4+m7qL/+5F62H"
+    "pQsiTLttTwQ4Oa5FDUj6PhzHA4/LulGwrSrHeiLBsOtoeGrc4nyLZV/Gy1OsLfLQx1RP6T"
+    "2e5EaMHlctOKFthwprmE0KPAlMIKU8ws24SyTdrMoWYhUqQgSzbVpa0amJRiR9NooSGTho"
+    "RqU+Rg9X8OArbxjOwFMknFl79IsYoV9A1Zwc/lC5irSFMir+GPBqgKHYNbD+zV0q0bYPva"
+    "JaBPnQHZ0BwdJ4mWK3th4DWVim1a+owwMqGNlND70OH6MARF3tBJgW06aD1mZVOgoDl0ND"
+    "v0/jlBkQ1MASXD8SbumT7ln+3T86vzD2eX5x9IE3ck65KrH957bkDwCF0ohtPWD7ce2tBr"
+    "4eK6AdKdzxUgQMgLJL+oGMyhqjkmSuLaNQwNQczGNrOfGNQz0lEZrIOCDdgbjgvQXsNfCu"
+    "0MKLuj0R0dtG5Z/9PcgsGU/jYI83tfyPDxviuNfz39By0mjVQbhecgC3PLkWVkWTtjHuqH"
+    "Yx7BXFd1A9jQeimJNZOeY5yCcTkZwqTnGCcxnjmrXdg4Rs4RZiO8AxPHyDnCSYQVE77uws"
+    "Rxeo5xCsY7sHGcnmMcwdhECkJ6SSZOEnN0WeiWY98kMUc3gu4rmgH0FdFnFkM2SnhAVIt6"
+    "Fw4GK3VSzF9C1jUtmEH55RWaCkjUGG2DaYn73onkdIwwmhrkjzsfA/JSEMsslvZdO7fGyh"
+    "A3fdXNofEjYKigdPMId7XxXT0xZw15TfJyyIO9J056Yl9q/YgAHcWVVultPV4CMXx234oO"
+    "jg4l8Ic5tjEllkcX2vKixXKYRRqcZHrKSFNqxczWTbe5yFqi4DYWjLngv7clvEKVOtkE2x"
+    "BmSFiaBl0nkCLMVgLEAn2IQJ/yrhWDfafOnvATdl8RWQI0kWAtyF+vmaYJFilXHA2Z6x6s"
+    "EwEGPwQiNCxK5z9/huaGuX4YfbpqP2GIFcGbSov8FgzCywKRJ+YqGKygYlqhWoJiYPROuP"
+    "N6tRfQdoeEDVswCVO/knGhb0uVjtIQDOpBfMLrcQkyea+lKr8QQuQPyFm6YO3gdizkbszr"
+    "ZvS5/2f2MrpGvQtBAr4e4TA2fhGiGIxk8NWsM1UDqcNvQEP42aZSpP0+A7WP4rh3K45/bb"
+    "//R2yx8WvablV02d5IRca6/Z/JaLjN881atR8xecsviirbJ4KmWvZf+1rCK1k5WFjSN4+s"
+    "4AGGv96Lf8bh7d2Nui4KhmU/m24vbgfdGNauOAPGK8GhCNvGyEoxrs+VBwQ3yriX5zkY9/"
+    "I8lXFpFQtMT15bADLUnD6Bw1Z1lIVqlD4GreJ38C74Ty2BzgB2OriXJlPx/iHCyn1xKtGa"
+    "tlu6ipX+ehmbhHUnwh+D6a1AfwqfR0MpzvHrdtPPLTomqgMAbLwCqIRfOygOiqImmoOL7c"
+    "BtCKrZfTvAd1HBypgwECIIJuG7JmqT+ox/R6ucKn+gnI693uqHYl6lf8MfORT+LZZV9cbB"
+    "yLFlw523VPMgaJLLQDBCjbeaCFOixs5VDDWi/FpkTlz1HoeV5rAiLxAkk5ZByT4YCvOXgH"
+    "NDZtpfXIverxZdm6CHZojd8EpVzkd7HOfs3vSLCt2HsonoW5dQ5KKUFahwx+BO8g7KCGsr"
+    "X4Y0RKfzxR1X6bhKx1W6DbwZ6pyP/nZVLtCGcnh6qSdUQ1S5CtSvQOE62e5u9dygNnxBwh"
+    "Kavq+U5QLe01O475T7TpvqOyUi1yyns0Qpuc5SM52FmLSqtSg1szFS7lE8skeRrqZagXVi"
+    "3f5wyuf7Yy8VG7TcbU2QEjaQilmM6k0iJxv6kqqiCph5u90F8GPSvkkUff9IYQ5M0L1J9J"
+    "BpGmZh7GJUbwa5AlFWMQHJ+ri7PuH172OkQfd9kmCmhf7UT7lLM8Yj/OZvN1SERmino0F4"
+    "7NOn0CM9ZJ25jNSfZHkVZNJyf2csv7RkYjeS7pDpe2Ycy4tVeKYD5ts4ezbo4+jntenjdP"
+    "sy6/cbWvIhh1n/IdWq/xA36hVovgD6CRXc2onQ8c2dqHLsWLahA1Uncq5QmFmC8FiBZq0v"
+    "btcNCTTzYVuaBDhzRfE0CkWcpdE3MvQsS7YGWF+lyoeruHyQHdNEdPub8mQS1Cn6lmblxQ"
+    "kbgmaWN0j6c5rNvGtn0N1oeBM0j3M0G2AbQb08ylFqDjUTahvpS6KeF9sICNEcTmFoLWan"
+    "OwjgqEQ4a+cQCWftVJlAq2J+i4XxCkyIXwoqDRE6fqAsianlEEsF2sA0NK1wsA2zA45yBO"
+    "WF+rzQyD8bWEskq1ADFK6iUGf0wvFOw9vjzEL6MJuaK8V5lGLHQkA/A9BkOEczmTtKyA+o"
+    "RmF1XTxM/UHCjp4IToogG9AeVz1r3UjDye1g2BFuELYWKhYG+hLK9hOeTMXxWBzcdYRbA7"
+    "9AtSNMbGgKY6hqT/h2NPxdHARVPo1wZipP+PPnzx3hM8IaPcT42cCI/DCNJzwdTTvCFEHT"
+    "ojE00wXSVfcDPr4CQx12TO9RV31OdcGFiBoWqvdbu312dtV+f3b54eL86uriw/u1Ty5ZlW"
+    "VAdgc39JOI4Lw1oC/wju4Y0fcYOFlrh3LeUL4QA9Uplo8IL41+a+iWrJ6GuWqxfO/xNieZ"
+    "/veg9SLUumIfvOMBaSFoGUGE5Pq5Hu9wT/yePfFOYRG6X/G5H/gOID0jhmCYo/MGBIRpGr"
+    "Y4VRYPgFNVMzZouBbqWEmnTvUnjGPCs6SOm+zlyNtsrcnDYCzeAbH7aTIhGu1SNaEmwNnK"
+    "sp7w/ajXEe6RTtYoqqKSwRuk9OFxLIHrQW86GBEt+cEx6ak/mfb3hMWHHpjciv3RHx1BXB"
+    "oy1FbkSTKNCVeM1yc8uL8B01tJnErjjqDqz4CsWJDuOWrQJKDMNEN+AbZqa4jo27eDT4+g"
+    "L10ThVwiQ1uoK0cgr0PUclIrTibi4x3RoL9//06UBahoKwAti74r0cbFcR+Qmby7k4Y3hH"
+    "ZBtYA19oR4OLoX7z51BIgNHVJKc6YSZgpiE46vgtNFhbV4YGiu0rYcPYq4Sbqyvc2y2n2x"
+    "WUuBb8WvLVKCVHcwFMef2A7uLsPq736aSiIrRhsEobaFY7TXlM2M0f6ZInkRVkrNY5iOz+"
+    "KxZ1GD5EUL6CRB+0bqJBc51oiL1CXiIr5C/JeqtOxlIt1lHCGqwFNcq1WjMkdxgWDQvXoe"
+    "3MCLgbttzXI6hKpPMv0NbsP19vehwv0cU+M+hr1fsPCWrLrT93lO7ZFWqVLUrYs5u03Gia"
+    "D0kBK/eUPwO3i4Dg8+rS74lG/DnPBtGL4N4wHbvyfSA2OksVShTWWmIqTocqjZUW6WKvo5"
+    "N/AyqYNsCGTsutRUajYW7JpYQ33Vkg1TkfQZin5SrPpsMeC1ROuWtZEE3OLZ/n0XdXlU6O"
+    "2ol7dvL3Fx9U0Hs1/Vvfp8MIVBbDR+FZ+r4bkoS+/z11X/4Vbjm7YaGV93BcDteBtNffAr"
+    "fB/NwfTua2jq7kXOzMjHUG2mzj0n7fCmHb/VuckqOML0zVhLTNbJiRAVPwYUkYekQi9650"
+    "qYhh/52ctOLr88rarFaqcF6AbKC5gRfB+pz1yEnmnLPQbdv6rWwgclOMwU4pwZdT2bPPb+"
+    "IEtUaCryW0EhIm4FZQXhm9BU7VUBztwQNAzYyszyMsGKPFCxU5NARV/bKiKLNxRvleXDC1"
+    "5+4GJUbxy8QjwXoSkF3BEivKo+5uToBRDzWx+OyU5rhRSwVGKvAA1aRXLEJgnfJH5Hy3VQ"
+    "nXTjyQ5q5BU8VMjIvm4mqrFXvyl+koM59V2fycRNGZTmUZkECYW2+FPWiYeq9qZE0YuphT"
+    "yXcHVLGr8Scg/agabOXdscLB1msrpU+JKEbxVC+PUZXNCDt2kYXmsGTGPCJG0MxjklrieQ"
+    "GSj1R4/dO0l4GEu9wWTg75KsXSVuZXS3aSyJdwxcz3fA9Zzjmorr2Q64nh0P1/fvdrh/Y8"
+    "+wvqoYmMy8tBl4hok4g3KL9WeyWLlfdVej9ThGV9isZVhdMas33exakIYhY3tPqeOCD94N"
+    "ceSWFs8V17xtasq6RQ/Ih2maGYpf/YLD9YafQm+QDeNFZV25k3GBxoakKR9DVtjBPlIeEH"
+    "nxlXUIIF3EbCiagunes92hr6qMCuaMiBA1JB9HDMjLPEDG415CQF6mADlflgDSI2okkKdn"
+    "OYA8PUtPC3MWB9JEz34uyDKL3ob62Mve6KM0nkjipCPQ1J09sgJKNJmmXCrNZZ7vPv2zT3"
+    "z1WJVfCucvCtE0klWrF55LZ6apMsN6yDqMsSHiZzEiaOqqbgBdxaru6GBpqIVuT2YTv5lL"
+    "lKMJbFVtBeQFkl9UhhzdcntmjJbzaHSjgYaqmkhBiBHrlolsjJLjmvz2XYhoRoOC0CaJOb"
+    "op6M4cxtmBnOD6tPzipTRwFRO+lkY3IObwxqI5oGUHC1KpvNPMDio411GvlJJNO9bhzorL"
+    "/V4Km7ITm+yCT21tppasGDvObLgHPrG1mVi6WO04s5Eu+NTWYWo966T8vMbo+aQeeVL9O9"
+    "gLqqQhKq6Lxl3TlMGRQtBSWLt56TlDkpQ8c0ic5VlJET37SNOArEGV4ldGOKV2wiXUkSUU"
+    "z5h3wjPm1S9jXnqQYigTF81hzFgDuj7d9e9jpK2vtWNDGU+c3BxIY2Hi1oK1HBaBIp5KqK"
+    "FQuIn2doRiaNjI2mT2axAShUJ4Y6ABC9k2eWoGeEHKr+0Q+sG8LoiTUL91XcyzmYpmcATb"
+    "OCs/ONHEkc2BpGDMt6eMuy+RCPhe151kRXvTK9vmQSueqb56fejnuJsrhwSuGr79383Fc/"
+    "1XbdbW5CjMHYIKMmcG6YglGcPVmcJRizWs+ChMcFhqfRaGSLf4UZhkq69Qc/zkBFyeVihP"
+    "2Qfe8kVkphx7O3g8pti7HUgfpXtpOO0IxNpQ0VekI2wDbRbce967lSakUibWTLiYfOjgej"
+    "yQhv3J7eChI1DpOzdVhBVroS5DDd2r3EH//qbj3eMOFP05VO1fv+41CK5fDzdplZD+/MwJ"
+    "P3PCnEZPFibmMePk9pqCH9uu6dnA5vol+eHA6r9w9I08DKh4bhTR1KNUR7qJvPX3j5rvQt"
+    "VEXQ87AxnqesxXmK6uY9pwX9eAbBTx4HA8P7V+FI2cIFdaIT/0IkXW2wnV0E6fMF1570Hv"
+    "cTyWhr1PBCOiV3XBw+gPaUzk5hO+GQDpzwep3xHOiZI2GQe/Lp7wA1G/Lt0WfaLVEdorr4"
+    "X/6wPtnDwG9AeT3uiRqv6/PWGpdzsCo2vwhzim7hO3jTT+KPXB5rGnZFxdcUr0ddLNadvV"
+    "AINeT8mYJr2xOO3dgp44JiM5JQP7OOhLIzCZjsYSKaBjuxOH4hhcDyaTR7fs0tU/7wdDkf"
+    "y48rrs0lHRPulQB/1H8nwy+xNS8FtOPdLjtLP21eWayeiPLP6a3It3d8mFmd8u06k+dtnb"
+    "3SgdVBUl5xELdQiUc6PJdwxG51Nalymlzp4ycxmm45N45En0VFti1tjI/Aq15FxOdKhp6Y"
+    "nVk+QNs+GrWP89wVQWwyT1G4SQmvzekp2SkjsbQwb54UC8qAWCfvzxLiimdNGk0+BVIGkv"
+    "iIBdGBpDoc/GL0LYrNtMqsDNXwzYOkGudSRFLXg72L0i9KJAxlnjXPCFqN8eggvDMS0wQ3"
+    "PDLMx+cdq3hx7Pm/8GLhU5VuB4fW8VGbvni3rkR4uxSxCqPcnaJPBOKclBu217BC16UYnj"
+    "bnxDgdLqbo1AOxA0BE2MFGFuGrrgdSxA26ZtrBPBWkBSJsxWAhFngo+r9S7u8dzPE5g7GE"
+    "Hkgvv2fPtiz9sXPMbkp4gxCURF3l38oD3fwfczmLrireyHsKE+HJ40SMiTY7Gv4aN4N+h3"
+    "BLf6CUt/PgzGdIsOfVuqRA4/4cHQb6Fivw0Nq3ucSBMvoM6xUCmmPs2TyfM0PZPnaSKTp2"
+    "bIL0gBXq7YQqd8k5T8lG9afEUkIGhJ/eQKgAxtM9sHH6Vs5m3NRO2Cyghrq9b67E8T3PK+"
+    "xhHyyq9P6dQgbmZ96ouhDodPhKUrw+HzaMc5/VOP09EHUjUPEoOYrpBqkAyxgCYTtG9kJt"
+    "zTfAeGMs4LJY8LmS9AZ2qDW/KNhuh49Eg0Dl8FMpWD1KItwppxugMqh4vZ6Q5qx7617YVl"
+    "lkM0Qcgh9SH9/v17OUgThAeFtF1jSG0EdQ+askI1pQeezYkV7QiUVdF8w1FCvmrFV62yfB"
+    "sn5QybXL/KYpug5eAmV7Ky4CZoObg7HqDZlrUqyHaScweybM6qfdu+eTcei2Ws2slx4kLF"
+    "cJoEEKY7TIKZqk+qlCw/CXeRFHWRUE0dFM0LEiE6mjf8X3MHy+7O8cxRNVvF1jv62H83yE"
+    "funhxwg2uhHOR3KnzyIEbPo9aPHLWuqJauWpZKsCy00RSnO9420y/6GYCm/cuJ8AtVMenn"
+    "3v6l7ntPBVST0F43rduepC5Phr8eaVcgLV2NIqJikdqWbehA1YkmsSsiblcD2lODAeE5Qe"
+    "PRgzuC0djIwbKpMKtMgtnMxJcFzRURmaq8aDEMFr/mJMtkgZs2tTFaePjgdlOEhtekXhLL"
+    "Ri9E0szos/bFRY6tBtIq/RpYWhcLl18W2rXxmzcTwL3kySRPtJl3bKQr7yESni2zAhW9+j"
+    "CiH/8HFGFUeA=="
+)
@@ -0,0 +1,113 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_gachahistor_account_b0ec07" ON "gachahistory" ("account_id", "banner_type", "rarity", "wish_id");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_gachahistor_account_b0ec07";"""
+
+
+MODELS_STATE = (
+    "eJztXWtv2zgW/SuCv8wskC0a59UxFgvItpJ4J7ED2+lM2wwIWqJjbSTKq0dTd9D/vqQeth"
+    "6ULMmyLTX80KAWeSnp8Io89/Ly8u+WbihIs96Jsmw42B4atjqfINtW8bPV6gh/tzDUEflP"
+    "Zr0ToQWXy00tesGGM80VhJ4EphJWWGJm2SaUbVJnDjULkUsKsmRTXdqqgclV7GgavWjIpC"
+    "KR2lxysPo/BwHbeEb2Apmk4Mtf5LKKFfQNWcHP5QuYq0hTIq/hPw1QFfoMbjmwV0u3bIDt"
+    "a1eA3nUGZENzdJwUWq7shYHXUiq26dVnhJEJbaSE3oc+rg9DcMl7dHLBNh20fmZlc0FBc+"
+    "hoduj9c4IiG5gCSh7H67hnepd/tk/Pr84/nF2efyBV3CdZX7n64b3nBgRP0IViOG39cMuh"
+    "Db0aLq4bIN3+XAEChLxA8ouKwRyqmmOiJK5dw9AQxGxsM9uJQT0jDZXBOriwAXujcQHaa/"
+    "hLoZ0BZXc0uqMPrVvW/zT3wmBKfxtE+b0vZPh435XGv57+g14mlVQbhfsgC3PLkWVkWTtj"
+    "HmqHYx7BXFd1A9jQeimJNVOeY5yCcbkxhCnPMU5iPHNWu6hxTJwjzEZ4ByWOiXOEkwgrJn"
+    "zdRYnj8hzjFIx3UOO4PMc4grGJFIT0kkqcFObostAtp75JYY5uBN1XNAPoK6L3LIZsVPCA"
+    "qBb1LhwMVuqkmL+ErGt6YQbll1doKiBRYrQNpiXueyeS3THCaGqQP25/DMhLQSyzVNp37d"
+    "waK0PctFU3h8aPQKGCq5tbuLON7+qJOWvIa5KXQx7sPXHSE/tS60cE6CiutEhv6/ErEMNn"
+    "963ow9FHCfxhjm1MieXRhba8aLEcZpEKJ5meMlKVWjGzddVtLrKWKLiVBWMu+O9tCa9QpU"
+    "42wTaEGRKWpkHnCaQIs5UAsUBvItC7vGvFYN+psSf8hN1XRJYATSRYC/LXq6ZpgkWuK46G"
+    "zHUL1okAgx8CGTQsKufff4bmhrm+Gb27aj9hiBXB60qL/BYMossCGU/MVfCwgoppgWoJio"
+    "HRO+HOa9VeQNt9JGzYgkmU+pU8F/q2VOlTGoJBPYhPeP1cgkzea6nKL0QQ+Q/kLF2wdnA7"
+    "FnI35nUz+tr/M3sZXaPehSABX49oGBu/iFAMRvLw1cwzVQOpw29AQ/jZpqNI+30Gah/Fce"
+    "9WHP/afv+P2GTjl7Tdoui0vRkVGfP2fyaj4TbPN2vWfsTkLb8oqmyfCJpq2X/tawqvZOZg"
+    "YUnfPDKDBxj+ei/+GYe3dzfquigYlv1suq24DXRjWLvDGTBeCQ5F1DYmVkpxfa08ILhRxb"
+    "08z6G4l+epikuLWGB647UFIIPm9AkctqqjLFSj8jFoFb+Bd8F/agl0BrDTwb00mYr3DxFV"
+    "7otTiZa03aur2NVfL2OdsG5E+GMwvRXoT+HzaCjFNX5db/q5RZ+JcgCAjVcAlfBrB5eDS1"
+    "ETzcHFVuA2AtWsvh3gu6hgZkwYCBEEk/BdE9qkPuPf0Son5Q/I6dhrrX4o5iX9G/3IQfi3"
+    "WFbVGwcjx5YNt99SzYOgSi4DwQhV3moiTAmNnasYaoT8WqRPXHqPw6Q5TOQFgmTSMijZBo"
+    "Mwfwk0N2Sm/cVZ9H5ZdG2CHpox7IZnqnI+2uM4Z/fGLyp0H8omom9dgshFJSugcMfQTvIO"
+    "yghrK38MaQin84c7Tuk4peOUbgNvBp3z0d9O5QI2lMPTSz2hGqLkKqBfAeE62e5u9dygNn"
+    "xBwhKavq+U5QLe012475T7TpvqOyVDrlmOs0QlOWepGWchJq1qLUr1bEyUexSP7FGks6lW"
+    "YJ5Y1z8c+Xx/7Klig5a7rAlSwgZSMYtJvUnkZENfUiqqgJm32l0AP6bsm0TR948U1sCE3J"
+    "tED5mmYRbGLib1ZpArEGUVGyBZH3fXF7z+fYw06L5PEsy00J/6kbs0Yzyib/5yQ0VohFY6"
+    "GoTHPn0KPdJC1p7LSPlJlldBJjX3t8fyS0smdiNpDpm+Z8axvFiFZ/rAfBlnzwZ9HP28Nn"
+    "1cbl9m/X5DSz7kMOs/pFr1H+JGvQLNF0A/oYJLOxE5vrgTJceOZRs6UHUyzhUKM0sIHivQ"
+    "rPXFbbohgWY+bEuTAGeuKJ5GoYizNPlGhp5lja0B1lep48NVfHyQHdNEdPmb6mQS1Cn6lm"
+    "blxQUbgmaWN0j6c5qtvGtn0N1oeBNUj2s0G2AbQb08ylFpDjUTahvpS0LPiy0EhGQORxha"
+    "i9npDgNwdEQ4a+cYEs7aqWMCLYr5LRbGKzAhfilIGiJyfENZElPLIZYKtIFpaFrhYBtmAx"
+    "zlCMoL9XmhkX82sJZIVqEGKFxFoc5oheOdhrenmYX4MFuak+I8pNixENDPADQZztFM5Y4K"
+    "8g2qUVhdFw+TP0jY0RPBSRFkA9nj0rPWjTSc3A6GHeEGYWuhYmGgL6FsP+HJVByPxcFdR7"
+    "g18AtUO8LEhqYwhqr2hG9Hw9/FQVDkywhnpvKEP3/+3BE+I6zRTYyfDYzID9N4wtPRtCNM"
+    "ETQtGkMzXSBddT/g4xMY6rBjeo+66nOqCy4k1LBQvd/a7bOzq/b7s8sPF+dXVxcf3q99cs"
+    "miLAOyO7ihn0QE560BfYF3dMeIvsfAyVo7lPOG8oUUqE6xfGTw0ui3hm7J7GmYqxbL9x6v"
+    "c5Lpfw9qL0K1K/bBOx6QFoKWEURIru/r6Q73xO/ZE+8UHkL3O3zuB74DjJ4RQzCs0XkDAs"
+    "IyDZucKosHwKnUjA0argUdK+nUqX6HcWzwLMlxk60ceZmtNXkYjMU7IHY/TSaE0S5VE2oC"
+    "nK0s6wnfj3od4R7pZI6iFJU8vEGuPjyOJXA96E0HI8KSHxyT7vqTaXtPWHzogcmt2B/90R"
+    "HEpSFDbUXuJNOYcMV4fcKD+xswvZXEqTTuCKr+DMiMBemaowZNAspMM+QXYKu2hgjfvh18"
+    "egR96ZoQcok82kJdOQJ5HULLSak4mYiPd4RBf//+nZAFqGgrAC2Lvith4+K4D0hP3t1Jwx"
+    "siu6AsYI09ER6O7sW7Tx0BYkOHVNKcqUSZgtiE41NwOqmwJg8MzVXakqMnETdJV7a3WFa7"
+    "LzZrKvCt+LVFSpDqDobi+BPbwd1lWP3dT1NJZMVogyDUtnCM9lqymTHaP1MkL8JKqX4My/"
+    "FePHYvapC8aAFOEtRvJCe5yDFHXKROERfxGeK/lNKyp4l0l3FEqAJPca1mjcocxQWCQffq"
+    "eXADLwbusjXL6RAqPsn0N7gV18vfhwr3c0yN+xj2fsDCW7LqTt/n2bVHaqWOom5ZzNltMn"
+    "YEpYeU+NUbgt/Bw3V48Gl1wad8GeaEL8PwZRgP2P49GT0wRhqLCm0KM4mQosuhakc5Waro"
+    "59zAw6QOsiCQsepS01GzsWDXxBrqq5ZsmIqkz1D0k2KVZw8DXk20rlmbkYBbPNu/76Iujw"
+    "q9HfXy9u0lLq6+6WD2S92rzwdTGMRG41fxvhqei7L0On9d+Q+3Gt+01cj4uisAbsfTaOqD"
+    "X+HzaA7Gu6+hqbsHOTMjH0OlmZx7TurhTT1+qnOTKTjC9M1YU0zWzomQFN8GFBkPSYFe9M"
+    "yVsAzf8rOXlVx+eFpVk9VOE9ANlBcwI/g+Up45CT3TmnsMun9VrYUPSrCZKaQ5M+p6Ntmx"
+    "91/SKrrQm6rtPm/Q/l/cqVTxjBbqufxGU0iIG01ZMfsbDc6pmRuBhgFbmRVfJraRxzV2ah"
+    "LX6JOzImPxRuKtqnxs2ssJXEzqjYNXSOciMqWAO0JAWNW7ohy9AGJ+7cMp2WmtkAKWSswb"
+    "oEGrSErZpOCbxO9oqRGqG914boQaOREPFWGyr4OMarwI0BS3ysHWAFwXy8TNMJTmgJkE+Y"
+    "e2uF/WeYqqdr5E0YvRQp56uLopjZ8guQd2oKlz1zYHS4eZ2y4VvqTgW4UQfn0GF3SfbhqG"
+    "15oB05QwKRuDcU6F6wlkBkr90WP3ThIexlJvMBn4iyprV4lbGF2cGkviHQPX8x1wPee4pu"
+    "J6tgOuZ8fD9f27HY7r2DOsryoGJjONbQaeYSGuoNxi/ZksVu5X3dVoPY7RFTZrGVZXzOpN"
+    "N7sWpGLI2N5Tprngg3cjIrmlxVPLNW+Zmqpu0f30YZlmRu5XP+Fw3vBT8AbZMF5U1gk9Ge"
+    "dtbESa8jFkhR3sI0MCGS++svYMpA8xG4mmYLr35HjoqyqjgikmIkINSd8RA/IyD5DxuJcQ"
+    "kJcpQM6XJYD0hBoJ5OlZDiBPz9KzyJzFgTTRs586ssykt5E+9rQ3+iiNJ5I46Qg002ePzI"
+    "ASzb0pl8qKmee7T//sE189VuWXwumOQjKNVNXqB8+lM9NUmWE9ZO3d2AjxrRsRNHVVN4Cu"
+    "YlV3dLA01EKHLbOF38yZy9F8t6q2AvICyS8qYxzdcthmTJbraHShgYaqmkhBiBHrlolsTJ"
+    "Ljmvz2XYhoAoSC0CaFObop6M4cxt6BnOD6svycpjRwFRO+lkY3EObwxqI5oGUHE1KpNNXM"
+    "BirY11GvDJRN29bh9oqr/V7Gm7Idm2yCd21tupbMGDv2bLgF3rG16Vg6We3Ys5EmeNfWoW"
+    "s966R8v8bkeaceuVP9I9sLUtKQFOeicdc0VXCkELQU1mpeeoqRpCRPNBJXeVYORc8+0jQg"
+    "a1Cl+JUZnFIb4SPUkUconmDvhCfYq1+CvfQgxVDiLprymDEHdH2569/HSFufgseGMp5nuT"
+    "mQxsLErQVrOiwCRTzzUEOhcPPy7QjF0LCRtUkE2CAkCoXwxkADFrJtctcM8IIMYdsh9IN5"
+    "XRAnoXbrOplnKxVN+Ai2aVZ+cKJ5JpsDScGYb4+Muy+RCPhel51kRXvTE97mQS2e2L56Pv"
+    "RzHOWVYwSuGr79H+XFjwao2qytyVaYOwQVZM4M0hBrZAwXZw6OWqxixVthgs1S670wQa7G"
+    "SKbHeK2vUHMQz+lY+XjK3vCWLyIzZdvbweMxxd7tQPoo3UvDaUcg1oaKviIdYRtos+CY9N"
+    "6tNCGFMrFmwpfJhw6uxwNp2J/cDh46Ah1956aKsGIt1GWoonvyO+jf33S8Y9+Boj+Hiv3T"
+    "2r0KwWnt4SqtEqM/33PC95wwu9EbCxP9mLFzey3Bt23XdG9gc/2SfHNg9V84+kZuBlQ8N4"
+    "ow9ajUkQ4ub/39o+arUDWh62FnIIOux3yF6XQd04r7OjVkQ8SDzfF81/pRGDlBrjQhP/Qk"
+    "RebbCWVop0+Yzrz3oPc4HkvD3ieCEeFVXfAw+kMak3HzCd8MgPTng9TvCOeEpE3Gwa+LJ/"
+    "xA6NelW6NPWB2RvfJq+L8+0MbJbUB/MOmNHin1/+0JS73bERhdgz/EMXWfuHWk8UepDza3"
+    "PSXP1RWnhK+TZk7bLgMMWj0lzzTpjcVp7xb0xDF5klPyYB8HfWkEJtPRWCIX6LPdiUNxDK"
+    "4Hk8mje+3S5Z/3g6FIflx5TXbpU9E26aMO+o/k/qT3J+TCbzl5pKdpZ+2ry7WS0R9Z+jW5"
+    "F+/ukhMzP4ymU33ssre6UTqoKirOIxbqECjnRpPvGIzOu7QuXUqdPWX6MizHO/HInehRW2"
+    "LW2Mj8CrVkX050qGnpidWT4g2z4auY/72BqSyGSek3CCE1+b0pOyUldzaGDPHDgXhRCwT9"
+    "+ONdUExpokm7watA0l6QAXZhaAxCn41fRLBZp5lUgZs/GbA5Qa55JIUWvB3sXhF6USBjr3"
+    "Eu+ELSbw/BheGYFpihuWEWVr+47NtDj+fNfwOHihwrcLy+p4qM3f1FPfKjxVglCJWeZC0S"
+    "eLuU5KDetjWCFj2oxHEXvqFAZXW3RKANCBqCJkaKMDcNXfAaFqBt0zrWiWAtILkmzFYCGc"
+    "4EH1frXdzjuZ87MFcwgsgF9+358sWely94jMlPEWMSDBV5V/GD+nwF389g6g5vZT+EjfTh"
+    "8KRBQt44FvsaPop3g35HcIufsPTnw2BMl+jQt6VKxuEnPBj6NVTs16FhdY8TaeIF1DkWKq"
+    "XUp3kyeZ6mZ/I8TWTy1Az5BSnAyxVbaJdvUpLv8k2Lr4gEBC2pn1wBkME2s33wUclmntZM"
+    "aBdURlhbtdZ7f5rglvcZR8grv96lU4O4mfWuLwYdDu8ISyfD4f1ox9n9U4/d0QeimgeJQU"
+    "wnpBokj1iAyQT1G5kJ9zTfhqGM/ULJ7ULmC9CZbHBLvtGQHI8eicbhq0Cm4yC1aIuoZlzu"
+    "gORwMTvdgXbsm20vLLMcoglBDqkP6ffv38tBmhA8KKTtGkNqI6h70JQdVFNa4NmcWNGOQF"
+    "kVzTccFeSzVnzWKqu3cVGusMn5qyy2CVkObnImKwtuQpaDu+MGmm1Zq4JsJzlXIMvmrNq3"
+    "7Zt34bFYxqqdHCcuVAynSQBhusMk6Kn6pErJ8pNwF0lRFwll6qBoXpCI0NG84f+aO1h2V4"
+    "5njqrZKrbe0dv+u0E+cnfngBtcC+Ugv1PhnQcxeR61fuSodUW1dNWyVIJloYWmuNzxlpl+"
+    "0c8ANO1fToRfKMWkn3v7l7qvPRWgJqG1blq2PUldngx/PVKvQFq6GkVExSK1LdvQgaoTJr"
+    "ErIm5TA9pSgwHhOUHj0YM7gtHYyMGyqTCrTILZzMSXBc0VEZmqvGgxDBa/5CTLZIGbOrUx"
+    "Wnj44HZThIbXpB4Sy0YvJNLM6LP2xUWOpQZSK/0YWFoWC5dfFlq18as3E8C95Mkkd7SZZ2"
+    "ykk/eQCM+WWQFFrz6M6Mf/ARfUZCo="
+)
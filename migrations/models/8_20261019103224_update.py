@@ -0,0 +1,116 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "autotaskrun" ADD "games" JSONB;
+        ALTER TABLE "autotaskrun" ADD "region" VARCHAR(16);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "autotaskrun" DROP COLUMN "games";
+        ALTER TABLE "autotaskrun" DROP COLUMN "region";"""
+
+
+MODELS_STATE = (
+    "eJztXWtv2zgW/SuCv8wskC3qPDvGYgHZVhLvOHZgO51pmwFBS3SsjUR59WjqDvrfl9TD1o"
+    "NSJFm2pYYf+rDIS0mHV+S5l5eXf7d0Q0Ga9U6UZcPB9siw1cUU2baKn6xWR/i7haGOyH8y"
+    "650ILbhabWvRCzaca64g9CQwlbDCEnPLNqFskzoLqFmIXFKQJZvqylYNTK5iR9PoRUMmFY"
+    "nU9pKD1f85CNjGE7KXyCQFX/4il1WsoG/ICn6unsFCRZoSeQ3/aYCq0Gdwy4G9XrllA2xf"
+    "uwL0rnMgG5qj46TQam0vDbyRUrFNrz4hjExoIyX0PvRxfRiCS96jkwu26aDNMyvbCwpaQE"
+    "ezQ++fExTZwBRQ8jhexz3Ru/zztH1+df7h7PL8A6niPsnmytUP7z23IHiCLhSjWeuHWw5t"
+    "6NVwcd0C6fbnGhAg5CWSn1UMFlDVHBMlce0ahoYgZmOb2U4M6jlpqAzWwYUt2FuNC9DewF"
+    "8K7Qwou+PxkD60bln/09wLgxn9bRDl976Q0cNdV5r82v4HvUwqqTYK90EW5pYjy8iydsY8"
+    "1A7HPIK5ruoGsKH1XBJrpjzHOAXjcmMIU55jnMR47qx3UeOYOEeYjfAOShwT5wgnEVZM+L"
+    "KLEsflOcYpGO+gxnF5jnEEYxMpCOkllTgpzNFloVtOfZPCHN0Iui9oDtBXRO9ZDNmo4AFR"
+    "LepdOBis1EmxeA5Z1/TCHMrPL9BUQKLEODWYlrjvnUh2xxijmUH+cvtjQF4KYpml0r5r59"
+    "ZYG+K2rbo5NH4EChVc3d7CnW18V0/MWUNek7wc8mDvidOe2JdaPyJAR3GlRfqpHr8CMXxy"
+    "34o+HH2UwB/m2MaMWB5daMvLFsthFqlwkukpI1WpFTPfVH3NRdYSBbeyYCwE/70t4QWq1M"
+    "km2IYwR8LKNOg8gRRhvhYgFuhNBHqXd60Y7Ds19ogfsfuKyBKgiQRrSf72qmmaYJHriqMh"
+    "c9OCdSLA4IdABg2Lyvn3n6OFYW5uRu+u2o8YYkXwutIivwWD6LJAxhNzHTysoGJaoFqCYm"
+    "D0Thh6rdpLaLuPhA1bMIlSv5DnQt9WKn1KQzCoB/ERb55LkMl7rVT5mQgi/4GclQvWDm7H"
+    "Qu7GvG5GX/t/Zi+ja9S7ECTg6xENY+MXEYrBSB6+mnmmaiB1+A1oCD/ZdBQ5fZ+B2kdx0r"
+    "sVJ7+evv9HbLLxS07doui0vR0VGfP2f6bj0Wueb9as/YDJW35RVNk+ETTVsv/a1xReyczB"
+    "wpK+eWQGDzD89U78Mw5vbzjuuigYlv1kuq24DXRjWLvDGTBeCA5F1DYmVkpxfa08ILhRxb"
+    "08z6G4l+epikuLWGB647UFIIPm9AkctqqjLFSj8jFoFb+Bd8F/agl0BrCzwZ00nYl39xFV"
+    "7osziZaculfXsau/XsY6YdOI8MdgdivQn8Ln8UiKa/ym3uxziz4T5QAAGy8AKuHXDi4Hl6"
+    "ImmoOLrcBtBapZfTvAd1HBzJgwECIIJuG7JrRJfcK/o3VOyh+Q04nXWv1QzEv6t/qRg/C/"
+    "YllVbxyMHVs23H5LNQ+CKrkMBCNU+VUTYUZo7ELFUCPk1yJ94tJ7HCbNYSIvECSTlkHJNh"
+    "iE+UuguSEz7S/OovfLomsT9NCMYTc8U5Xz0R7HObs3flGh+1A2EX3rEkQuKlkBhTuGdpJ3"
+    "UMZYW/tjSEM4nT/ccUrHKR2ndFt4M+icj/7rVC5gQzk8vdQTqiFKrgL6FRCuk9fdrZ4b1I"
+    "bPSFhB0/eVslzAe7oL951y32lTfadP5N9CXtONQAX+0lo5mvbiLjXRE33CAkq6lWikk7R9"
+    "mUND23Eut9VQWhSzUmwy2pZi1VFJzqprxqoXKlatZamejYlyn/eRfd6U72kFmMym/uHMo/"
+    "fHJjNbtNyFd5AS2JKKWUzqTSInG/qKGksKmHvxGAXwY8q+SRR9D15hDUzIvUn0kGkaZmHs"
+    "YlJvBrkCcYCxAZL1cXd9wevfJ0iDNpsopwWn1Y/cpbmLIvrmL4hVhEZoLa5BeOzT69UjLW"
+    "TtCo6Un2T5vWRSc3+7gL+0ZGI0kuaQ6fsOHcuLpqEmOV9o3LfLKY5+XoM+Lrcvx9N+7foP"
+    "Ocz6D6lW/Ye4Ua9A8xnQT6jg4mNEji8/RsmxY9mGDlSdjHOFXHoJwWOFQra+uE03xLfnw7"
+    "YyCXDmmuJpFIqJTJNvpN8va2wNsL5KHR+u4uOD7JgmogEaVCeToM7QtzQrLy7YEDSzvEHS"
+    "n7Ns5d04g4bj0U1QPa7RbIBtBPXyKEelOdRMqG2krwg9L7ZUFZI5HGFoLeftHQbg6Ihwdp"
+    "pjSDg7TR0TaFHMb7E0XoAJ8XNB0hCR41sek5haDrFUoA1MQ9MKh4MxG+AoR1Beqk9Ljfyx"
+    "gbVCsgo1QOEqCnVGKxzvNLw9zSzEh9nSnBTnIcWOhYB+BqDJcI5mKndUkG+hToZpsPmDhB"
+    "09ET6XiNg4Pj1r3Uij6e1g1BFuELaWKhYG+grK9iOezsTJRBwMO8KtgZ+h2hGmNjSFCVS1"
+    "R3w7Hv0uDoIiX0Y4M5VH/Pnz547wGWGNbrP9bGBEfpjGI56NZx1hhqBp0Siv2RLpqvsBH5"
+    "/AUIcd03vUVZ9SXXAhoYYFk/52enp2dnX6/uzyw8X51dXFh/cbn1yyKMuA7A5u6CcRwfnV"
+    "kNPAO7pjzOlD4GStHcp5g01DClSnaFMyeGn0W0O3ZPY0zHWL5XuP1znJ9L8HtZeh2hX74B"
+    "0PSAtBywhieDf39XSHe+L37Il3Cg+h+x0+9wPfAUbPiCEY1ui8AQFhmYZNTpXFA+BUasYG"
+    "DdeCjpV06lS/Bz42eJbkuMlWjrzM1preDybiEIjdT9MpYbQr1YSaAOdry3rEd+NeR7hDOp"
+    "mjKEUlD2+Qq/cPEwlcD3qzwZiw5HvHpPtSZdreIxbve2B6K/bHf3QEcWXIUFuTO8l014Ji"
+    "vDziwd0NmN1K4kyadARVfwJkxoJ0zVGDJgFlrhnyM7BVW0OEb98OPj2AvnRNCLlEHm2prh"
+    "2BvA6h5aRUnE7FhyFh0N+/fydkASraGkDLou9K2Lg46QPSk8OhNLohskvKAjbYE+HR+E4c"
+    "fuoIEBs6pJLmXCXKFMQmHJ+C00mFNXlgaK7Tlhw9ibhJura9xbLafbFZU4FvxW8sUoJUdz"
+    "ASJ5/YDu4uw+rvfppJIitGGwShtoVjtDeSzYzR/pkieRFWSvVjWI734rF7UYPkRQtwkqB+"
+    "IznJRY454iJ1iriIzxD/pZSWPU2ku4wjQnxn1AnbUVwgGHSvngc38GLgLluznA6h4pNMf4"
+    "NbcbP8fahwP8fUuI9h70eAvCWrrv0+z75SUit92977xM5SqqYJANNDSvzqDcHv4OE6PPi0"
+    "uuBTvgxzwpdh+DKMB2z/joweGCONRYW2hZlESNHlULWjnH1W9HNu4HFnB1kQyFh1qemo2V"
+    "iwa2IN9VVLNkxF0uco+kmxyrOHAa8m2tSszUjALZ7Xv++iLo8KvR318vbtJS6uvgmL9kvd"
+    "q89YVBjERuNX8b4ani219Dp/XfkPtxrftNXI+LorAG7H85Lqg1/hE5MOxruvoam7R40zIx"
+    "9DpZmce0Hq4W09fu54kyk4wvTNWFNM1s6JkBTfBhQZD0mBXvRUoLAM3/Kzl5VcfrxfVZPV"
+    "ThPQDZSXMCP4PlKeOQk90Zp7DLp/Ua2lD0qwmSmkOXPqejbZsfdf0iq60Juq7T5v0P5f3K"
+    "lU8YwW6rn8RlNIiBtNWTH7Ww3OqZlbgYYBW5kVXya2kcc1dmoS1+iTsyJj8Vbirap8bNrL"
+    "CVxM6o2DV0jnIjKlgDtCQFjVu6IcvQBifu3DKVm7VkgBSyXmDdCgVSSlbFLwTeJ3tNQI1Y"
+    "1uPDdCjZyIh4ow2ddRWzVeBGiKW+VgawCui2XqZhhKc8BMg/xDr7hfNnmKqna+RNGL0UKe"
+    "eri6KY2fcboHdqCpC9c2ByuHmdsuFb6k4FuFEH59Ahd0n24ahteaAdOUMCkbg3FBhesJZA"
+    "ZK/fFDdygJ9xOpN5gO/EWVjavELYwuTk0kccjA9XwHXM85rqm4nu2A69nxcH3/bofjOvYM"
+    "64uKgclMY5uBZ1iIKyi3WH8mi5X7VXc1Wo9jdIXNWobVFbN6082uJakYMrb3lGku+ODdiE"
+    "huafHUcs1bpqaqW3Q/fVimmZH71U84nDf8FLxBNoxnlXVCT8Z5G1uRpnwMWWEH+8iQQMaL"
+    "r6w9A+lDzFaiKZjuPTke+qrKqGCKiYhQQ9J3xIDMc2b5WfqZ5WeJM8t9TBarEkB6Qo0Esn"
+    "2WA8j2WXoWmbM4kCZ68lNHlpn0ttLHnvbGH6XJVBKnHYFm+uyRGVCiuTflUlkx83z36Z99"
+    "4qvHqvxcON1RSKaRqlr94Lly5poqM6yHrL0bWyG+dSOCpq7qBtBVrOqODlaGWuiwZbbwmz"
+    "lzOZrvVtXWQF4i+VlljKOvHLYZk+U6Gl1ooKGqJlIQYsS6ZSIbk+S4Jr99FyKaAKEgtElh"
+    "jm4KunOHsXcgJ7i+LD+nKQ1cxYQvpdENhDm8sWgOaNnBhFQqTTWzgQr2ddQrA2XTtnW4ve"
+    "Jqv5fxpmzHJpvgXVubriUzxo49G26Bd2xtOpZOVjv2bKQJ3rV16FrPOinfrzF53qlH7lT/"
+    "yPaClDQkxblo3DVNFRwpBC2FtZqXnmIkKckTjcRVnpVD0bOPNA3IGlQpfmUGp9RG+Ah15B"
+    "GKJ9g74Qn26pdgLz1IMZS4i6Y8ZswBXV/u+vcJ0jan4LGhjOdZbg6ksTBxa8maDotAEc88"
+    "1FAo3Lx8O0IxMmxkbRMBNgiJQiG8MdCAhWyb3DUDvCBD2OsQ+sG8LojTULt1ncyzlYomfA"
+    "SvaVZ+cKJ5JpsDScGYb4+Muy+RCPjelJ1kRXvTE94WQS2e2L56PvRzHOWVYwSuGr79H+XF"
+    "jwao2qytyVaYIYIKMucGaYg1MoaLMwdHLVax4q0wwWapzV6YIFdjJNNjvNZXqDmI53SsfD"
+    "xlb3jLF5GZsu3t4PGYYu92IH2U7qTRrCMQa0NFX5GOsA20eXBMeu9WmpJCmVgz4cvkQwfX"
+    "k4E06k9vB/cdgY6+C1NFWLGW6ipU0T35HfTvbjrese9A0Z9Cxf5p7V6F4LT2cJVWidGf7z"
+    "nhe06Y3eiNhYl+zNi5vZHg27ZrujewuX5Jvjmw+i8cfSM3AypeGEWYelTqSAeXt/7+UfNV"
+    "qJrQ9bAzkEHXY77CdLqOacV9nRqyJeLB5ni+a/0ojJwgV5qQH3qSIvPtlDK09iOmM+8d6D"
+    "1MJtKo94lgRHhVF9yP/5AmZNx8xDcDIP15L/U7wjkhadNJ8OviEd8T+nXp1ugTVkdkr7wa"
+    "/q8PtHFyG9AfTHvjB0r9f3vEUu92DMbX4A9xQt0nbh1p8lHqg+1t2+S5uuKM8HXSTPvUZY"
+    "BBq23yTNPeRJz1bkFPnJAnaZMH+zjoS2MwnY0nErlAn20ojsQJuB5Mpw/utUuXf94NRiL5"
+    "ceU12aVPRdukjzroP5D7k96fkgu/5eSRnqadnV5dbpSM/sjSr+mdOBwmJ2Z+GE2n+thlb3"
+    "WjdFBVVJxHLNQhUM6NJt8xGJ13aV26lDp7yvRlWI534pE70aO2xKyxkfkVasm+nOpQ09IT"
+    "qyfFG2bDVzH/ewNTWQyT0m8QQmrye1N2SkrubAwZ4ocD8aIWCPrxx7ugmNJEk3aDV4GkvS"
+    "QD7NLQGIQ+G7+IYLNOM6kCN38yYHOCXPNICi14O9i9IPSsQMZe41zwhaTfHoJLwzEtMEcL"
+    "wyysfnHZt4cez5v/Bg4VOVbgeH1PFZm4+4t65EeLsUoQKj3JWiTwdinJQb3X1gha9KASx1"
+    "34hgKV1d0SgTYgaAiaGCnCwjR0wWtYgLZN61gngrWE5JowXwtkOBN8XK13cY/nfu7AXMEI"
+    "Ihfct+fLF3tevuAxJj9FjEkwVORdxQ/q8xV8P4OpO7yV/RC20ofDkwYJeeNY7Gv4KA4H/Y"
+    "7gFj9i6c/7wYQu0aFvK5WMw494MPJrqNivQ8PqHqbS1AuocyxUSqnbeTJ5ttMzebYTmTw1"
+    "Q35GCvByxRba5ZuU5Lt80+IrIgFBK+onVwBksM1sH3xUspmnNRPaBZUx1tatzd6fJrjlfc"
+    "YR8spvdunUIG5ms+uLQYfDO8LSyXB4P9pxdv/UY3f0gajmQWIQ0wmpBskjFmAyQf1GZsJt"
+    "59swlLFfKLldyHwGOpMNvpJvNCTHo0eicfgqkOk4SC3aIqoZlzsgOVzO2zvQjn2z7aVllk"
+    "M0Icgh9SH9/v17OUgTggeF9LTGkNoI6h40ZQfVlBZ4NidWtCNQ1kXzDUcF+awVn7XK6m1c"
+    "lCtscv4qi21CloObnMnKgpuQ5eDuuIHmtaxVQbaTnCuQZXNW7dv2zbvwWCxj1U6OExcqht"
+    "MkgDDdYRL0VH1SpWT5SbiLpKiLhDJ1UDQvSEToaN7wfy0cLLsrx3NH1WwVW+/obf/dIB+5"
+    "u3PADa6FcpDfqfDOg5g8j1o/ctS6olq6alkqwbLQQlNc7njLTL/oZwCa9i8nwi+UYtLP/f"
+    "SXuq89FaAmobVuWvZ6kro8Gf56pF6BtHQ1ioiKRWpbtqEDVSdMYldE3KYGtKUGA8Jzgsaj"
+    "B3cEo7GRg2VTYVaZBLOZiS8LmisiMlV52WIYLH7JSZbJArd1amO08PDB100RGl6TekgsG7"
+    "2QSDOjz04vLnIsNZBa6cfA0rJYuPyq0KqNX72ZAO4lTya5o808YyOdvIdEeLbMCih69WFE"
+    "P/4P2+Q6XA=="
+)
@@ -4,8 +4,10 @@ import aiohttp
 
 from hoyo_buddy.config import CONFIG
 from hoyo_buddy.db.pgsql import Database
+from hoyo_buddy.hoyo.proxy_pool import proxy_pool
 from hoyo_buddy.l10n import translator
 from hoyo_buddy.scheduler.main import Scheduler
+from hoyo_buddy.scheduler.metrics import start_metrics_server
 from hoyo_buddy.utils import setup_async_event_loop, setup_logging, setup_sentry, wrap_task_factory
 
 
@@ -14,16 +16,19 @@ async def main() -> None:
     setup_logging("logs/scheduler.log")
     setup_async_event_loop()
     setup_sentry(CONFIG.scheduler_sentry_dsn)
+    start_metrics_server()
 
     async with Database(), translator, aiohttp.ClientSession() as session:
         scheduler = Scheduler(session)
         scheduler.start()
+        proxy_pool.start_health_checks()
 
         try:
             while True:  # noqa: ASYNC110
                 await asyncio.sleep(1)
         except (KeyboardInterrupt, asyncio.CancelledError):
             scheduler.shutdown()
+            await proxy_pool.stop_health_checks()
 
 
 if __name__ == "__main__":
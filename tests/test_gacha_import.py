@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import csv
+import datetime
+import io
+import types
+import unittest
+from typing import TYPE_CHECKING, Any
+from unittest import mock
+
+from hoyo_buddy.commands.gacha import GachaCommand, _validate_chunk
+from hoyo_buddy.db import GachaHistory, GachaHistoryRow
+from hoyo_buddy.enums import GachaImportSource
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable
+
+SRS_CSV = """uid,id,rarity,time,type,banner
+1001,23001,5,2024-01-01 12:00:00,11,1
+1002,20000,3,2024-01-01 12:00:01,11,1
+1003,1208,4,2024-01-01 12:00:02,12,2
+"""
+
+
+def read_srs_csv() -> list[dict[str, str]]:
+    return list(csv.DictReader(io.StringIO(SRS_CSV)))
+
+
+class ValidateChunkTest(unittest.TestCase):
+    def test_csv_records(self) -> None:
+        rows = _validate_chunk(GachaImportSource.STAR_RAIL_STATION, read_srs_csv(), None, None)
+
+        self.assertEqual([row.wish_id for row in rows], [1001, 1002, 1003])
+        self.assertEqual(
+            rows[2],
+            GachaHistoryRow(
+                wish_id=1003,
+                rarity=4,
+                time=datetime.datetime(2024, 1, 1, 12, 0, 2),
+                item_id=1208,
+                banner_type=12,
+            ),
+        )
+
+    def test_stardb_records_use_rarity_map(self) -> None:
+        items = [
+            (400, {"id": 1, "item_id": 10000002, "timestamp": "2024-01-01T12:00:00Z"}),
+            (200, {"id": 2, "item_id": 11101, "timestamp": "2024-01-01T12:00:01Z"}),
+        ]
+
+        rows = _validate_chunk(GachaImportSource.STAR_DB, items, None, {10000002: 5, 11101: 3})
+
+        self.assertEqual([row.rarity for row in rows], [5, 3])
+        self.assertEqual([row.banner_type for row in rows], [301, 200])
+
+    def test_validation_errors_are_raised(self) -> None:
+        items = [{"uid": "not an id", "gacha_type": 1}]
+
+        with self.assertRaises(ValueError):
+            _validate_chunk(GachaImportSource.SRGF, items, 8, None)
+
+
+class CopyInChunksTest(unittest.IsolatedAsyncioTestCase):
+    executor_class: type[concurrent.futures.Executor] = concurrent.futures.ThreadPoolExecutor
+
+    async def asyncSetUp(self) -> None:
+        self.executor = self.executor_class(max_workers=1)
+        self.addCleanup(self.executor.shutdown)
+        self.copied: list[GachaHistoryRow] = []
+
+        async def copy_rows(_pool: Any, _account: Any, rows: AsyncIterable[GachaHistoryRow]) -> int:
+            self.copied.extend([row async for row in rows])
+            return len(self.copied)
+
+        patcher = mock.patch.object(GachaHistory, "copy_rows", side_effect=copy_rows)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        client = types.SimpleNamespace(
+            loop=asyncio.get_running_loop(), executor=self.executor, pool=None
+        )
+        self.interaction: Any = types.SimpleNamespace(client=client)
+
+    async def test_records_are_copied_in_chunks(self) -> None:
+        with mock.patch("hoyo_buddy.commands.gacha.GACHA_IMPORT_CHUNK_SIZE", 2):
+            count = await GachaCommand._copy_in_chunks(
+                self.interaction,
+                mock.Mock(),
+                iter(read_srs_csv()),
+                GachaImportSource.STAR_RAIL_STATION,
+            )
+
+        self.assertEqual(count, 3)
+        self.assertEqual([row.wish_id for row in self.copied], [1001, 1002, 1003])
+
+    async def test_validation_errors_are_raised(self) -> None:
+        items = [{"uid": "not an id", "gacha_type": 1}]
+
+        with self.assertRaises(ValueError):
+            await GachaCommand._copy_in_chunks(
+                self.interaction, mock.Mock(), items, GachaImportSource.SRGF, tz_hour=8
+            )
+
+
+class CopyInChunksProcessPoolTest(CopyInChunksTest):
+    """The production executor, chunks and their rows have to be picklable."""
+
+    executor_class = concurrent.futures.ProcessPoolExecutor
+
+    async def test_validation_errors_are_raised(self) -> None:
+        self.skipTest("Covered with a thread pool, pickling validation errors is up to pydantic")
+
+
+if __name__ == "__main__":
+    unittest.main()